@@ -0,0 +1,131 @@
+"""符文 → 英雄倒排索引：回答「符文 X 在哪些英雄上最强」。
+
+每个英雄跑一次推荐打分（与 Suggest 相同的分组/排名），再按符文 ID 汇总为按
+``weighted_sum`` 降序的 (英雄, 分数, 组内排名) 元组；查询为一次字典查找。
+GameData 重载后按条目指纹只重算数据有变化的英雄，并只重排受影响的符文。
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from aram_mayhem_helper.algorithm.suggest import Suggest
+from aram_mayhem_helper.utils.config import SuggestConfig
+from aram_mayhem_helper.utils.data import GameData
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class AugmentChampionScore:
+    """某符文在某英雄上的打分结果。"""
+
+    champion_id: str
+    weighted_sum: float
+    rank: int
+    group_size: int
+
+
+class AugmentChampionIndex:
+    """单个数据源的符文 → 英雄倒排索引（线程安全，懒构建）。
+
+    Args:
+        data: 数据仓储
+        source: 数据源（"opgg"/"aramkit"）
+        thresholds: 推荐参数（tau/steepness 决定分数与排名）
+    """
+
+    def __init__(self, data: GameData, *, source: str, thresholds: SuggestConfig) -> None:
+        self.data = data
+        self.source = source
+        self.thresholds = thresholds
+        self._lock = threading.Lock()
+        self._generation: int | None = None
+        self._fingerprints: dict[str, int] = {}
+        self._scores: dict[str, dict[str, AugmentChampionScore]] = {}  # 英雄 → 符文 → 分数
+        self._by_augment: dict[str, dict[str, AugmentChampionScore]] = {}  # 符文 → 英雄 → 分数
+        self._sorted: dict[str, tuple[AugmentChampionScore, ...]] = {}  # 符文 → 按分数降序
+
+    def _fingerprint(self, entries: list[dict[str, Any]]) -> int:
+        """条目内容指纹（含等级：翻译表重载可能改变分组）。"""
+        return hash(
+            tuple(
+                (
+                    entry.get("id"),
+                    entry.get("performance"),
+                    entry.get("popular"),
+                    (self.data.augment_info(str(entry.get("id"))) or {}).get("level"),
+                )
+                for entry in entries
+            )
+        )
+
+    def _score_champion(self, champion_id: str) -> dict[str, AugmentChampionScore]:
+        suggest = Suggest(champion_id, self.data, source=self.source, thresholds=self.thresholds)
+        return {
+            str(item["id"]): AugmentChampionScore(champion_id, item["weighted_sum"], item["rank"], item["group_size"])
+            for item in suggest.champion_augment_data
+            if item.get("group_size") is not None  # 打分失败的组无排名，不入索引
+        }
+
+    def _replace_champion(self, champion_id: str, scores: dict[str, AugmentChampionScore]) -> set[str]:
+        """替换单个英雄的分数，返回需重排的符文 ID。"""
+        previous = self._scores.pop(champion_id, {})
+        for augment_id in previous:
+            self._by_augment[augment_id].pop(champion_id, None)
+        for augment_id, score in scores.items():
+            self._by_augment.setdefault(augment_id, {})[champion_id] = score
+        if scores:
+            self._scores[champion_id] = scores
+        return set(previous) | set(scores)
+
+    def refresh(self) -> int:
+        """与 GameData 同步：数据未重载时直接返回；否则只重算条目有变化的英雄。
+
+        Returns:
+            本次重算的英雄数
+        """
+        with self._lock:
+            if self._generation == self.data.generation:
+                return 0
+            touched: set[str] = set()
+            rescored = 0
+            champion_ids = set(self.data.champion_ids())
+            # 增量失效时只需比对变化英雄的指纹；全量重载后逐个比对
+            changed = None if self._generation is None else self.data.changed_since(self._generation)
+            candidates = champion_ids if changed is None else champion_ids & changed
+            for champion_id in sorted(candidates, key=int):
+                if self.data.available_source(champion_id, preferred=self.source) != self.source:
+                    entries: list[dict[str, Any]] = []
+                else:
+                    entries = self.data.augment_entries(champion_id, self.source) or []
+                fingerprint = self._fingerprint(entries)
+                if self._fingerprints.get(champion_id) == fingerprint:
+                    continue
+                self._fingerprints[champion_id] = fingerprint
+                touched |= self._replace_champion(champion_id, self._score_champion(champion_id) if entries else {})
+                rescored += 1
+            for champion_id in set(self._fingerprints) - champion_ids:  # 英雄数据已被移除
+                del self._fingerprints[champion_id]
+                touched |= self._replace_champion(champion_id, {})
+            for augment_id in touched:
+                champions = self._by_augment.get(augment_id)
+                if not champions:
+                    self._by_augment.pop(augment_id, None)
+                    self._sorted.pop(augment_id, None)
+                    continue
+                # 同分按英雄 ID 数值升序，保证结果稳定
+                self._sorted[augment_id] = tuple(
+                    sorted(champions.values(), key=lambda s: (-s.weighted_sum, int(s.champion_id)))
+                )
+            self._generation = self.data.generation
+            if rescored:
+                logger.info(f"符文倒排索引（{self.source}）已更新 {rescored} 个英雄，{len(self._sorted)} 个符文")
+            return rescored
+
+    def champions_for(self, augment_id: str, limit: int | None = None) -> tuple[AugmentChampionScore, ...]:
+        """该符文在各英雄上的分数（降序）；未收录的符文返回空元组。"""
+        self.refresh()
+        ranked = self._sorted.get(str(augment_id), ())
+        return ranked if limit is None else ranked[:limit]
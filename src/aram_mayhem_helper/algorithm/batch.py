@@ -0,0 +1,162 @@
+"""批量推荐：一次评估大量 (英雄, 符文组合) 查询（离线分析/回放历史选择）。
+
+每个英雄只打分一次（经 ``SuggestCache``），随后把各英雄的预计算推荐结论铺成
+``[英雄 × 符文]`` 矩阵，所有查询通过 NumPy 花式索引一次性查表。
+"""
+
+import logging
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from aram_mayhem_helper.algorithm.suggest import SuggestCache, SuggestTier
+from aram_mayhem_helper.utils.config import SuggestConfig
+from aram_mayhem_helper.utils.data import GameData
+
+logger = logging.getLogger(__name__)
+
+# 档位编码（矩阵中以 int8 存储，-1 = 该英雄无此符文数据/未能排名）
+TIER_ORDER: tuple[SuggestTier, ...] = tuple(SuggestTier)
+_TIER_CODE = {tier: code for code, tier in enumerate(TIER_ORDER)}
+MISSING = -1
+
+
+@dataclass(frozen=True)
+class BatchSuggestion:
+    """批量推荐结果（按查询对齐的列式数组，``n`` 个查询 × 每查询 ``k`` 个符文）。
+
+    Attributes:
+        champion_ids: (n,) 英雄 ID
+        sources: (n,) 实际使用的数据源，英雄两源均无数据时为 None
+        augment_ids: (n, k) 符文 ID，不足 k 个的查询以 "" 补齐
+        tier_codes: (n, k) int8 档位编码（``TIER_ORDER`` 下标），缺失为 -1
+        ranks: (n, k) int32 组内排名，缺失为 0
+        group_sizes: (n, k) int32 组大小，缺失为 0
+        weighted_sums: (n, k) float64 综合评分，缺失为 NaN
+    """
+
+    champion_ids: np.ndarray[Any, Any]
+    sources: np.ndarray[Any, Any]
+    augment_ids: np.ndarray[Any, Any]
+    tier_codes: np.ndarray[Any, Any]
+    ranks: np.ndarray[Any, Any]
+    group_sizes: np.ndarray[Any, Any]
+    weighted_sums: np.ndarray[Any, Any]
+
+    def __len__(self) -> int:
+        return len(self.champion_ids)
+
+    def best_index(self) -> np.ndarray[Any, Any]:
+        """(n,) 每个查询中综合评分最高的符文下标，全部缺失时为 -1。"""
+        if self.weighted_sums.size == 0:
+            return np.full(len(self), MISSING, dtype=np.int64)
+        filled = np.where(np.isnan(self.weighted_sums), -np.inf, self.weighted_sums)
+        best = np.argmax(filled, axis=1)
+        return np.where(np.isneginf(filled.max(axis=1)), MISSING, best)
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """逐查询产出 JSON 友好的字典（CLI 以 JSONL 流式输出）。"""
+        best = self.best_index()
+        for row in range(len(self)):
+            augments = []
+            for col, augment_id in enumerate(self.augment_ids[row]):
+                if not augment_id:
+                    continue
+                code = int(self.tier_codes[row, col])
+                augments.append(
+                    {
+                        "augment_id": augment_id,
+                        "tier": TIER_ORDER[code].name.lower() if code != MISSING else None,
+                        "rank": int(self.ranks[row, col]) or None,
+                        "group_size": int(self.group_sizes[row, col]) or None,
+                        "weighted_sum": None
+                        if np.isnan(self.weighted_sums[row, col])
+                        else float(self.weighted_sums[row, col]),
+                    }
+                )
+            yield {
+                "champion_id": self.champion_ids[row],
+                "source": self.sources[row],
+                "augments": augments,
+                "best_augment_id": self.augment_ids[row, best[row]] if best[row] != MISSING else None,
+            }
+
+
+def suggest_batch(
+    champion_ids: Sequence[str],
+    augment_ids: Sequence[Sequence[str]],
+    data: GameData,
+    *,
+    thresholds: SuggestConfig,
+    source: str | None = None,
+    cache: SuggestCache | None = None,
+) -> BatchSuggestion:
+    """对 n 个 (英雄, 符文组合) 查询批量给出推荐结论。
+
+    Args:
+        champion_ids: (n,) 英雄 ID
+        augment_ids: (n,) 每个查询的符文 ID 列表（通常为 OCR 三选一，长度可不等）
+        data: 数据仓储
+        thresholds: 推荐阈值
+        source: 首选数据源，None 取配置默认；英雄缺数据时回退另一源（与推荐流程一致）
+        cache: Suggest 实例缓存（跨批次复用打分结果），None 时使用本次调用私有缓存
+
+    Raises:
+        ValueError: 两个输入长度不一致
+    """
+    if len(champion_ids) != len(augment_ids):
+        raise ValueError(f"champion_ids 与 augment_ids 长度不一致: {len(champion_ids)} != {len(augment_ids)}")
+    n = len(champion_ids)
+    k = max((len(row) for row in augment_ids), default=0)
+    if cache is None:
+        cache = SuggestCache(maxsize=max(len(set(champion_ids)), 1))
+
+    query_augments = np.full((n, k), "", dtype=object)
+    for row, ids in enumerate(augment_ids):
+        query_augments[row, : len(ids)] = [str(augment_id) for augment_id in ids]
+
+    # 英雄/符文各自去重编号，查询转换为 (英雄下标, 符文下标) 整数矩阵
+    unique_champions, champion_index = np.unique(np.asarray(champion_ids, dtype=str), return_inverse=True)
+    unique_augments, augment_index = np.unique(query_augments.astype(str), return_inverse=True)
+    augment_index = augment_index.reshape(n, k)
+    augment_position = {augment_id: idx for idx, augment_id in enumerate(unique_augments)}
+
+    shape = (len(unique_champions), len(unique_augments))
+    tier_table = np.full(shape, MISSING, dtype=np.int8)
+    rank_table = np.zeros(shape, dtype=np.int32)
+    size_table = np.zeros(shape, dtype=np.int32)
+    score_table = np.full(shape, np.nan, dtype=np.float64)
+    champion_sources: list[str | None] = []
+
+    for c_idx, champion_id in enumerate(unique_champions):
+        champion_id = str(champion_id)
+        resolved = data.available_source(champion_id, preferred=source)
+        champion_sources.append(resolved)
+        if resolved is None:
+            logger.warning(f"英雄ID {champion_id} 在 opgg/aramkit 数据源中都没有符文数据")
+            continue
+        suggest = cache.get(champion_id, data, source=resolved, thresholds=thresholds)
+        # 每个英雄只需填充本批次出现过的符文列
+        for augment_id, a_idx in augment_position.items():
+            verdict = suggest.get_verdict(augment_id) if augment_id else None
+            if verdict is None:
+                continue
+            info = suggest.get_augment_info_by_id(augment_id) or {}
+            tier_table[c_idx, a_idx] = _TIER_CODE[verdict.tier]
+            rank_table[c_idx, a_idx] = verdict.rank
+            size_table[c_idx, a_idx] = verdict.group_size
+            score_table[c_idx, a_idx] = info.get("weighted_sum", np.nan)
+
+    rows = champion_index[:, None]
+    sources = np.asarray(champion_sources, dtype=object)
+    return BatchSuggestion(
+        champion_ids=unique_champions.astype(object)[champion_index],
+        sources=sources[champion_index],
+        augment_ids=query_augments,
+        tier_codes=tier_table[rows, augment_index],
+        ranks=rank_table[rows, augment_index],
+        group_sizes=size_table[rows, augment_index],
+        weighted_sums=score_table[rows, augment_index],
+    )
@@ -0,0 +1,208 @@
+"""数据集对比：同一数据源的两个数据集（aramkit 全体 all / 高分段 high）下符文排名差异。
+
+两个数据集各自按 Suggest 相同的分组/排名打分，铺成 (英雄, 符文) 列式数组后经
+排序键一次性连接（``np.intersect1d``），排名差与分位差整列计算，无逐行 Python 比较。
+"""
+
+import json
+import logging
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from aram_mayhem_helper.algorithm.scoring import descending_order
+from aram_mayhem_helper.algorithm.suggest import SuggestCache
+from aram_mayhem_helper.utils.config import SuggestConfig
+from aram_mayhem_helper.utils.data import GameData
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DatasetScores:
+    """单个数据集全部已排名符文的列式打分结果（``n`` 行，按 (英雄, 符文) 键升序）。
+
+    Attributes:
+        keys: (n,) 连接键 ``"<英雄ID>:<符文ID>"``
+        champion_ids: (n,) 英雄 ID
+        augment_ids: (n,) 符文 ID
+        names: (n,) 符文名称
+        levels: (n,) 符文等级
+        weighted_sums: (n,) float64 综合评分
+        ranks: (n,) int32 组内排名（1 起）
+        group_sizes: (n,) int32 组大小
+    """
+
+    keys: np.ndarray[Any, Any]
+    champion_ids: np.ndarray[Any, Any]
+    augment_ids: np.ndarray[Any, Any]
+    names: np.ndarray[Any, Any]
+    levels: np.ndarray[Any, Any]
+    weighted_sums: np.ndarray[Any, Any]
+    ranks: np.ndarray[Any, Any]
+    group_sizes: np.ndarray[Any, Any]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def percentiles(self) -> np.ndarray[Any, Any]:
+        """(n,) 组内排名分位 rank / group_size（与推荐阈值的百分比含义一致，越小越好）。"""
+        result: np.ndarray[Any, Any] = self.ranks / self.group_sizes
+        return result
+
+
+def dataset_scores(
+    data: GameData,
+    *,
+    source: str,
+    dataset: str,
+    thresholds: SuggestConfig,
+    champion_ids: Sequence[str] | None = None,
+    cache: SuggestCache | None = None,
+) -> DatasetScores:
+    """对指定数据集的全部（或指定）英雄打分，返回列式结果；缺数据的英雄静默跳过。"""
+    if champion_ids is None:
+        champion_ids = data.champion_ids()
+    if cache is None:
+        cache = SuggestCache(maxsize=1)
+    rows: list[tuple[str, str, str, str, float, int, int]] = []
+    for champion_id in champion_ids:
+        try:
+            suggest = cache.get(champion_id, data, source=source, dataset=dataset, thresholds=thresholds)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        for item in suggest.champion_augment_data:
+            if item.get("group_size") is None:  # 打分失败的组无排名
+                continue
+            rows.append(
+                (
+                    champion_id,
+                    str(item["id"]),
+                    item.get("name", ""),
+                    item.get("level", ""),
+                    item["weighted_sum"],
+                    item["rank"],
+                    item["group_size"],
+                )
+            )
+    champions = np.asarray([row[0] for row in rows], dtype=object)
+    augments = np.asarray([row[1] for row in rows], dtype=object)
+    keys = np.asarray([f"{row[0]}:{row[1]}" for row in rows], dtype=str)
+    order = np.argsort(keys, kind="stable")
+    return DatasetScores(
+        keys=keys[order],
+        champion_ids=champions[order],
+        augment_ids=augments[order],
+        names=np.asarray([row[2] for row in rows], dtype=object)[order],
+        levels=np.asarray([row[3] for row in rows], dtype=object)[order],
+        weighted_sums=np.asarray([row[4] for row in rows], dtype=np.float64)[order],
+        ranks=np.asarray([row[5] for row in rows], dtype=np.int32)[order],
+        group_sizes=np.asarray([row[6] for row in rows], dtype=np.int32)[order],
+    )
+
+
+@dataclass(frozen=True)
+class DatasetComparison:
+    """两个数据集均有排名的 (英雄, 符文) 对比结果，按分位差绝对值降序。
+
+    Attributes:
+        source: 数据源
+        base / other: 对比的两个数据集
+        base_scores / other_scores: 连接后对齐的两侧打分（同一行为同一 (英雄, 符文)）
+        rank_diff: (n,) int32 基准排名 − 对比排名（正数 = 在对比数据集中排名更靠前）
+        percentile_diff: (n,) float64 基准分位 − 对比分位（按组大小归一，不同组大小可比）
+    """
+
+    source: str
+    base: str
+    other: str
+    base_scores: DatasetScores
+    other_scores: DatasetScores
+    rank_diff: np.ndarray[Any, Any]
+    percentile_diff: np.ndarray[Any, Any]
+
+    def __len__(self) -> int:
+        return len(self.rank_diff)
+
+    def records(self, limit: int | None = None) -> Iterator[dict[str, Any]]:
+        """逐行产出 JSON 友好的字典（差异最大的在前）。"""
+        base, other = self.base_scores, self.other_scores
+        for row in range(len(self) if limit is None else min(limit, len(self))):
+            yield {
+                "champion_id": base.champion_ids[row],
+                "augment_id": base.augment_ids[row],
+                "augment_name": base.names[row],
+                "level": base.levels[row],
+                self.base: {
+                    "weighted_sum": float(base.weighted_sums[row]),
+                    "rank": int(base.ranks[row]),
+                    "group_size": int(base.group_sizes[row]),
+                },
+                self.other: {
+                    "weighted_sum": float(other.weighted_sums[row]),
+                    "rank": int(other.ranks[row]),
+                    "group_size": int(other.group_sizes[row]),
+                },
+                "rank_diff": int(self.rank_diff[row]),
+                "percentile_diff": float(self.percentile_diff[row]),
+            }
+
+
+def _take(scores: DatasetScores, index: np.ndarray[Any, Any]) -> DatasetScores:
+    return DatasetScores(
+        keys=scores.keys[index],
+        champion_ids=scores.champion_ids[index],
+        augment_ids=scores.augment_ids[index],
+        names=scores.names[index],
+        levels=scores.levels[index],
+        weighted_sums=scores.weighted_sums[index],
+        ranks=scores.ranks[index],
+        group_sizes=scores.group_sizes[index],
+    )
+
+
+def compare_datasets(
+    data: GameData,
+    *,
+    thresholds: SuggestConfig,
+    source: str = "aramkit",
+    base: str = "all",
+    other: str = "high",
+    champion_ids: Sequence[str] | None = None,
+) -> DatasetComparison:
+    """对比同一数据源两个数据集下各英雄符文的排名（仅统计两侧都有排名的符文）。
+
+    Raises:
+        ValueError: 数据集不属于该数据源，或两侧相同
+    """
+    valid = data.datasets(source)
+    if base not in valid or other not in valid:
+        raise ValueError(f"数据源 {source} 的数据集只能为 {'/'.join(valid)}: {base}, {other}")
+    if base == other:
+        raise ValueError(f"对比的两个数据集相同: {base}")
+    size = max(len(data.champion_ids()) if champion_ids is None else len(champion_ids), 1)
+    cache = SuggestCache(maxsize=size)
+    base_scores = dataset_scores(
+        data, source=source, dataset=base, thresholds=thresholds, champion_ids=champion_ids, cache=cache
+    )
+    other_scores = dataset_scores(
+        data, source=source, dataset=other, thresholds=thresholds, champion_ids=champion_ids, cache=cache
+    )
+    _, base_index, other_index = np.intersect1d(
+        base_scores.keys, other_scores.keys, assume_unique=True, return_indices=True
+    )
+    percentile_diff = base_scores.percentiles[base_index] - other_scores.percentiles[other_index]
+    order = descending_order(np.abs(percentile_diff))
+    base_index, other_index = base_index[order], other_index[order]
+    return DatasetComparison(
+        source=source,
+        base=base,
+        other=other,
+        base_scores=_take(base_scores, base_index),
+        other_scores=_take(other_scores, other_index),
+        rank_diff=(base_scores.ranks[base_index] - other_scores.ranks[other_index]).astype(np.int32),
+        percentile_diff=percentile_diff[order],
+    )
@@ -4,7 +4,15 @@ import logging
 from collections.abc import Callable
 from typing import Any
 
-from aram_mayhem_helper.algorithm.scoring import add_bayesian_sigmoid_score_attr, add_unit_scale_attr
+import numpy as np
+
+from aram_mayhem_helper.algorithm.scoring import (
+    BAYESIAN_SIGMOID,
+    add_bayesian_sigmoid_score_attr,
+    add_sample_size_score_attr,
+    add_unit_scale_attr,
+    uses_sample_scorer,
+)
 
 
 def build_scored_groups(
@@ -16,6 +24,8 @@ def build_scored_groups(
     assign_rank: bool = True,
     champion_id: str | None = None,
     logger: logging.Logger | None = None,
+    scorer: str = BAYESIAN_SIGMOID,
+    source: str | None = None,
 ) -> list[tuple[str, list[dict[str, Any]]]]:
     """过滤/分组/打分流水线。
 
@@ -26,12 +36,16 @@ def build_scored_groups(
     - ``lookup`` 未命中 → 跳过（旧 Suggest 会将其留在 ``champion_augment_data`` 中，
       统一后不再保留，属有意行为统一）
 
-    每个 level 组执行 unit 缩放 + 贝叶斯-sigmoid 打分；
+    每个 level 组执行 unit 缩放 + 贝叶斯-sigmoid 打分（``scorer`` 为样本量感知打分器、``source``
+    为原始胜率数据源且组内全部条目带正的 ``sampleCount`` 时改用该打分器，否则回退贝叶斯-sigmoid）；
     打分失败（如单元素组方差为 0）记 WARNING 并保留组内项（无分数，旧 Suggest 会崩溃，
     统一为 web 的容错行为）。
 
+    打分字段（level/name/weighted_sum/rank/*_unit/*_norm）直接写入 ``entries`` 中的字典，
+    GameData 缓存的条目被多个 Suggest/web 视图共享，调用方须传入浅拷贝。
+
     Args:
-        entries: 原始符文条目（来自 GameData.augment_entries）
+        entries: 符文条目（GameData.augment_entries 的浅拷贝，原地写入打分字段）
         lookup: 源感知的 augment_info 解析函数（``str(augment_id) → {"name", "level"}``）
         tau_factor: 贝叶斯收缩参数
         sigmoid_steepness: sigmoid 陡峭度
@@ -39,6 +53,8 @@ def build_scored_groups(
             web 保持文件顺序且不写 rank 字段
         champion_id: 日志上下文
         logger: 日志器
+        scorer: 打分器（``config.VALID_SCORERS``）
+        source: 条目所属数据源（决定样本量感知打分器是否适用，None 视为不适用）
 
     Returns:
         [(level, items)]，按 level 首次出现顺序
@@ -72,25 +88,38 @@ def build_scored_groups(
         try:
             # 统一数据源尺度：performance/popular 先 min-max 缩放到 [0,1]
             add_unit_scale_attr(items)
-            add_bayesian_sigmoid_score_attr(
-                items,
-                perf_attr="performance_unit",
-                pop_attr="popular_unit",
-                new_attr="weighted_sum",
-                tau_factor=tau_factor,
-                sigmoid_steepness=sigmoid_steepness,
-                perf_display_attr="performance_norm",
-                pop_display_attr="popular_norm",
-            )
+            samples = np.fromiter((item.get("sampleCount") or 0 for item in items), dtype=np.float64, count=len(items))
+            if uses_sample_scorer(scorer, source, samples):
+                add_sample_size_score_attr(
+                    items,
+                    method=scorer,
+                    sigmoid_steepness=sigmoid_steepness,
+                    perf_display_attr="performance_norm",
+                    pop_display_attr="popular_norm",
+                    rank_attr="rank" if assign_rank else "",
+                )
+            else:
+                add_bayesian_sigmoid_score_attr(
+                    items,
+                    perf_attr="performance_unit",
+                    pop_attr="popular_unit",
+                    new_attr="weighted_sum",
+                    tau_factor=tau_factor,
+                    sigmoid_steepness=sigmoid_steepness,
+                    perf_display_attr="performance_norm",
+                    pop_display_attr="popular_norm",
+                    rank_attr="rank" if assign_rank else "",
+                )
         except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
             # ZeroDivisionError：单元素组 unit 化后 popular 权重全 0，numpy 加权平均抛错
             log.warning(f"英雄 {champion_id} 等级 {level} 的符文数据归一化失败: {e}")
             continue
         if assign_rank:
-            sorted_items = sorted(items, key=lambda x: x.get("weighted_sum", 0.0), reverse=True)
+            # 打分时已按 weighted_sum 稳定降序写入 rank，按名次就位即可，无需再排序
+            sorted_items: list[dict[str, Any]] = [{}] * len(items)
+            for item in items:
+                sorted_items[item["rank"] - 1] = item
+                item["group_size"] = len(items)
             by_level[level] = sorted_items
-            for idx, item in enumerate(sorted_items):
-                item["rank"] = idx + 1
-                item["group_size"] = len(sorted_items)
 
     return [(level, items) for level, items in by_level.items()]
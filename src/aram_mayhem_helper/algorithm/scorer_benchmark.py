@@ -0,0 +1,114 @@
+"""打分器基准：在同一批等级组上对比各打分器全量打分一遍的耗时。
+
+只取原始胜率数据源中组内全部条目带 ``sampleCount`` 的组（样本量感知打分器的适用范围），使各打分器
+处理完全相同的输入；条目先经流水线过滤/分组/unit 缩放一次，计时只覆盖打分本身。
+"""
+
+import logging
+import time
+from typing import Any
+
+import numpy as np
+
+from aram_mayhem_helper.algorithm.pipeline import build_scored_groups
+from aram_mayhem_helper.algorithm.scoring import (
+    BAYESIAN_SIGMOID,
+    SAMPLE_SCORER_SOURCES,
+    add_bayesian_sigmoid_score_attr,
+    add_sample_size_score_attr,
+)
+from aram_mayhem_helper.utils.config import VALID_SCORERS, SuggestConfig
+from aram_mayhem_helper.utils.data import GameData
+
+logger = logging.getLogger(__name__)
+
+
+def extract_sample_groups(data: GameData, source: str, base: SuggestConfig) -> list[list[dict[str, Any]]]:
+    """该数据源下全部英雄中带样本数、且打分成功的等级组（条目为浅拷贝，不改动缓存）；非原始胜率数据源为空。"""
+    groups: list[list[dict[str, Any]]] = []
+    if source not in SAMPLE_SCORER_SOURCES:
+        return groups
+    for champion_id in data.champion_ids():
+        if data.available_source(champion_id, preferred=source) != source:
+            continue
+        entries = data.augment_entries(champion_id, source) or []
+        scored = build_scored_groups(
+            [dict(entry) for entry in entries],
+            lookup=data.augment_info,
+            tau_factor=base.shrinkage_tau_factor,
+            sigmoid_steepness=base.sigmoid_steepness,
+            assign_rank=True,
+            champion_id=champion_id,
+            logger=logger,
+        )
+        for _, items in scored:
+            if all("weighted_sum" in item and (item.get("sampleCount") or 0) > 0 for item in items):
+                groups.append(items)
+    return groups
+
+
+def _score_groups(groups: list[list[dict[str, Any]]], scorer: str, base: SuggestConfig) -> None:
+    for items in groups:
+        try:
+            if scorer == BAYESIAN_SIGMOID:
+                add_bayesian_sigmoid_score_attr(
+                    items,
+                    perf_attr="performance_unit",
+                    pop_attr="popular_unit",
+                    tau_factor=base.shrinkage_tau_factor,
+                    sigmoid_steepness=base.sigmoid_steepness,
+                    perf_display_attr="performance_norm",
+                    pop_display_attr="popular_norm",
+                    rank_attr="rank",
+                )
+            else:
+                add_sample_size_score_attr(
+                    items,
+                    method=scorer,
+                    sigmoid_steepness=base.sigmoid_steepness,
+                    perf_display_attr="performance_norm",
+                    pop_display_attr="popular_norm",
+                    rank_attr="rank",
+                )
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            continue  # 与流水线一致：单组打分失败不影响其余组
+
+
+def benchmark_scorers(
+    data: GameData, *, source: str, base: SuggestConfig, repeat: int = 10
+) -> dict[str, dict[str, float]]:
+    """各打分器对全部样本组打分一遍的耗时分布（毫秒）。
+
+    Args:
+        data: 数据仓储
+        source: 数据源（需为带 sampleCount 的原始胜率数据源，即 aramkit）
+        base: 打分参数
+        repeat: 每个打分器重复的轮数
+
+    Returns:
+        打分器 → ``{"groups", "items", "mean", "p50", "min"}``；没有可用的组时返回空字典
+
+    Raises:
+        ValueError: repeat 非正
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat 必须为正整数: {repeat}")
+    groups = extract_sample_groups(data, source, base)
+    if not groups:
+        return {}
+    items = sum(len(group) for group in groups)
+    results: dict[str, dict[str, float]] = {}
+    for scorer in VALID_SCORERS:
+        samples = np.empty(repeat)
+        for i in range(repeat):
+            start = time.perf_counter()
+            _score_groups(groups, scorer, base)
+            samples[i] = (time.perf_counter() - start) * 1000
+        results[scorer] = {
+            "groups": len(groups),
+            "items": items,
+            "mean": round(float(samples.mean()), 3),
+            "p50": round(float(np.median(samples)), 3),
+            "min": round(float(samples.min()), 3),
+        }
+    return results
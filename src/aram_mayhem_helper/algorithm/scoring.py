@@ -1,5 +1,6 @@
 """归一化与打分函数（自 utils/norm.py 迁移的活跃部分）。"""
 
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
@@ -58,6 +59,7 @@ def add_bayesian_sigmoid_score_attr(
     sigmoid_steepness: float = 1.0,
     perf_display_attr: str = "",
     pop_display_attr: str = "",
+    rank_attr: str = "",
 ) -> None:
     """Bayesian shrinkage + sigmoid squash into [0,1] in one pass.
 
@@ -86,6 +88,9 @@ def add_bayesian_sigmoid_score_attr(
         If set, store sigmoid(perf, group_mean, group_std) under this key.
     pop_display_attr : str
         If set, store percentile rank of popularity under this key.
+    rank_attr : str
+        If set, store the 1-based descending rank of the final score under
+        this key (ties keep list order, like a stable ``sorted``).
 
     Raises
     ------
@@ -124,12 +129,11 @@ def add_bayesian_sigmoid_score_attr(
         tau = 0.1 * tau_factor
 
     # Pre-compute popularity percentiles (1.0 = most popular)
-    pop_percentiles: dict[int, float] = {}
+    n = len(data_list)
+    pop_percentiles = None
     if pop_display_attr:
-        n = len(pop_values)
-        sorted_indices = sorted(range(n), key=lambda i: pop_values[i], reverse=True)
-        for rank, idx in enumerate(sorted_indices):
-            pop_percentiles[idx] = 1.0 - rank / max(n - 1, 1)
+        pop_percentiles = 1.0 - descending_ranks(pop_arr) / max(n - 1, 1)
+    final_scores = np.empty(n)
 
     for idx, item in enumerate(data_list):
         perf = float(item[perf_attr])
@@ -146,10 +150,300 @@ def add_bayesian_sigmoid_score_attr(
         final_score = 1.0 / (1.0 + np.exp(-z))
 
         item[new_attr] = round(float(final_score), 4)
+        final_scores[idx] = item[new_attr]
 
         # Per-dimension display values
         if perf_display_attr:
             perf_z = (perf - level_mean) / divisor if divisor > 0 else 0.0
             item[perf_display_attr] = round(float(1.0 / (1.0 + np.exp(-perf_z))), 4)
-        if pop_display_attr:
-            item[pop_display_attr] = round(pop_percentiles[idx], 4)
+        if pop_percentiles is not None:
+            item[pop_display_attr] = round(float(pop_percentiles[idx]), 4)
+
+    # 排名与流行度分位共用同一稳定 argsort 实现（按舍入后的分数排序，与展示值一致）
+    if rank_attr:
+        for idx, rank in enumerate(descending_ranks(final_scores)):
+            data_list[idx][rank_attr] = int(rank) + 1
+
+
+def descending_order(values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """降序下标（稳定：同值保持原顺序，等价于 ``sorted(range(n), key=..., reverse=True)``）。"""
+    order: np.ndarray[Any, Any] = np.argsort(-np.asarray(values, dtype=np.float64), kind="stable")
+    return order
+
+
+def descending_ranks(values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """每个元素的 0 起降序名次（``descending_order`` 的逆排列）。"""
+    order = descending_order(values)
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order))
+    return ranks
+
+
+def top_k_indices(values: np.ndarray[Any, Any], k: int) -> np.ndarray[Any, Any]:
+    """前 k 大元素的下标（降序，同值按原顺序），结果与 ``descending_order(values)[:k]`` 一致。
+
+    先用 ``np.argpartition`` 在 O(n) 内选出候选，仅对候选排序；第 k 名处的并列值
+    全部纳入候选后再截断，保证与完整稳定排序的结果逐项相同。
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return descending_order(values)
+    kth_value = values[np.argpartition(-values, k - 1)[k - 1]]
+    candidates = np.flatnonzero(values >= kth_value)
+    order: np.ndarray[Any, Any] = candidates[np.lexsort((candidates, -values[candidates]))][:k]
+    return order
+
+
+def bayesian_sigmoid_scores(
+    perf: np.ndarray[Any, Any],
+    pop: np.ndarray[Any, Any],
+    tau_factor: np.ndarray[Any, Any],
+    sigmoid_steepness: np.ndarray[Any, Any],
+) -> np.ndarray[Any, Any]:
+    """``add_bayesian_sigmoid_score_attr`` 的向量化版本：一次计算多组参数下的组内分数。
+
+    与逐项实现公式一致（含 4 位小数舍入），供参数扫描在数组上批量求值。
+
+    Args:
+        perf: (n,) 组内表现值（unit 缩放后）
+        pop: (n,) 组内流行度（unit 缩放后）
+        tau_factor: (m,) 贝叶斯收缩参数
+        sigmoid_steepness: (m,) sigmoid 陡峭度，须为正
+
+    Returns:
+        (m, n) 分数矩阵，第 i 行对应第 i 组参数
+
+    Raises:
+        ValueError: 组为空或表现值方差为 0
+        ZeroDivisionError: 流行度权重全为 0
+    """
+    if perf.size == 0:
+        raise ValueError("data_list is empty, cannot compute Bayesian shrinkage")
+    if float(pop.sum()) == 0:
+        raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+    level_mean = float(np.average(perf, weights=pop))
+    level_std = float(np.sqrt(np.average((perf - level_mean) ** 2, weights=pop)))
+    if level_std == 0:
+        raise ValueError("performance std is 0, cannot apply sigmoid squash")
+
+    positive_pop = pop[pop > 0]
+    median = float(np.median(positive_pop)) if len(positive_pop) > 0 else 0.1
+    tau = (median * np.asarray(tau_factor, dtype=np.float64))[:, None]
+    denom = pop[None, :] + tau
+    weight = np.divide(pop[None, :], denom, out=np.zeros(denom.shape), where=denom > 0)
+    adjusted = weight * perf[None, :] + (1.0 - weight) * level_mean
+    divisor = level_std * np.asarray(sigmoid_steepness, dtype=np.float64)[:, None]
+    z = (adjusted - level_mean) / divisor
+    scores: np.ndarray[Any, Any] = np.round(1.0 / (1.0 + np.exp(-z)), 4)
+    return scores
+
+
+# ── 样本量感知打分（aramkit sampleCount）─────────────────────────────────
+
+BAYESIAN_SIGMOID = "bayesian_sigmoid"
+BETA_BINOMIAL = "beta_binomial"
+WILSON = "wilson"
+WILSON_Z = 1.96  # 95% 置信下界
+
+
+def beta_binomial_posterior(rate: np.ndarray[Any, Any], samples: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """经验贝叶斯 beta-binomial 后验均值（先验由同组全部符文以矩估计闭式求得）。
+
+    胜场 = 胜率 × 样本数；先验均值 μ = Σ胜场 / Σ样本，组间真实方差 = 样本加权方差
+    减去二项抽样噪声 μ(1-μ)·k/Σ样本。先验强度 κ = μ(1-μ)/真实方差 − 1，
+    后验 = (胜场 + μκ) / (样本 + κ)：样本越少越向组均值收缩。
+
+    Args:
+        rate: (n,) 胜率（0~1）
+        samples: (n,) 样本数，须为正
+
+    Returns:
+        (n,) 后验胜率
+    """
+    total = float(samples.sum())
+    wins = rate * samples
+    mu = float(wins.sum()) / total
+    observed_var = float(np.sum(samples * (rate - mu) ** 2)) / total
+    noise_var = mu * (1.0 - mu) * len(rate) / total
+    true_var = observed_var - noise_var
+    if true_var <= 0:  # 差异全部可由抽样噪声解释：完全收缩到组均值
+        return np.full(len(rate), mu)
+    kappa = max(mu * (1.0 - mu) / true_var - 1.0, 0.0)
+    posterior: np.ndarray[Any, Any] = (wins + mu * kappa) / (samples + kappa)
+    return posterior
+
+
+def wilson_lower_bound(
+    rate: np.ndarray[Any, Any], samples: np.ndarray[Any, Any], z: float = WILSON_Z
+) -> np.ndarray[Any, Any]:
+    """胜率的 Wilson 置信区间下界（样本越少下界越低）。
+
+    Args:
+        rate: (n,) 胜率（0~1）
+        samples: (n,) 样本数，须为正
+        z: 标准正态分位数（默认 95% 置信）
+
+    Returns:
+        (n,) 胜率下界
+    """
+    z2 = z * z
+    center = rate + z2 / (2 * samples)
+    margin = z * np.sqrt(rate * (1 - rate) / samples + z2 / (4 * samples * samples))
+    bound: np.ndarray[Any, Any] = (center - margin) / (1 + z2 / samples)
+    return bound
+
+
+def add_sample_size_score_attr(
+    data_list: list[dict[str, Any]],
+    *,
+    method: str,
+    rate_attr: str = "performance",
+    samples_attr: str = "sampleCount",
+    perf_attr: str = "performance_unit",
+    pop_attr: str = "popular_unit",
+    new_attr: str = "weighted_sum",
+    sigmoid_steepness: float = 1.0,
+    perf_display_attr: str = "",
+    pop_display_attr: str = "",
+    rank_attr: str = "",
+) -> None:
+    """样本量感知打分：胜率按 ``method`` 校正后，以组内样本加权均值/标准差做 sigmoid 压缩到 [0,1]。
+
+    与 ``add_bayesian_sigmoid_score_attr`` 输出同名字段、同尺度（组均值 → 0.5），推荐阈值通用；
+    全程在数组上计算，逐项只写回结果。
+
+    Args:
+        data_list: 目标列表（原地写入分数/展示值/排名）
+        method: ``BETA_BINOMIAL`` 或 ``WILSON``
+        rate_attr: 原始胜率字段（0~1，未经 unit 缩放）
+        samples_attr: 样本数字段
+        perf_attr / pop_attr: 展示值使用的（unit 缩放后）表现/流行度字段
+        new_attr: 分数字段
+        sigmoid_steepness: sigmoid 陡峭度
+        perf_display_attr / pop_display_attr / rank_attr: 同 ``add_bayesian_sigmoid_score_attr``
+
+    Raises:
+        ValueError: 组为空、method 非法、样本数非正或校正后分数方差为 0
+        KeyError: 元素缺失字段
+    """
+    if not data_list:
+        raise ValueError("data_list is empty, cannot compute sample-size score")
+    n = len(data_list)
+    rate = np.fromiter((float(item[rate_attr]) for item in data_list), dtype=np.float64, count=n)
+    samples = np.fromiter((float(item[samples_attr]) for item in data_list), dtype=np.float64, count=n)
+    final_scores = sample_size_scores(rate, samples, method, np.array([sigmoid_steepness]))[0]
+
+    perf_display = None
+    if perf_display_attr:
+        perf = np.fromiter((float(item[perf_attr]) for item in data_list), dtype=np.float64, count=n)
+        pop = np.fromiter((float(item[pop_attr]) for item in data_list), dtype=np.float64, count=n)
+        perf_mean = float(np.average(perf, weights=pop))
+        perf_std = float(np.sqrt(np.average((perf - perf_mean) ** 2, weights=pop)))
+        divisor = perf_std * sigmoid_steepness
+        perf_z = (perf - perf_mean) / divisor if divisor > 0 else np.zeros(n)
+        perf_display = np.round(1.0 / (1.0 + np.exp(-perf_z)), 4)
+    pop_percentiles = None
+    if pop_display_attr:
+        pop = np.fromiter((float(item[pop_attr]) for item in data_list), dtype=np.float64, count=n)
+        pop_percentiles = np.round(1.0 - descending_ranks(pop) / max(n - 1, 1), 4)
+    ranks = descending_ranks(final_scores) + 1 if rank_attr else None
+
+    for idx, item in enumerate(data_list):
+        item[new_attr] = float(final_scores[idx])
+        if perf_display is not None:
+            item[perf_display_attr] = float(perf_display[idx])
+        if pop_percentiles is not None:
+            item[pop_display_attr] = float(pop_percentiles[idx])
+        if ranks is not None:
+            item[rank_attr] = int(ranks[idx])
+
+
+def sample_size_scores(
+    rate: np.ndarray[Any, Any],
+    samples: np.ndarray[Any, Any],
+    method: str,
+    sigmoid_steepness: np.ndarray[Any, Any],
+) -> np.ndarray[Any, Any]:
+    """样本量感知打分的向量化形式：一次计算多个 sigmoid 陡峭度下的组内分数（含 4 位小数舍入）。
+
+    Args:
+        rate: (n,) 胜率（0~1）
+        samples: (n,) 样本数，须为正
+        method: ``BETA_BINOMIAL`` 或 ``WILSON``
+        sigmoid_steepness: (m,) sigmoid 陡峭度，须为正
+
+    Returns:
+        (m, n) 分数矩阵
+
+    Raises:
+        ValueError: 组为空、method 非法、样本数非正、胜率越界或校正后分数方差为 0
+    """
+    if rate.size == 0:
+        raise ValueError("data_list is empty, cannot compute sample-size score")
+    if method not in (BETA_BINOMIAL, WILSON):
+        raise ValueError(f"unknown sample-size scorer: {method}")
+    if np.any(samples <= 0):
+        raise ValueError("sample counts must be positive for every item")
+    if np.any((rate < 0) | (rate > 1)):
+        raise ValueError("performance must be a rate within [0, 1]")
+
+    adjusted = beta_binomial_posterior(rate, samples) if method == BETA_BINOMIAL else wilson_lower_bound(rate, samples)
+    center = float(np.average(adjusted, weights=samples))
+    spread = float(np.sqrt(np.average((adjusted - center) ** 2, weights=samples)))
+    if spread == 0:
+        raise ValueError("adjusted score std is 0, cannot apply sigmoid squash")
+    divisor = spread * np.asarray(sigmoid_steepness, dtype=np.float64)[:, None]
+    scores: np.ndarray[Any, Any] = np.round(1.0 / (1.0 + np.exp(-(adjusted[None, :] - center) / divisor)), 4)
+    return scores
+
+
+# ── 打分器注册表（向量化形式，供参数扫描按配置的打分器批量求值）──────────────
+
+# (perf_unit, pop_unit, rate, samples, tau_factor(m,), sigmoid_steepness(m,)) → (m, n) 分数矩阵
+VectorizedScorer = Callable[
+    [
+        np.ndarray[Any, Any],
+        np.ndarray[Any, Any],
+        np.ndarray[Any, Any],
+        np.ndarray[Any, Any],
+        np.ndarray[Any, Any],
+        np.ndarray[Any, Any],
+    ],
+    np.ndarray[Any, Any],
+]
+
+VECTORIZED_SCORERS: dict[str, VectorizedScorer] = {
+    BAYESIAN_SIGMOID: lambda perf, pop, rate, samples, tau, steep: bayesian_sigmoid_scores(perf, pop, tau, steep),
+    BETA_BINOMIAL: lambda perf, pop, rate, samples, tau, steep: sample_size_scores(rate, samples, BETA_BINOMIAL, steep),
+    WILSON: lambda perf, pop, rate, samples, tau, steep: sample_size_scores(rate, samples, WILSON, steep),
+}
+
+
+# 原始胜率/样本数可信的数据源：融合源的 performance 为 min-max 缩放值、sampleCount 为合成值，不适用
+SAMPLE_SCORER_SOURCES = ("aramkit",)
+
+
+def uses_sample_scorer(scorer: str, source: str | None, samples: np.ndarray[Any, Any] | None) -> bool:
+    """该组是否改用样本量感知打分器（原始胜率数据源且组内全部条目带正的样本数），否则回退贝叶斯-sigmoid。"""
+    return (
+        scorer != BAYESIAN_SIGMOID
+        and source in SAMPLE_SCORER_SOURCES
+        and samples is not None
+        and samples.size > 0
+        and bool(np.all(samples > 0))
+    )
+
+
+def vectorized_scorer(scorer: str) -> VectorizedScorer:
+    """打分器的向量化形式。
+
+    Raises:
+        ValueError: 打分器未注册向量化形式
+    """
+    try:
+        return VECTORIZED_SCORERS[scorer]
+    except KeyError:
+        raise ValueError(f"打分器 {scorer} 没有向量化实现，无法用于参数扫描") from None
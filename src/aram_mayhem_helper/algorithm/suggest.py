@@ -1,14 +1,66 @@
 """符文推荐引擎：分组打分 + 阈值建议（"快选"/"考虑"/"垃圾"）。"""
 
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
 from typing import Any
 
+import numpy as np
+
 from aram_mayhem_helper.algorithm.pipeline import build_scored_groups
+from aram_mayhem_helper.algorithm.scoring import top_k_indices
 from aram_mayhem_helper.utils.config import SuggestConfig
 from aram_mayhem_helper.utils.data import GameData
 
 
+class SuggestTier(Enum):
+    """推荐档位（值为推荐字符串前缀）。"""
+
+    IMMEDIATE = "快选符文："
+    CONSIDER = "考虑符文："
+    TRASH = "垃圾符文: "
+
+
+@dataclass(frozen=True, slots=True)
+class SuggestVerdict:
+    """单个符文的推荐结论（构造时预计算，热路径只做查表）。"""
+
+    tier: SuggestTier
+    rank: Any
+    group_size: Any
+    performance_norm: Any
+    popular_norm: Any
+    message: str
+
+
+def classify_augment(augment: dict[str, Any], group_size: Any, thresholds: SuggestConfig) -> SuggestVerdict:
+    """按排名/分数阈值判定档位并渲染推荐字符串。
+
+    Args:
+        augment: 已打分的符文条目（含 name/rank/weighted_sum/*_norm）
+        group_size: 该符文所在等级组大小
+        thresholds: 推荐阈值
+    """
+    name = augment.get("name", "未知")
+    rank = augment.get("rank", group_size)
+    ws = augment.get("weighted_sum", 0)
+    perf_norm = augment.get("performance_norm", "N/A")
+    pop_norm = augment.get("popular_norm", "N/A")
+    immediate_select_rank_threshold = group_size * thresholds.immediate_select_percentage_threshold
+    consider_select_rank_threshold = group_size * thresholds.consider_select_percentage_threshold
+    if rank <= immediate_select_rank_threshold or ws >= thresholds.immediate_select_score_threshold:
+        tier = SuggestTier.IMMEDIATE
+    elif rank <= consider_select_rank_threshold or ws >= thresholds.consider_select_score_threshold:
+        tier = SuggestTier.CONSIDER
+    else:
+        tier = SuggestTier.TRASH
+    message = f"{tier.value}{name}，{rank}/{group_size}，表现: {perf_norm}，流行度: {pop_norm}"
+    return SuggestVerdict(tier, rank, group_size, perf_norm, pop_norm, message)
+
+
 class Suggest:
     """对单个英雄的符文数据进行打分与推荐。
 
@@ -16,6 +68,7 @@ class Suggest:
         champion_id: 英雄 ID
         data: GameData 仓储（注入，便于测试与多实例）
         source: 数据源（"opgg"/"aramkit"），None 取配置默认
+        dataset: 数据集（aramkit "all"/"high"），None 取配置
         thresholds: 推荐阈值（实例数据，替代旧实现的类属性在导入时读配置）
     """
 
@@ -25,26 +78,30 @@ class Suggest:
         data: GameData,
         *,
         source: str | None = None,
+        dataset: str | None = None,
         thresholds: SuggestConfig,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.champion_id = champion_id
         self.data = data
         self.source = source or data.default_source()
+        self.dataset = dataset or data.dataset(self.source)
         self.thresholds = thresholds
 
-        entries = data.augment_entries(champion_id, self.source)
-        if entries is None:
-            entries = []
+        # 浅拷贝：打分字段原地写入条目，缓存的条目由其他参数下的 Suggest/web 视图共享
+        entries = [dict(entry) for entry in data.augment_entries(champion_id, self.source, self.dataset) or []]
 
         self.champion_augment_data: list[dict[str, Any]] = []
         self.augment_group: dict[str, dict[str, Any]] = {}
         self._by_id: dict[str, dict[str, Any]] = {}  # id → item（O(1) 反查索引）
+        self._verdicts: dict[str, SuggestVerdict] = {}  # id → 预计算推荐结论（仅已排名的条目）
         groups = build_scored_groups(
             entries,
             lookup=lambda augment_id: data.augment_info(augment_id),
             tau_factor=thresholds.shrinkage_tau_factor,
             sigmoid_steepness=thresholds.sigmoid_steepness,
+            scorer=thresholds.scorer,
+            source=self.source,
             assign_rank=True,
             champion_id=champion_id,
             logger=self.logger,
@@ -55,6 +112,8 @@ class Suggest:
             for item in items:
                 # id 归一化到 str，与原 get_augment_info_by_id 的 str(item_id) 比较语义一致
                 self._by_id[str(item["id"])] = item
+                if item.get("group_size") is not None:  # 打分失败的组无排名，留给 get_suggest_info 兜底
+                    self._verdicts[str(item["id"])] = classify_augment(item, item["group_size"], thresholds)
 
     def get_augment_info_by_id(self, augment_id: str) -> dict[str, Any] | None:
         """
@@ -70,6 +129,19 @@ class Suggest:
             return None
         return self._by_id.get(augment_id)
 
+    def get_verdict(self, augment_id: str) -> SuggestVerdict | None:
+        """使用符文id查询预计算的推荐结论，未找到（或所在组未能排名）时返回 None。"""
+        return self._verdicts.get(augment_id)
+
+    def top_augments(self, k: int) -> list[dict[str, Any]]:
+        """全部等级中综合评分最高的 k 个符文（降序，同分按数据顺序）；只选前 k 个，不做全量排序。"""
+        scores = np.fromiter(
+            (item.get("weighted_sum", 0.0) for item in self.champion_augment_data),
+            dtype=np.float64,
+            count=len(self.champion_augment_data),
+        )
+        return [self.champion_augment_data[idx] for idx in top_k_indices(scores, k)]
+
     def suggest(
         self,
         augments: list[str],
@@ -88,6 +160,7 @@ class Suggest:
             list: 操作推荐
         """
         augment_info: list[dict[str, Any]] = []
+        verdicts: list[SuggestVerdict | None] = []
         for index, augment in enumerate(augments):
             augment_id = self.data.augment_id(augment)
             if not augment_id:
@@ -100,15 +173,17 @@ class Suggest:
                 self.logger.warning(f"符文 ID {augment_id} (OCR名称: '{augment}') 在当前英雄数据中未找到")
                 continue
             augment_info.append(info)
+            verdicts.append(self._verdicts.get(augment_id))
         if not augment_info:
             self.logger.warning("没有有效的符文信息可供建议")
             return []
-        result = self.get_suggest_info(augment_info)
-        return result
+        if all(v is not None for v in verdicts):
+            return [v.message for v in verdicts if v is not None]  # 热路径：纯查表，无阈值计算与格式化
+        return self.get_suggest_info(augment_info)
 
     def get_suggest_info(self, augments: list[dict[str, Any]]) -> list[str]:
         """
-        根据输入符文信息，给出操作推荐
+        根据输入符文信息，给出操作推荐（现场计算；``suggest`` 对已排名条目走预计算表）
 
         Args:
             augments (list[dict[str, Any]]): 输入符文信息
@@ -129,27 +204,85 @@ class Suggest:
         if fallback_group_size is None:
             self.logger.warning("符文数据缺少 'group_size' 字段，无法生成建议")
             return []
-        t = self.thresholds
         result: list[str] = []
         for augment in augments:
             if augment is None:
                 continue
-            name = augment.get("name", "未知")
             group_size = augment.get("group_size") or fallback_group_size
-            rank = augment.get("rank", group_size)
-            ws = augment.get("weighted_sum", 0)
-            perf_norm = augment.get("performance_norm", "N/A")
-            pop_norm = augment.get("popular_norm", "N/A")
-            immediate_select_rank_threshold = group_size * t.immediate_select_percentage_threshold
-            consider_select_rank_threshold = group_size * t.consider_select_percentage_threshold
-            message = None
-            if rank <= immediate_select_rank_threshold or ws >= t.immediate_select_score_threshold:
-                message = f"快选符文：{name}"
-            elif rank <= consider_select_rank_threshold or ws >= t.consider_select_score_threshold:
-                message = f"考虑符文：{name}"
-            else:
-                message = f"垃圾符文: {name}"
-            message += f"，{rank}/{group_size}，表现: {perf_norm}，流行度: {pop_norm}"
-            result.append(message)
+            result.append(classify_augment(augment, group_size, self.thresholds).message)
 
         return result
+
+
+class SuggestCache:
+    """``Suggest`` 实例 LRU 缓存：同一对局内多次识别同一英雄时跳过重新打分。
+
+    键为 (champion_id, 解析后的数据源, 数据集, thresholds)；绑定的 GameData 实例变化或全量
+    ``reload()`` 时整体清空，增量 ``invalidate()`` 时只丢弃变化英雄的实例。
+
+    Args:
+        maxsize: 最多缓存的实例数
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, str, SuggestConfig], Suggest] = OrderedDict()
+        self._data: GameData | None = None
+        self._generation = -1
+
+    def get(
+        self,
+        champion_id: str,
+        data: GameData,
+        *,
+        source: str | None = None,
+        dataset: str | None = None,
+        thresholds: SuggestConfig,
+    ) -> Suggest:
+        """返回缓存的 Suggest，未命中时构建并放入缓存（淘汰最久未用的实例）。"""
+        source = source or data.default_source()
+        key = (champion_id, source, dataset or data.dataset(source), thresholds)
+        with self._lock:
+            if data is not self._data or data.generation != self._generation:
+                changed = data.changed_since(self._generation) if data is self._data else None
+                if changed is None:
+                    self._entries.clear()
+                else:  # 增量失效：只丢弃条目有变化的英雄
+                    for stale in [k for k in self._entries if k[0] in changed]:
+                        del self._entries[stale]
+                self._data = data
+                self._generation = data.generation
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+            generation = self._generation
+        suggest = Suggest(champion_id, data, source=key[1], dataset=key[2], thresholds=thresholds)
+        with self._lock:
+            # 构建期间数据已重载则不写回，避免缓存旧数据构建的实例
+            if data is self._data and data.generation == generation:
+                self._entries[key] = suggest
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return suggest
+
+    def clear(self) -> None:
+        """清空全部缓存实例。"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_suggest_cache_singleton: SuggestCache | None = None
+
+
+def get_suggest_cache() -> SuggestCache:
+    """懒加载 SuggestCache 单例（GUI/CLI/监视器共享）。"""
+    global _suggest_cache_singleton
+    if _suggest_cache_singleton is None:
+        _suggest_cache_singleton = SuggestCache()
+    return _suggest_cache_singleton
@@ -0,0 +1,249 @@
+"""``[suggest]`` 参数扫描：评估 (tau_factor, steepness, 快选分数阈值) 网格对推荐结论的影响。
+
+流程：
+1. 主进程为每个 (数据源, 英雄, 等级组) 跑一次过滤/unit 缩放流水线，提取
+   ``performance_unit``/``popular_unit`` 及原始胜率/样本数数组（与参数无关）；
+2. 各等级组分块提交到 ``ProcessPoolExecutor``，子进程经打分器注册表取配置的
+   打分器（``[suggest] scorer``，非原始胜率数据源或组内缺样本数时与 Suggest 一样回退贝叶斯-sigmoid）的
+   向量化形式，在数组上一次算出整个 (tau, steepness) 网格的分数矩阵，再对阈值维度
+   广播判定档位（样本量感知打分器不使用 tau，该维度各行结果相同）；
+3. 汇总每组参数的档位计数、相对当前配置的档位变化数与组内排名 Spearman 相关。
+"""
+
+import itertools
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from aram_mayhem_helper.algorithm.pipeline import build_scored_groups
+from aram_mayhem_helper.algorithm.scoring import BAYESIAN_SIGMOID, uses_sample_scorer, vectorized_scorer
+from aram_mayhem_helper.utils.config import VALID_SOURCES, SuggestConfig
+from aram_mayhem_helper.utils.data import GameData
+
+logger = logging.getLogger(__name__)
+
+# 档位编码，与 SuggestTier 定义顺序一致
+_IMMEDIATE, _CONSIDER, _TRASH = 0, 1, 2
+
+# (performance_unit, popular_unit, 原始表现/胜率, 样本数（缺失为 0）)
+GroupArrays = tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]
+
+
+@dataclass(frozen=True)
+class SweepGrid:
+    """扫描网格（三个维度做笛卡尔积）。"""
+
+    tau_factors: tuple[float, ...]
+    sigmoid_steepness: tuple[float, ...]
+    immediate_score_thresholds: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        if not (self.tau_factors and self.sigmoid_steepness and self.immediate_score_thresholds):
+            raise ValueError("扫描网格的每个维度至少需要一个取值")
+        if any(s <= 0 for s in self.sigmoid_steepness):
+            raise ValueError(f"sigmoid_steepness 必须为正: {self.sigmoid_steepness}")
+        if any(t < 0 for t in self.tau_factors):
+            raise ValueError(f"tau_factor 不能为负: {self.tau_factors}")
+
+
+@dataclass(frozen=True)
+class SweepRow:
+    """单组参数在某数据源下的汇总结果。
+
+    Attributes:
+        tier_changes: 与当前配置相比档位发生变化的符文数
+        rank_correlation: 各等级组排名与当前配置排名的平均 Spearman 相关系数
+    """
+
+    source: str
+    tau_factor: float
+    sigmoid_steepness: float
+    immediate_score_threshold: float
+    immediate: int
+    consider: int
+    trash: int
+    tier_changes: int
+    rank_correlation: float
+
+
+def extract_group_arrays(data: GameData, source: str, base: SuggestConfig) -> list[GroupArrays]:
+    """提取该数据源下全部英雄各等级组的打分输入数组（跳过无数据/以 ``base.scorer`` 打分失败的组）。
+
+    条目先浅拷贝再进入流水线，不改动 GameData 缓存中的字典。
+    """
+    groups: list[GroupArrays] = []
+    for champion_id in data.champion_ids():
+        if data.available_source(champion_id, preferred=source) != source:
+            continue
+        entries = data.augment_entries(champion_id, source) or []
+        scored = build_scored_groups(
+            [dict(entry) for entry in entries],
+            lookup=data.augment_info,
+            tau_factor=base.shrinkage_tau_factor,
+            sigmoid_steepness=base.sigmoid_steepness,
+            scorer=base.scorer,
+            source=source,
+            assign_rank=False,
+            champion_id=champion_id,
+            logger=logger,
+        )
+        for _, items in scored:
+            if any("weighted_sum" not in item for item in items):
+                continue  # 打分失败的组在推荐中没有排名，不参与扫描
+            perf = np.fromiter((item["performance_unit"] for item in items), dtype=np.float64, count=len(items))
+            pop = np.fromiter((item["popular_unit"] for item in items), dtype=np.float64, count=len(items))
+            rate = np.fromiter((item["performance"] for item in items), dtype=np.float64, count=len(items))
+            samples = np.fromiter((item.get("sampleCount") or 0 for item in items), dtype=np.float64, count=len(items))
+            groups.append((perf, pop, rate, samples))
+    return groups
+
+
+def _ranks(scores: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """(m, n) 分数 → 组内 1 起排名（降序，同分保持原顺序，与 Suggest 的稳定排序一致）。"""
+    order = np.argsort(-scores, axis=-1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, scores.shape[-1] + 1), axis=-1)
+    return ranks
+
+
+def _tiers(
+    scores: np.ndarray[Any, Any],
+    ranks: np.ndarray[Any, Any],
+    immediate_score_thresholds: np.ndarray[Any, Any],
+    base: SuggestConfig,
+) -> np.ndarray[Any, Any]:
+    """(m, n) 分数/排名 × (p,) 快选阈值 → (m, p, n) 档位编码（规则同 classify_augment）。"""
+    group_size = scores.shape[-1]
+    scores = scores[:, None, :]
+    ranks = ranks[:, None, :]
+    immediate = (ranks <= group_size * base.immediate_select_percentage_threshold) | (
+        scores >= immediate_score_thresholds[None, :, None]
+    )
+    consider = (ranks <= group_size * base.consider_select_percentage_threshold) | (
+        scores >= base.consider_select_score_threshold
+    )
+    return np.where(immediate, _IMMEDIATE, np.where(consider, _CONSIDER, _TRASH))
+
+
+def _sweep_chunk(
+    groups: list[GroupArrays],
+    tau_factors: np.ndarray[Any, Any],
+    steepness: np.ndarray[Any, Any],
+    immediate_score_thresholds: np.ndarray[Any, Any],
+    base: SuggestConfig,
+    source: str,
+) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any], int]:
+    """子进程任务：对一批等级组累计 (档位计数, 档位变化数, Spearman 之和, 参与相关计算的组数)。
+
+    Raises:
+        ValueError: ``base.scorer`` 没有向量化形式
+    """
+    m, p = len(tau_factors), len(immediate_score_thresholds)
+    tier_counts = np.zeros((m, p, 3), dtype=np.int64)
+    tier_changes = np.zeros((m, p), dtype=np.int64)
+    rho_sum = np.zeros(m, dtype=np.float64)
+    rho_groups = 0
+    base_params = np.array([base.shrinkage_tau_factor]), np.array([base.sigmoid_steepness])
+    base_threshold = np.array([base.immediate_select_score_threshold])
+    configured = vectorized_scorer(base.scorer)
+    fallback = vectorized_scorer(BAYESIAN_SIGMOID)
+    for perf, pop, rate, samples in groups:
+        n = len(perf)
+        score = configured if uses_sample_scorer(base.scorer, source, samples) else fallback
+        scores = score(perf, pop, rate, samples, tau_factors, steepness)
+        ranks = _ranks(scores)
+        tiers = _tiers(scores, ranks, immediate_score_thresholds, base)
+        base_scores = score(perf, pop, rate, samples, *base_params)
+        base_ranks = _ranks(base_scores)
+        base_tiers = _tiers(base_scores, base_ranks, base_threshold, base)[0, 0]
+
+        for code in (_IMMEDIATE, _CONSIDER, _TRASH):
+            tier_counts[:, :, code] += (tiers == code).sum(axis=-1)
+        tier_changes += (tiers != base_tiers).sum(axis=-1)
+        if n >= 2:
+            # 排名为无并列的排列，Spearman 可直接用 1 - 6Σd²/(n(n²-1))
+            d2 = ((ranks - base_ranks) ** 2).sum(axis=-1)
+            rho_sum += 1.0 - 6.0 * d2 / (n * (n * n - 1))
+            rho_groups += 1
+    return tier_counts, tier_changes, rho_sum, rho_groups
+
+
+def run_sweep(
+    data: GameData,
+    grid: SweepGrid,
+    *,
+    base: SuggestConfig,
+    sources: Sequence[str] = VALID_SOURCES,
+    workers: int | None = None,
+) -> list[SweepRow]:
+    """在全部英雄、指定数据源上扫描参数网格。
+
+    Args:
+        data: 数据仓储
+        grid: 扫描网格
+        base: 当前配置（提供其余阈值，并作为档位变化/排名相关的比较基准）
+        sources: 参与扫描的数据源
+        workers: 进程数，None 取 CPU 数；1 时在当前进程内执行
+
+    Returns:
+        按 (数据源, tau, steepness, 阈值) 顺序排列的结果行
+
+    Raises:
+        ValueError: ``base.scorer`` 没有向量化形式（不另行复制打分公式）
+    """
+    vectorized_scorer(base.scorer)  # 提前校验，避免提取数据/启动进程池后才失败
+    workers = workers or os.cpu_count() or 1
+    params = list(itertools.product(grid.tau_factors, grid.sigmoid_steepness))
+    tau_factors = np.array([tau for tau, _ in params], dtype=np.float64)
+    steepness = np.array([steep for _, steep in params], dtype=np.float64)
+    thresholds = np.array(grid.immediate_score_thresholds, dtype=np.float64)
+
+    groups_by_source = {source: extract_group_arrays(data, source, base) for source in sources}
+    results: dict[str, list[Any]] = {}
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for source, groups in groups_by_source.items():
+            chunk_count = max(1, min(len(groups), workers * 4))
+            chunks = [groups[i::chunk_count] for i in range(chunk_count)]
+            if executor is None:
+                results[source] = [
+                    _sweep_chunk(chunk, tau_factors, steepness, thresholds, base, source) for chunk in chunks
+                ]
+            else:
+                futures = [
+                    executor.submit(_sweep_chunk, chunk, tau_factors, steepness, thresholds, base, source)
+                    for chunk in chunks
+                ]
+                results[source] = [future.result() for future in futures]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    rows: list[SweepRow] = []
+    for source, partials in results.items():
+        tier_counts = sum(partial[0] for partial in partials)
+        tier_changes = sum(partial[1] for partial in partials)
+        rho_sum = sum(partial[2] for partial in partials)
+        rho_groups = sum(partial[3] for partial in partials)
+        logger.info(f"数据源 {source}: 扫描 {len(groups_by_source[source])} 个等级组")
+        for i, (tau, steep) in enumerate(params):
+            for j, threshold in enumerate(grid.immediate_score_thresholds):
+                rows.append(
+                    SweepRow(
+                        source=source,
+                        tau_factor=tau,
+                        sigmoid_steepness=steep,
+                        immediate_score_threshold=threshold,
+                        immediate=int(tier_counts[i, j, _IMMEDIATE]),
+                        consider=int(tier_counts[i, j, _CONSIDER]),
+                        trash=int(tier_counts[i, j, _TRASH]),
+                        tier_changes=int(tier_changes[i, j]),
+                        rank_correlation=round(float(rho_sum[i]) / rho_groups, 4) if rho_groups else float("nan"),
+                    )
+                )
+    return rows
@@ -1,13 +1,30 @@
 import argparse
+import json
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TextIO
 
-from aram_mayhem_helper.algorithm.suggest import Suggest
+from aram_mayhem_helper.algorithm.augment_index import AugmentChampionIndex
+from aram_mayhem_helper.algorithm.batch import suggest_batch
+from aram_mayhem_helper.algorithm.scorer_benchmark import benchmark_scorers
+from aram_mayhem_helper.algorithm.suggest import Suggest, SuggestCache
+from aram_mayhem_helper.algorithm.sweep import SweepGrid, run_sweep
 from aram_mayhem_helper.crawlers.aramkit.aramkit_crawler import AramkitCrawler
 from aram_mayhem_helper.crawlers.ddragon.champion_crawler import ChampionCrawler
 from aram_mayhem_helper.crawlers.opgg.aram_augment_crawler import AramAugmentCrawler
-from aram_mayhem_helper.league_client_api.live_data import get_current_champion_name
+from aram_mayhem_helper.league_client_api.live_data import LiveClientData, get_current_champion_name
+from aram_mayhem_helper.league_client_api.stub_server import (
+    LiveClientStub,
+    build_game_payload,
+    load_game_payload,
+    run_recommend_benchmark,
+    summarize_latencies,
+)
 from aram_mayhem_helper.ocr.ocr_tool import get_ocr_tool, save_unrecognized_capture
-from aram_mayhem_helper.utils.config import get_config
+from aram_mayhem_helper.utils.config import SCORING_SOURCES, VALID_SOURCES, get_config
 from aram_mayhem_helper.utils.data import get_game_data
 from aram_mayhem_helper.utils.log_config import setup_logging
 
@@ -52,27 +69,37 @@ def aramkit_crawler(start_id: int = 1, end_id: int = 999, dataset: str | None =
 def recommend() -> None:
     """
     截图并推荐（OCR 识别当前对局符文）
+
+    截图 + OCR 与英雄识别/打分互不依赖：OCR 提交到独立线程并发执行，
+    在 ``suggest.suggest`` 处汇合；英雄识别失败提前返回时不等待 OCR 结束。
     """
     logger.info("开始执行主程序")
     try:
-        champion_name = get_current_champion_name()
-        if not champion_name:
-            logger.error("无法获取当前英雄名称")
-            return
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
+        try:
+            ocr_future = pool.submit(lambda: get_ocr_tool().get_augments())
 
-        game_data = get_game_data()
-        champion_id = game_data.champion_id_by_name(champion_name)
-        if not champion_id:
-            logger.error(f"无法找到英雄名称 '{champion_name}' 对应的ID")
-            return
-
-        source = game_data.available_source(champion_id)
-        if source is None:
-            logger.error(f"英雄ID {champion_id} ({champion_name}) 在 opgg/aramkit 数据源中都没有符文数据")
-            return
-
-        suggest = Suggest(champion_id, game_data, source=source, thresholds=get_config().suggest)
-        arguments = get_ocr_tool().get_augments()
+            champion_name = get_current_champion_name()
+            if not champion_name:
+                logger.error("无法获取当前英雄名称")
+                return
+
+            game_data = get_game_data()
+            champion_id = game_data.champion_id_by_name(champion_name)
+            if not champion_id:
+                logger.error(f"无法找到英雄名称 '{champion_name}' 对应的ID")
+                return
+
+            source = game_data.available_source(champion_id)
+            if source is None:
+                logger.error(f"英雄ID {champion_id} ({champion_name}) 在 opgg/aramkit 数据源中都没有符文数据")
+                return
+
+            suggest = Suggest(champion_id, game_data, source=source, thresholds=get_config().suggest)
+            arguments = ocr_future.result()
+        finally:
+            # 提前返回/出错时丢弃 OCR：未开始则取消，已在运行的在后台结束，不阻塞返回
+            pool.shutdown(wait=False, cancel_futures=True)
         results = suggest.suggest(arguments, on_unrecognized=save_unrecognized_capture)
         if results:
             for result in results:
@@ -86,6 +113,353 @@ def recommend() -> None:
         return
 
 
+def suggest_batch_command(
+    input_stream: TextIO,
+    output_stream: TextIO,
+    *,
+    source: str | None = None,
+    chunk_size: int = 5000,
+) -> int:
+    """
+    批量推荐：读取 JSONL 查询并以 JSONL 流式输出推荐结论
+
+    每行输入形如 ``{"champion_id": "103", "augments": ["1001", "1002", "1003"]}``；
+    按 ``chunk_size`` 行分块做向量化查表，英雄打分结果跨块复用。
+
+    Args:
+        input_stream: 查询输入流
+        output_stream: 结果输出流
+        source: 首选数据源，None 取配置默认
+        chunk_size: 每块查询行数
+
+    Returns:
+        退出码（存在无法解析的输入行时 1）
+    """
+    game_data = get_game_data()
+    thresholds = get_config().suggest
+    cache = SuggestCache(maxsize=1024)
+    invalid = 0
+    champions: list[str] = []
+    augments: list[list[str]] = []
+
+    def flush() -> None:
+        result = suggest_batch(champions, augments, game_data, thresholds=thresholds, source=source, cache=cache)
+        for record in result.records():
+            output_stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output_stream.flush()
+        champions.clear()
+        augments.clear()
+
+    for line_no, line in enumerate(input_stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            query = json.loads(line)
+            champion_id = str(query["champion_id"])
+            augment_ids = [str(a) for a in query["augments"]]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"第{line_no}行查询格式错误，已跳过: {e}")
+            invalid += 1
+            continue
+        champions.append(champion_id)
+        augments.append(augment_ids)
+        if len(champions) >= chunk_size:
+            flush()
+    if champions:
+        flush()
+    return 1 if invalid else 0
+
+
+def augment_champions(augment: str, *, source: str | None = None, limit: int = 10) -> int:
+    """
+    查询符文在哪些英雄上综合评分最高
+
+    Args:
+        augment: 符文 ID 或名称
+        source: 数据源，None 取配置默认
+        limit: 最多输出的英雄数
+
+    Returns:
+        退出码（符文无法识别或无数据时 1）
+    """
+    game_data = get_game_data()
+    augment_id = augment if augment.isdigit() else game_data.augment_id(augment)
+    if augment_id is None:
+        logger.error(f"无法识别符文: {augment}")
+        return 1
+    source = source or game_data.default_source()
+    index = AugmentChampionIndex(game_data, source=source, thresholds=get_config().suggest)
+    ranked = index.champions_for(augment_id, limit)
+    if not ranked:
+        logger.warning(f"符文 {augment} 在数据源 {source} 中没有任何英雄的打分数据")
+        return 1
+    info = game_data.augment_info(augment_id) or {}
+    print(f"{info.get('name', augment_id)}（ID {augment_id}，数据源 {source}）")
+    for position, score in enumerate(ranked, start=1):
+        name = game_data.champion_name(score.champion_id) or score.champion_id
+        print(f"{position:>3}. {name:<16}{score.weighted_sum:.4f}  组内 {score.rank}/{score.group_size}")
+    return 0
+
+
+def ingest(
+    *,
+    leaderboard: int = 0,
+    source: str | None = None,
+    augment: str | None = None,
+    champion: str | None = None,
+) -> int:
+    """
+    把爬取的 JSON 数据增量导入 SQLite 统计数据库（[storage] backend = "sqlite"），可选输出索引查询结果
+
+    Args:
+        leaderboard: 导入后按表现输出的排行条数，0 不输出
+        source: 查询使用的数据源（opgg/aramkit），None 取配置默认（默认为融合源时取 aramkit）
+        augment: 符文 ID 或名称：输出该符文在各英雄上的当前统计
+        champion: 英雄 ID 或名称（需同时指定 augment）：改为输出该英雄符文在各已导入版本下的统计
+
+    Returns:
+        退出码（未启用 SQLite 后端、数据源无原始数据或英雄/符文无法识别时 1）
+    """
+    if champion is not None and augment is None:
+        logger.error("--champion 需要同时指定 --augment")
+        return 1
+    game_data = get_game_data()
+    try:
+        source = game_data.stored_source(source)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    try:
+        ingested = game_data.sync_store()
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    store = game_data.stats_store()
+    assert store is not None
+    print(f"已导入 {ingested} 份有变化的英雄符文数据: {store.db_path}")
+    if leaderboard > 0:
+        rows = store.leaderboard(source, game_data.dataset(source), limit=leaderboard)
+        for position, row in enumerate(rows, start=1):
+            name = game_data.champion_name(row["champion_id"]) or row["champion_id"]
+            print(f"{position:>3}. {name:<16}{row['name'] or row['augment_id']:<16}{row['performance']:.4f}")
+    if augment is None:
+        return 0
+    dataset = game_data.dataset(source)
+    augment_id = augment if augment.isdigit() else store.find_augment(augment)
+    champion_id = None
+    if champion is not None:
+        champion_id = champion if champion.isdigit() else game_data.champion_id_by_name(champion)
+    if augment_id is None or (champion is not None and champion_id is None):
+        logger.error(f"无法识别英雄或符文: {champion or '-'} / {augment}")
+        return 1
+    if champion_id is None:
+        for row in store.augment_stats(augment_id, source, dataset):
+            name = game_data.champion_name(row["champion_id"]) or row["champion_id"]
+            print(f"{name:<16}{row['performance']:>10.4f}{row['popular'] or 0:>10.4f}  {row['sample_count'] or '-'}")
+        return 0
+    print(f"已导入 {len(store.versions(source, dataset))} 个数据版本")
+    for row in store.augment_history(champion_id, augment_id, source, dataset):
+        performance = "-" if row["performance"] is None else f"{row['performance']:.4f}"
+        popular = "-" if row["popular"] is None else f"{row['popular']:.4f}"
+        print(f"{row['version'] or '-':<32}{performance:>10}{popular:>10}  {row['sample_count'] or '-'}")
+    return 0
+
+
+def trend(champion: str, augment: str, *, source: str | None = None) -> int:
+    """
+    输出英雄符文在各归档数据版本下的表现/流行度变化
+
+    Args:
+        champion: 英雄 ID 或名称
+        augment: 符文 ID 或名称
+        source: 数据源（opgg/aramkit），None 取配置默认（默认为融合源时取 aramkit）
+
+    Returns:
+        退出码（英雄/符文无法识别、数据源无原始数据或无归档数据时 1）
+    """
+    game_data = get_game_data()
+    champion_id = champion if champion.isdigit() else game_data.champion_id_by_name(champion)
+    augment_id = augment if augment.isdigit() else game_data.augment_id(augment)
+    if champion_id is None or augment_id is None:
+        logger.error(f"无法识别英雄或符文: {champion} / {augment}")
+        return 1
+    try:
+        source = game_data.stored_source(source)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    try:
+        points = game_data.stats_archive().trend(source, game_data.dataset(source), champion_id, augment_id)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    if not points:
+        logger.warning(f"数据源 {source} 的归档中没有英雄 {champion} 的符文 {augment} 数据")
+        return 1
+    for point in points:
+        performance = "-" if point.performance is None else f"{point.performance:.4f}"
+        popular = "-" if point.popular is None else f"{point.popular:.4f}"
+        print(f"{point.version:<32}{performance:>10}{popular:>10}  {point.sample_count or '-'}")
+    return 0
+
+
+def sweep(
+    *,
+    tau_factors: list[float] | None = None,
+    steepness: list[float] | None = None,
+    thresholds: list[float] | None = None,
+    source: str | None = None,
+    workers: int | None = None,
+) -> int:
+    """
+    扫描 ``[suggest]`` 参数网格，输出每组参数下的档位分布、档位变化数与排名相关
+
+    未指定的维度以当前配置为中心取三个点（tau/steepness 为 ×0.5/×1/×2，快选阈值为 ±0.1）。
+
+    Args:
+        tau_factors: shrinkage_tau_factor 取值
+        steepness: sigmoid_steepness 取值
+        thresholds: immediate_select_score_threshold 取值
+        source: 仅扫描该数据源，None 时扫描全部数据源
+        workers: 进程数，None 取 CPU 数
+
+    Returns:
+        退出码（网格非法时 1）
+    """
+    base = get_config().suggest
+    try:
+        grid = SweepGrid(
+            tau_factors=tuple(tau_factors or [base.shrinkage_tau_factor * k for k in (0.5, 1.0, 2.0)]),
+            sigmoid_steepness=tuple(steepness or [base.sigmoid_steepness * k for k in (0.5, 1.0, 2.0)]),
+            immediate_score_thresholds=tuple(
+                thresholds or [round(base.immediate_select_score_threshold + d, 4) for d in (-0.1, 0.0, 0.1)]
+            ),
+        )
+    except ValueError as e:
+        logger.error(f"扫描参数错误: {e}")
+        return 1
+    rows = run_sweep(
+        get_game_data(),
+        grid,
+        base=base,
+        sources=[source] if source else VALID_SOURCES,
+        workers=workers,
+    )
+    # 表头与数据行共用同一列宽（表头用 ASCII，避免全角字符占两列导致错位）
+    width = 10
+    headers = ("tau", "steep", "thresh", "immediate", "consider", "trash", "changes", "rho")
+    print(f"{'source':<{width}}" + "".join(f"{header:>{width}}" for header in headers))
+    for row in rows:
+        print(
+            f"{row.source:<{width}}{row.tau_factor:>{width}.3g}{row.sigmoid_steepness:>{width}.3g}"
+            f"{row.immediate_score_threshold:>{width}.3g}{row.immediate:>{width}}{row.consider:>{width}}"
+            f"{row.trash:>{width}}{row.tier_changes:>{width}}{row.rank_correlation:>{width}.4f}"
+        )
+    return 0
+
+
+def scorer_benchmark(*, source: str | None = None, repeat: int = 10) -> int:
+    """
+    对比各打分器（[suggest] scorer 可选值）在全量数据上打分一遍的耗时，逐行输出 JSON
+
+    Args:
+        source: 数据源（需带原始样本数，仅 aramkit 有效），None 取 aramkit
+        repeat: 每个打分器重复的轮数
+
+    Returns:
+        退出码（无带样本数的数据或参数非法时 1）
+    """
+    source = source or "aramkit"
+    try:
+        results = benchmark_scorers(get_game_data(), source=source, base=get_config().suggest, repeat=repeat)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    if not results:
+        logger.error(f"数据源 {source} 没有带样本数（sampleCount）的符文数据，无法对比打分器")
+        return 1
+    for scorer, summary in results.items():
+        print(json.dumps({"scorer": scorer, **summary}, ensure_ascii=False))
+    return 0
+
+
+def live_client_stub(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 2999,
+    champion: str = "Ahri",
+    payload_file: Path | None = None,
+    latency: float = 0.0,
+    failure_rate: float = 0.0,
+    tls: bool = True,
+    certfile: Path | None = None,
+    keyfile: Path | None = None,
+    benchmark: int = 0,
+    cold: bool = False,
+) -> int:
+    """
+    启动 Live Client Data API 替身服务器；``benchmark > 0`` 时改为压测推荐流程并输出耗时分布
+
+    Args:
+        host: 监听地址
+        port: 监听端口
+        champion: 未指定载荷文件时自己使用的英雄名
+        payload_file: ``allgamedata`` 载荷文件
+        latency: 每个请求的注入延迟（秒）
+        failure_rate: 请求失败（503）注入概率
+        tls: 是否启用 HTTPS（自签名证书）
+        certfile: 证书路径
+        keyfile: 私钥路径
+        benchmark: 压测迭代次数，0 为仅提供服务
+        cold: 压测时每轮清空本局英雄缓存
+
+    Returns:
+        退出码（压测全部失败时 1）
+    """
+    payload = load_game_payload(payload_file) if payload_file else build_game_payload(champion)
+    stub = LiveClientStub(
+        payload,
+        host=host,
+        port=port,
+        latency=latency,
+        failure_rate=failure_rate,
+        tls=tls,
+        certfile=certfile,
+        keyfile=keyfile,
+    )
+    with stub:
+        if benchmark <= 0:
+            logger.info(f"Live Client 替身服务器运行中: {stub.base_url}（Ctrl+C 退出）")
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+            return 0
+
+        game_data = get_game_data()
+        client = LiveClientData(stub.base_url)
+        champion_name = None
+        for _ in range(10):  # 预热解析英雄，容忍注入的失败
+            champion_name = client.current_champion_name(log_errors=False)
+            if champion_name:
+                break
+        champion_id = game_data.champion_id_by_name(champion_name) if champion_name else None
+        source = game_data.available_source(champion_id) if champion_id else None
+        if champion_id is None or source is None:
+            logger.error(f"替身服务器英雄 '{champion_name}' 无可用符文数据，无法压测")
+            return 1
+        thresholds = get_config().suggest
+        # 以该英雄评分最高的三个符文名模拟 OCR 输出
+        warm = Suggest(champion_id, game_data, source=source, thresholds=thresholds)
+        augments = [item["name"] for item in warm.top_augments(3)]
+        samples, failures = run_recommend_benchmark(
+            client, game_data, thresholds=thresholds, augments=augments, iterations=benchmark, cold=cold
+        )
+    summary = summarize_latencies(samples)
+    print(json.dumps({**summary, "failures": failures, "requests": stub.request_count}, ensure_ascii=False))
+    return 0 if samples else 1
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """
     解析命令行参数
@@ -119,6 +493,79 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     web_parser = subparsers.add_parser("web", help="启动网页应用，浏览符文数据")
     web_parser.add_argument("--host", type=str, default="127.0.0.1", help="监听地址，默认 127.0.0.1")
     web_parser.add_argument("--port", type=int, default=5000, help="监听端口，默认 5000")
+    web_parser.add_argument("--workers", type=int, default=1, help="工作进程数（>1 需 POSIX），默认 1")
+    web_parser.add_argument("--threads", type=int, default=8, help="每个工作进程的请求线程数，默认 8")
+    web_parser.add_argument("--watch-interval", type=float, default=2.0, help="数据目录监视间隔（秒），0 关闭，默认 2")
+
+    # suggest-batch 命令
+    batch_parser = subparsers.add_parser("suggest-batch", help="批量推荐：读取 JSONL 查询，输出 JSONL 推荐结论")
+    batch_parser.add_argument("--input", type=Path, default=None, help="查询 JSONL 文件，默认读取标准输入")
+    batch_parser.add_argument(
+        "--source", type=str, choices=list(SCORING_SOURCES), default=None, help="首选数据源，默认取配置"
+    )
+    batch_parser.add_argument("--chunk-size", type=int, default=5000, help="每批向量化查表的查询数，默认 5000")
+
+    # augment-champions 命令
+    augment_champions_parser = subparsers.add_parser("augment-champions", help="查询符文在哪些英雄上综合评分最高")
+    augment_champions_parser.add_argument("augment", type=str, help="符文 ID 或名称")
+    augment_champions_parser.add_argument(
+        "--source", type=str, choices=list(SCORING_SOURCES), default=None, help="数据源，默认取配置"
+    )
+    augment_champions_parser.add_argument("--limit", type=int, default=10, help="最多输出的英雄数，默认 10")
+
+    # ingest 命令
+    ingest_parser = subparsers.add_parser("ingest", help="把爬取的数据增量导入 SQLite 统计数据库")
+    ingest_parser.add_argument("--leaderboard", type=int, default=0, help="导入后输出表现最高的 N 个英雄符文组合")
+    ingest_parser.add_argument(
+        "--source", type=str, choices=list(VALID_SOURCES), default=None, help="查询数据源，默认取配置"
+    )
+    ingest_parser.add_argument("--augment", type=str, default=None, help="输出该符文（ID 或名称）在各英雄上的当前统计")
+    ingest_parser.add_argument(
+        "--champion", type=str, default=None, help="与 --augment 同用：输出该英雄符文在各已导入版本下的统计"
+    )
+
+    # trend 命令
+    trend_parser = subparsers.add_parser("trend", help="查看英雄符文在各归档数据版本下的变化")
+    trend_parser.add_argument("champion", type=str, help="英雄 ID 或名称")
+    trend_parser.add_argument("augment", type=str, help="符文 ID 或名称")
+    trend_parser.add_argument(
+        "--source", type=str, choices=list(VALID_SOURCES), default=None, help="数据源，默认取配置"
+    )
+
+    # sweep 命令
+    sweep_parser = subparsers.add_parser("sweep", help="扫描 [suggest] 参数网格，对比档位分布与排名变化")
+    sweep_parser.add_argument("--tau", type=float, nargs="+", default=None, help="shrinkage_tau_factor 取值列表")
+    sweep_parser.add_argument("--steepness", type=float, nargs="+", default=None, help="sigmoid_steepness 取值列表")
+    sweep_parser.add_argument(
+        "--threshold", type=float, nargs="+", default=None, help="immediate_select_score_threshold 取值列表"
+    )
+    sweep_parser.add_argument(
+        "--source", type=str, choices=list(SCORING_SOURCES), default=None, help="仅扫描该数据源，默认全部"
+    )
+    sweep_parser.add_argument("--workers", type=int, default=None, help="进程数，默认 CPU 数")
+
+    # scorer-benchmark 命令
+    scorer_bench_parser = subparsers.add_parser("scorer-benchmark", help="对比各打分器在全量数据上的打分耗时")
+    scorer_bench_parser.add_argument(
+        "--source", type=str, choices=list(VALID_SOURCES), default=None, help="数据源，默认 aramkit"
+    )
+    scorer_bench_parser.add_argument("--repeat", type=int, default=10, help="每个打分器重复轮数，默认 10")
+
+    # live-client-stub 命令
+    stub_parser = subparsers.add_parser(
+        "live-client-stub", help="启动 Live Client Data API 替身服务器（无游戏环境测试/压测推荐流程）"
+    )
+    stub_parser.add_argument("--host", type=str, default="127.0.0.1", help="监听地址，默认 127.0.0.1")
+    stub_parser.add_argument("--port", type=int, default=2999, help="监听端口，默认 2999（0 为随机端口）")
+    stub_parser.add_argument("--champion", type=str, default="Ahri", help="自己使用的英雄名，默认 Ahri")
+    stub_parser.add_argument("--payload", type=Path, default=None, help="allgamedata 载荷 JSON 文件（覆盖 --champion）")
+    stub_parser.add_argument("--latency", type=float, default=0.0, help="每个请求注入的延迟（秒），默认 0")
+    stub_parser.add_argument("--failure-rate", type=float, default=0.0, help="请求返回 503 的概率，默认 0")
+    stub_parser.add_argument("--no-tls", action="store_true", help="使用 HTTP 而非 HTTPS")
+    stub_parser.add_argument("--certfile", type=Path, default=None, help="TLS 证书（默认自动生成自签名证书）")
+    stub_parser.add_argument("--keyfile", type=Path, default=None, help="TLS 私钥")
+    stub_parser.add_argument("--benchmark", type=int, default=0, help="压测推荐流程的迭代次数，默认 0（仅服务）")
+    stub_parser.add_argument("--cold", action="store_true", help="压测时每轮清空本局英雄缓存")
 
     return parser.parse_args(argv)
 
@@ -144,11 +591,49 @@ def cli_main(argv: list[str] | None = None) -> int:
         champion_crawler()
     elif args.command == "aramkit-crawler":
         aramkit_crawler(args.start_id, args.end_id, args.dataset)
+    elif args.command == "suggest-batch":
+        if args.input is None:
+            return suggest_batch_command(sys.stdin, sys.stdout, source=args.source, chunk_size=args.chunk_size)
+        with open(args.input, "r", encoding="utf-8") as f:
+            return suggest_batch_command(f, sys.stdout, source=args.source, chunk_size=args.chunk_size)
+    elif args.command == "augment-champions":
+        return augment_champions(args.augment, source=args.source, limit=args.limit)
+    elif args.command == "ingest":
+        return ingest(leaderboard=args.leaderboard, source=args.source, augment=args.augment, champion=args.champion)
+    elif args.command == "trend":
+        return trend(args.champion, args.augment, source=args.source)
+    elif args.command == "sweep":
+        return sweep(
+            tau_factors=args.tau,
+            steepness=args.steepness,
+            thresholds=args.threshold,
+            source=args.source,
+            workers=args.workers,
+        )
+    elif args.command == "scorer-benchmark":
+        return scorer_benchmark(source=args.source, repeat=args.repeat)
+    elif args.command == "live-client-stub":
+        return live_client_stub(
+            host=args.host,
+            port=args.port,
+            champion=args.champion,
+            payload_file=args.payload,
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+            tls=not args.no_tls,
+            certfile=args.certfile,
+            keyfile=args.keyfile,
+            benchmark=args.benchmark,
+            cold=args.cold,
+        )
     elif args.command == "web":
-        from aram_mayhem_helper.web import create_app
+        from aram_mayhem_helper.web.server import serve
 
-        logger.info(f"启动网页应用 at http://{args.host}:{args.port}")
-        create_app().run(host=args.host, port=args.port, debug=False)
+        try:
+            serve(args.host, args.port, workers=args.workers, threads=args.threads, watch_interval=args.watch_interval)
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
     else:
         logger.error("请指定要执行的命令")
         return 1
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from aram_mayhem_helper.crawlers.base import BaseCrawler
 from aram_mayhem_helper.utils.aramkit import version_sort_key
+from aram_mayhem_helper.utils.archive import StatsArchive
 from aram_mayhem_helper.utils.config import AppConfig, get_config
 from aram_mayhem_helper.utils.data import get_game_data
 
@@ -35,8 +36,9 @@ class AramkitCrawler(BaseCrawler):
         super().__init__(
             timeout=app_config.crawler.timeout,
             delay_second=app_config.crawler.delay_second,
-            save_directory=app_config.aramkit_augment_dir,
+            save_directory=app_config.aramkit_dataset_dir(dataset),
             user_agent=app_config.crawler.user_agent,
+            archive=StatsArchive(app_config.archive_dir),
         )
         self.dataset = dataset
         self.homepage_url = app_config.crawler.aramkit.homepage_url
@@ -44,7 +46,7 @@ class AramkitCrawler(BaseCrawler):
         self.resources_base_url = app_config.crawler.aramkit.resources.resources_base_url
         self.language = app_config.crawler.aramkit.resources.language
         self.resources_directory = app_config.aramkit_resources_dir
-        self.version_file = app_config.data_dir / "aramkit" / "version.json"
+        self.version_file = app_config.aramkit_version_file
         self.resources_directory.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
 
@@ -135,7 +137,7 @@ class AramkitCrawler(BaseCrawler):
 
     def batch_crawl(self, start_id: int = 1, end_id: int = 999) -> dict[str, bool]:
         """
-        批量爬取多个英雄数据
+        批量爬取多个英雄数据，完成后按数据版本归档（需先经 ``crawl`` 发现 ``data_version``）
 
         Args:
             start_id: 起始英雄ID
@@ -166,11 +168,16 @@ class AramkitCrawler(BaseCrawler):
         self.logger.info(
             f"批量爬取完成，共成功 {len(results) - fail_count} 个英雄；共失败 {fail_count} 个英雄ID: {failed_ids}"
         )
+        self.archive_batch(results)
         return results
 
+    def archive_key(self) -> tuple[str, str, str]:
+        """aramkit 以 ``discover_versions`` 发现的数据版本归档。"""
+        return "aramkit", self.dataset, self.data_version
+
     def crawl(self, start_id: int = 1, end_id: int = 999) -> bool:
         """
-        完整爬取流程：版本发现 → 资源文件 → 批量英雄数据
+        完整爬取流程：版本发现 → 资源文件 → 批量英雄数据（结束后按数据版本归档）
 
         Args:
             start_id: 起始英雄ID
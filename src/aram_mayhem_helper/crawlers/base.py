@@ -7,6 +7,7 @@ from typing import Any
 
 import requests
 
+from aram_mayhem_helper.utils.archive import StatsArchive
 from aram_mayhem_helper.utils.retry import retry_on_exception
 
 
@@ -19,6 +20,7 @@ class BaseCrawler:
         save_directory: 默认保存目录
         base_url: URL 模板（子类可自行管理 URL）
         user_agent: 请求 UA
+        archive: 历史归档（批量爬取后经 ``archive_batch`` 归档），None 不归档
     """
 
     def __init__(
@@ -29,11 +31,13 @@ class BaseCrawler:
         save_directory: Path,
         base_url: str = "",
         user_agent: str = "",
+        archive: StatsArchive | None = None,
     ) -> None:
         self.timeout = timeout
         self.delay_second = delay_second
         self.save_directory = save_directory
         self.base_url = base_url
+        self.archive = archive
         self.session = requests.Session()
         if user_agent:
             self.session.headers.update({"User-Agent": user_agent})
@@ -93,6 +97,34 @@ class BaseCrawler:
             self.logger.error(f"保存文件时发生错误: {str(e)}")
             return False
 
+    def archive_saved(self, archive: StatsArchive, source: str, dataset: str, version: str) -> bool:
+        """把保存目录中当前的英雄文件归档为 ``version``；归档失败只记录日志，不影响爬取结果。
+
+        Returns:
+            归档成功返回 True，否则返回 False
+        """
+        try:
+            archive.record(source, dataset, version, self.save_directory)
+            return True
+        except (OSError, ValueError) as e:  # ValueError 含清单损坏与 JSONDecodeError
+            self.logger.error(f"归档爬取数据失败: {source}/{dataset} 版本 {version}, 错误: {str(e)}")
+            return False
+
+    def archive_key(self) -> tuple[str, str, str] | None:
+        """本次批量爬取的归档键 (数据源, 数据集, 版本)；None 表示不归档（子类覆盖）。"""
+        return None
+
+    def archive_batch(self, results: dict[str, bool]) -> bool:
+        """批量爬取结束后的统一归档钩子：有英雄爬取成功时把保存目录归档为 ``archive_key()`` 的版本。
+
+        Returns:
+            已归档返回 True；未配置归档、无归档键、无成功结果或归档失败返回 False
+        """
+        key = self.archive_key()
+        if self.archive is None or key is None or not any(results.values()):
+            return False
+        return self.archive_saved(self.archive, *key)
+
     def crawl_and_save(self, url: str, filename: str, params: dict[str, Any] | None = None) -> bool:
         """拉取 URL 数据并保存到本地。
 
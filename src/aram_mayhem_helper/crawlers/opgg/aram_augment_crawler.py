@@ -2,8 +2,10 @@
 
 import logging
 import time
+from datetime import date
 
 from aram_mayhem_helper.crawlers.base import BaseCrawler
+from aram_mayhem_helper.utils.archive import StatsArchive
 from aram_mayhem_helper.utils.config import AppConfig, get_config
 from aram_mayhem_helper.utils.data import get_game_data
 
@@ -23,12 +25,13 @@ class AramAugmentCrawler(BaseCrawler):
             save_directory=app_config.opgg_augment_dir,
             base_url=app_config.crawler.opgg_augment.base_url,
             user_agent=app_config.crawler.user_agent,
+            archive=StatsArchive(app_config.archive_dir),
         )
         self.logger = logging.getLogger(__name__)
 
     def batch_crawl(self, start_id: int = 1, end_id: int = 999) -> dict[str, bool]:
         """
-        批量爬取多个英雄的符文数据。
+        批量爬取多个英雄的符文数据，完成后以爬取日期为版本归档（OP.GG 无数据版本号）。
 
         Args:
             start_id: 起始英雄ID
@@ -59,8 +62,13 @@ class AramAugmentCrawler(BaseCrawler):
         self.logger.info(
             f"批量爬取完成，共成功 {len(results) - fail_count} 个英雄；共失败 {fail_count} 个英雄ID: {failed_ids}"
         )
+        self.archive_batch(results)
         return results
 
+    def archive_key(self) -> tuple[str, str, str]:
+        """OP.GG 无数据版本号，以爬取日期为版本。"""
+        return "opgg", "all", date.today().isoformat()
+
 
 if __name__ == "__main__":
     crawler = AramAugmentCrawler()
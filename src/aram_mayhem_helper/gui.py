@@ -6,16 +6,18 @@ import threading
 import time
 import tkinter as tk
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import scrolledtext, ttk
 
-from aram_mayhem_helper.algorithm.suggest import Suggest
+from aram_mayhem_helper.algorithm.suggest import Suggest, get_suggest_cache
 from aram_mayhem_helper.crawlers.aramkit.aramkit_crawler import AramkitCrawler
 from aram_mayhem_helper.crawlers.ddragon.champion_crawler import ChampionCrawler
 from aram_mayhem_helper.crawlers.opgg.aram_augment_crawler import AramAugmentCrawler
+from aram_mayhem_helper.league_client_api.game_watcher import GameStateWatcher
 from aram_mayhem_helper.league_client_api.live_data import get_current_champion_name
 from aram_mayhem_helper.ocr.ocr_tool import get_ocr_tool, save_unrecognized_capture
-from aram_mayhem_helper.utils.config import VALID_SOURCES, get_config, set_data_source
-from aram_mayhem_helper.utils.data import get_game_data
+from aram_mayhem_helper.utils.config import BLENDED_SOURCE, SCORING_SOURCES, get_config, set_data_source
+from aram_mayhem_helper.utils.data import GameData, get_game_data
 from aram_mayhem_helper.utils.log_config import setup_logging
 
 
@@ -102,45 +104,68 @@ def recognize_augment(
 def _recognize_worker(source: str) -> None:
     """后台执行：识别当前英雄 → OCR 读取符文 → 生成推荐。
 
+    截图 + OCR 与英雄识别/打分互不依赖，前者提交到独立线程并发执行，
+    在 ``suggest.suggest`` 处汇合，总耗时取两支中较长者而非两者之和。
+    后台监视器已为当前对局预构建 Suggest 时直接取用，否则现场识别英雄并构建。
+
     不变式：本函数内的数据源一律显式传入（available_source 的 preferred /
     Suggest.source），使用 GUI 当前选择而非隐式默认。
     """
     game_data = get_game_data()
 
-    try:
-        champion_name = get_current_champion_name()
-        if not champion_name:
-            logger.error("无法获取当前英雄名称，请确保游戏正在运行")
-            return
-        champion_id = game_data.champion_id_by_name(champion_name)
-        if not champion_id:
-            logger.error(f"无法找到英雄 '{champion_name}' 对应的ID")
-            return
-        resolved = game_data.available_source(champion_id, preferred=source)
-        if resolved is None:
-            logger.error(f"英雄ID {champion_id} ({champion_name}) 在数据源 {source} 与另一源中都没有符文数据")
-            return
-        if resolved != source:
-            logger.warning(f"数据源 {source} 无该英雄的符文数据，已回退使用 {resolved}")
-        suggest = Suggest(champion_id, game_data, source=resolved, thresholds=get_config().suggest)
-        logger.info(f"当前英雄：{champion_name}（数据源: {resolved}）")
-    except Exception as e:
-        logger.error(f"识别英雄出错：{str(e)}")
-        return
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr") as pool:
+        ocr_future = pool.submit(lambda: get_ocr_tool().get_augments())
 
-    augments = None
-    try:
-        augments = get_ocr_tool().get_augments()
-        augments_info = suggest.suggest(augments, on_unrecognized=save_unrecognized_capture)
-        if augments_info:
-            for augment_info in augments_info:
-                logger.info(str(augment_info))
+        prepared = _game_watcher.prepared(source) if _game_watcher is not None else None
+        suggest: Suggest | None
+        if prepared is not None:
+            suggest = prepared.suggest
+            if prepared.source != source:
+                logger.warning(f"数据源 {source} 无该英雄的符文数据，已回退使用 {prepared.source}")
+            logger.info(f"当前英雄：{prepared.champion_name}（数据源: {prepared.source}）")
         else:
-            logger.warning("未能生成任何符文建议（OCR 名称未匹配到当前英雄的符文数据）")
-    except Exception as e:
-        logger.error(f"「识别符文」操作出错：{str(e)}")
-        if augments is not None:
-            logger.info(str(augments))
+            try:
+                suggest = _build_suggest(game_data, source)
+            except Exception as e:
+                logger.error(f"识别英雄出错：{str(e)}")
+                return
+            if suggest is None:
+                return
+
+        augments = None
+        try:
+            augments = ocr_future.result()
+            augments_info = suggest.suggest(augments, on_unrecognized=save_unrecognized_capture)
+            if augments_info:
+                for augment_info in augments_info:
+                    logger.info(str(augment_info))
+            else:
+                logger.warning("未能生成任何符文建议（OCR 名称未匹配到当前英雄的符文数据）")
+        except Exception as e:
+            logger.error(f"「识别符文」操作出错：{str(e)}")
+            if augments is not None:
+                logger.info(str(augments))
+
+
+def _build_suggest(game_data: GameData, source: str) -> Suggest | None:
+    """现场识别当前英雄并构建 Suggest（监视器未就绪时的回退路径），失败记日志并返回 None。"""
+    champion_name = get_current_champion_name()
+    if not champion_name:
+        logger.error("无法获取当前英雄名称，请确保游戏正在运行")
+        return None
+    champion_id = game_data.champion_id_by_name(champion_name)
+    if not champion_id:
+        logger.error(f"无法找到英雄 '{champion_name}' 对应的ID")
+        return None
+    resolved = game_data.available_source(champion_id, preferred=source)
+    if resolved is None:
+        logger.error(f"英雄ID {champion_id} ({champion_name}) 在数据源 {source} 与另一源中都没有符文数据")
+        return None
+    if resolved != source:
+        logger.warning(f"数据源 {source} 无该英雄的符文数据，已回退使用 {resolved}")
+    suggest = get_suggest_cache().get(champion_id, game_data, source=resolved, thresholds=get_config().suggest)
+    logger.info(f"当前英雄：{champion_name}（数据源: {resolved}）")
+    return suggest
 
 
 def _warmup_ocr() -> None:
@@ -150,6 +175,7 @@ def _warmup_ocr() -> None:
 
 # ====================== 第三步：后台任务（后台线程 + 日志桥接） ======================
 _task_in_progress = False
+_game_watcher: GameStateWatcher | None = None  # 对局状态监视器（create_gui 启动，关闭窗口时停止）
 
 
 def _poll_log_queue(
@@ -271,12 +297,23 @@ def _reload_data_after_crawl(log_area: scrolledtext.ScrolledText) -> Callable[[]
     """爬取完成后在主线程刷新数据缓存。"""
 
     def _reload() -> None:
-        print_log("数据抓取完成，正在重新加载数据...", log_area)
-        try:
-            get_game_data().reload()
-            print_log("数据已重新加载，新数据已生效", log_area)
-        except Exception as e:
-            print_log(f"数据重新加载失败：{e}", log_area)
+        print_log("数据抓取完成，正在后台重新加载数据...", log_area)
+        # 新快照在后台线程中解析完成后才替换旧数据，期间界面与推荐继续使用旧数据
+        future = get_game_data().reload_async()
+
+        def _check() -> None:
+            if not future.done():
+                log_area.after(100, _check)
+                return
+            try:
+                future.result()
+                if _game_watcher is not None:
+                    _game_watcher.invalidate()  # 预构建的 Suggest 基于旧数据，丢弃后由下一轮轮询重建
+                print_log("数据已重新加载，新数据已生效", log_area)
+            except Exception as e:
+                print_log(f"数据重新加载失败：{e}", log_area)
+
+        _check()
 
     return _reload
 
@@ -291,21 +328,24 @@ def fetch_augment_data(
     """Fetch augment data from the selected source in a background thread.
 
     aramkit 走完整爬取流程（版本发现 + 资源文件 + 批量英雄数据）；
-    opgg 走批量英雄数据抓取。
+    opgg 走批量英雄数据抓取；融合源依次抓取两个数据源。
     """
 
-    def _crawl() -> None:
-        if source == "aramkit":
-            try:
-                success = AramkitCrawler().crawl(start_page, end_page)
-            except RuntimeError as e:  # 版本发现失败（首页抓取失败且无本地缓存）
-                logger.error(f"aramkit 符文数据抓取失败：{e}")
-                return
-            if success:
-                logger.info("符文数据抓取完成（aramkit）：全部英雄成功")
-            else:
-                logger.warning("符文数据抓取完成（aramkit）：部分英雄失败")
+    def _crawl_aramkit() -> None:
+        try:
+            success = AramkitCrawler().crawl(start_page, end_page)
+        except RuntimeError as e:  # 版本发现失败（首页抓取失败且无本地缓存）
+            logger.error(f"aramkit 符文数据抓取失败：{e}")
+            return
+        if success:
+            logger.info("符文数据抓取完成（aramkit）：全部英雄成功")
         else:
+            logger.warning("符文数据抓取完成（aramkit）：部分英雄失败")
+
+    def _crawl() -> None:
+        if source in ("aramkit", BLENDED_SOURCE):
+            _crawl_aramkit()
+        if source != "aramkit":
             crawler = AramAugmentCrawler()
             results = crawler.batch_crawl(start_page, end_page)
             success_count = sum(1 for v in results.values() if v)
@@ -327,6 +367,7 @@ def fetch_augment_data(
 
 # ====================== 第四步：创建完整GUI（按钮+日志区域） ======================
 def create_gui() -> None:
+    global _game_watcher
     _enable_dpi_awareness()
 
     root = tk.Tk()
@@ -386,7 +427,7 @@ def create_gui() -> None:
     source_combo = ttk.Combobox(
         source_row,
         textvariable=source_var,
-        values=VALID_SOURCES,
+        values=SCORING_SOURCES,
         state="readonly",
         width=10,
     )
@@ -397,6 +438,9 @@ def create_gui() -> None:
         new_source = source_var.get()
         try:
             set_data_source(new_source)
+            get_suggest_cache().clear()
+            if _game_watcher is not None:
+                _game_watcher.set_source(new_source)
             print_log(f"数据源已切换并持久化: {new_source}", log_area)
         except (ValueError, OSError) as e:
             print_log(f"数据源切换失败: {e}（已恢复原设置）", log_area)
@@ -482,8 +526,14 @@ def create_gui() -> None:
     # 后台预热 PaddleOCR 模型：首次初始化需数秒，预热后首次识别不再卡顿（静默执行）
     threading.Thread(target=_warmup_ocr, daemon=True).start()
 
+    # 后台监视对局：识别到英雄即预构建 Suggest，点击「识别符文」时只剩 OCR + 查表
+    _game_watcher = GameStateWatcher(source_var.get())
+    _game_watcher.start()
+
     # 窗口关闭时清理日志 handler，避免资源泄漏
     def _on_closing() -> None:
+        if _game_watcher is not None:
+            _game_watcher.stop(timeout=1)
         app_logger = logging.getLogger("aram_mayhem_helper")
         for h in list(app_logger.handlers):
             if isinstance(h, TkinterLogHandler):
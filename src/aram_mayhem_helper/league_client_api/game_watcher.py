@@ -0,0 +1,142 @@
+"""对局状态后台监视：轮询 Live Client API，识别到英雄后提前构建 Suggest。"""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from aram_mayhem_helper.algorithm.suggest import Suggest, SuggestCache, get_suggest_cache
+from aram_mayhem_helper.league_client_api.live_data import LiveClientData, get_live_client
+from aram_mayhem_helper.utils.config import SuggestConfig, get_config
+from aram_mayhem_helper.utils.data import GameData, get_game_data
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PreparedSuggest:
+    """监视器为当前对局预构建的推荐上下文。"""
+
+    champion_name: str
+    champion_id: str
+    preferred_source: str  # 构建时的首选数据源（GUI 当前选择）
+    source: str  # 实际使用的数据源（首选缺数据时回退另一源）
+    suggest: Suggest
+
+
+class GameStateWatcher:
+    """后台轮询对局英雄，英雄确定后立即解析 ID、探测数据源并构建 ``Suggest``。
+
+    点击「识别符文」时调用方通过 :meth:`prepared` 直接取用预构建结果，
+    只剩 OCR 与 O(1) 查表；未命中（尚未轮询到/数据源已切换）时由调用方走原流程。
+
+    Args:
+        source: 初始首选数据源
+        client: Live Client 客户端，None 取全局单例
+        game_data: 数据仓储提供器
+        thresholds: 推荐阈值提供器（每次构建时读取，跟随配置重建）
+        cache: Suggest 实例缓存，None 取全局单例（与 GUI 现场构建共享）
+        interval: 轮询间隔（秒）
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        client: LiveClientData | None = None,
+        game_data: Callable[[], GameData] = get_game_data,
+        thresholds: Callable[[], SuggestConfig] = lambda: get_config().suggest,
+        cache: SuggestCache | None = None,
+        interval: float = 2.0,
+    ) -> None:
+        self._client = client or get_live_client()
+        self._cache = cache if cache is not None else get_suggest_cache()
+        self._game_data = game_data
+        self._thresholds = thresholds
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._source = source
+        self._prepared: PreparedSuggest | None = None
+        self._generation = 0  # invalidate/set_source 递增，丢弃构建期间已过期的结果
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ── 生命周期 ────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """启动后台守护线程（重复调用无副作用）。"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="game-state-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """通知线程退出并等待（最多 ``timeout`` 秒）。"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:  # 后台线程不能因单次失败退出
+                logger.debug(f"对局状态轮询失败: {e}")
+            self._stop_event.wait(self.interval)
+
+    # ── 状态 ────────────────────────────────────────────────────────────
+
+    def set_source(self, source: str) -> None:
+        """切换首选数据源；与已预构建结果不一致时丢弃，下一轮重新构建。"""
+        with self._lock:
+            if source != self._source:
+                self._source = source
+                self._generation += 1
+            if self._prepared is not None and self._prepared.preferred_source != source:
+                self._prepared = None
+
+    def invalidate(self) -> None:
+        """丢弃预构建结果（数据重新加载后调用）。"""
+        with self._lock:
+            self._prepared = None
+            self._generation += 1
+
+    def prepared(self, source: str) -> PreparedSuggest | None:
+        """返回首选数据源为 ``source`` 的预构建结果，未就绪时返回 None。"""
+        with self._lock:
+            prepared = self._prepared
+        if prepared is None or prepared.preferred_source != source:
+            return None
+        return prepared
+
+    def poll_once(self) -> PreparedSuggest | None:
+        """执行一轮轮询：对局英雄变化或数据源切换时重建，返回当前预构建结果。"""
+        champion_name = self._client.current_champion_name(log_errors=False)
+        with self._lock:
+            source = self._source
+            current = self._prepared
+            generation = self._generation
+        if not champion_name:
+            with self._lock:
+                self._prepared = None
+            return None
+        if current is not None and current.champion_name == champion_name and current.preferred_source == source:
+            return current
+
+        game_data = self._game_data()
+        champion_id = game_data.champion_id_by_name(champion_name)
+        if not champion_id:
+            return None
+        resolved = game_data.available_source(champion_id, preferred=source)
+        if resolved is None:
+            return None
+        suggest = self._cache.get(champion_id, game_data, source=resolved, thresholds=self._thresholds())
+        prepared = PreparedSuggest(champion_name, champion_id, source, resolved, suggest)
+        with self._lock:
+            if self._generation != generation:  # 构建期间数据源切换或数据重载，丢弃本轮结果
+                return None
+            self._prepared = prepared
+        logger.debug(f"已预构建推荐：{champion_name}（ID {champion_id}，数据源 {resolved}）")
+        return prepared
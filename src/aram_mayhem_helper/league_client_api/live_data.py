@@ -1,56 +1,129 @@
 import logging
+import threading
+from typing import Any
 
 import requests
 import urllib3
 
 logger = logging.getLogger(__name__)
 
+# Live Client Data API 地址（固定端口 2999）
+LIVE_CLIENT_BASE_URL = "https://127.0.0.1:2999/liveclientdata"
 
-def get_current_champion_name() -> str | None:
-    """
-    获取正在运行的对局中自己的英雄 ID 和名称
-    :return: champion_name 或 None
+
+class LiveClientData:
+    """Live Client Data API 客户端：复用连接池并缓存本局英雄。
+
+    - 持有一个 ``requests.Session``（keep-alive），避免每次查询重新建连与 TLS 握手
+    - 只请求轻量端点 ``activeplayername`` + ``playerlist``，不拉取含全部事件的 ``allgamedata``
+    - 解析出的英雄名在本局内缓存；每次查询先读 ``gamestats`` 的 ``gameTime``，
+      时间回退（新对局从 0 开始计时）或连接失败时失效缓存
+
+    Args:
+        base_url: API 根地址（测试/桩服务器可覆盖）
+        timeout: 单次请求超时（秒）
+        session: 注入的会话（测试用），None 时新建
     """
-    # Live Client Data API 地址（固定端口 2999）
-    base_url = "https://127.0.0.1:2999/liveclientdata/allgamedata"
-
-    # 禁用 SSL 警告（游戏客户端用自签名证书，收敛到函数内避免模块导入副作用）
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-    try:
-        # 1. 获取当前活跃玩家数据
-        active_player_resp = requests.get(
-            base_url,
-            verify=False,  # 忽略证书验证
-            timeout=2,
-        )
-        active_player_resp.raise_for_status()  # 检查请求是否成功
-        all_data = active_player_resp.json()
-
-        # 2. 提取用户riotId（召唤师名称）
-        active_player = all_data.get("activePlayer") or {}
-        riot_id = active_player.get("riotId")
-        if not riot_id:
+
+    def __init__(
+        self,
+        base_url: str = LIVE_CLIENT_BASE_URL,
+        *,
+        timeout: float = 2,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self._lock = threading.Lock()
+        self._champion_name: str | None = None
+        self._game_time: float | None = None
+
+    def _get_json(self, endpoint: str) -> Any:
+        """请求 ``{base_url}/{endpoint}`` 并返回解析后的 JSON。"""
+        # 游戏客户端用自签名证书：禁用 SSL 警告（收敛到调用处避免模块导入副作用）
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # verify 逐请求传入：Session.verify 会被 REQUESTS_CA_BUNDLE 等环境变量覆盖
+        response = self.session.get(f"{self.base_url}/{endpoint}", verify=False, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def game_time(self) -> float | None:
+        """当前对局时间（秒），响应缺少 ``gameTime`` 时返回 None；请求异常照常抛出。"""
+        stats = self._get_json("gamestats")
+        value = stats.get("gameTime") if isinstance(stats, dict) else None
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def _resolve_champion_name(self) -> str | None:
+        """通过 activeplayername + playerlist 解析自己的英雄名（不读缓存）。"""
+        riot_id = self._get_json("activeplayername")
+        if not riot_id or not isinstance(riot_id, str):
             logger.error("未获取到riotId")
             return None
 
         raw_champion_name = None
-        # 3.找到自己的英雄名称（通过 summonerName 匹配）
-        all_players = all_data.get("allPlayers") or []
-        for player in all_players:
-            if player.get("riotId") == riot_id:
+        for player in self._get_json("playerlist") or []:
+            # 新版客户端 activeplayername 返回 riotId，旧版返回 summonerName
+            if riot_id in (player.get("riotId"), player.get("summonerName")):
                 raw_champion_name = player.get("rawChampionName")
                 break
+        return raw_champion_name and raw_champion_name.split("_")[-1]
+
+    def invalidate(self) -> None:
+        """清空本局英雄缓存。"""
+        with self._lock:
+            self._champion_name = None
+            self._game_time = None
 
-        champion_name = raw_champion_name and raw_champion_name.split("_")[-1]
-        return champion_name
+    def current_champion_name(self, *, log_errors: bool = True) -> str | None:
+        """获取正在运行的对局中自己的英雄名称（本局内缓存），失败返回 None。
 
-    except requests.exceptions.ConnectionError:
-        logger.error('无法连接到游戏客户端，请确保：\n1. 已进入对局\n2. 已开启"允许第三方应用访问游戏数据"')
-        return None
-    except Exception as e:
-        logger.error(f"获取数据失败: {str(e)}")
-        return None
+        Args:
+            log_errors: 为 False 时连接失败等错误只记 DEBUG（后台轮询未进对局时避免刷屏）
+        """
+        try:
+            game_time = self.game_time()
+            with self._lock:
+                cached = self._champion_name
+                if cached is not None and game_time is not None and self._game_time is not None:
+                    if game_time >= self._game_time:
+                        self._game_time = game_time
+                        return cached
+            champion_name = self._resolve_champion_name()
+            with self._lock:
+                self._champion_name = champion_name
+                self._game_time = game_time if champion_name else None
+            return champion_name
+        except requests.exceptions.ConnectionError:
+            self.invalidate()
+            if log_errors:
+                logger.error('无法连接到游戏客户端，请确保：\n1. 已进入对局\n2. 已开启"允许第三方应用访问游戏数据"')
+            else:
+                logger.debug("无法连接到游戏客户端")
+            return None
+        except Exception as e:
+            self.invalidate()
+            logger.log(logging.ERROR if log_errors else logging.DEBUG, f"获取数据失败: {str(e)}")
+            return None
+
+
+_live_client_singleton: LiveClientData | None = None
+
+
+def get_live_client() -> LiveClientData:
+    """懒加载 LiveClientData 单例（会话与本局英雄缓存跨调用复用）。"""
+    global _live_client_singleton
+    if _live_client_singleton is None:
+        _live_client_singleton = LiveClientData()
+    return _live_client_singleton
+
+
+def get_current_champion_name() -> str | None:
+    """
+    获取正在运行的对局中自己的英雄名称
+    :return: champion_name 或 None
+    """
+    return get_live_client().current_champion_name()
 
 
 # ================= 调用示例 =================
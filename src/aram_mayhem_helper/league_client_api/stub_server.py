@@ -0,0 +1,343 @@
+"""Live Client Data API 本地替身服务器：无游戏环境下的端到端测试与推荐流程压测。
+
+所有端点均由一份 ``allgamedata`` 载荷派生（``activeplayer``/``activeplayername``/
+``playerlist``/``gamestats``），对局时间随服务器运行时长推进；支持注入固定延迟与
+按概率返回 503，模拟客户端加载中/卡顿。默认 HTTPS + 自签名证书（由 ``openssl``
+命令行生成），与真实客户端的 ``https://127.0.0.1:2999`` 行为一致。
+"""
+
+import json
+import logging
+import random
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from aram_mayhem_helper.algorithm.suggest import Suggest
+from aram_mayhem_helper.league_client_api.live_data import LiveClientData
+from aram_mayhem_helper.utils.config import SuggestConfig
+from aram_mayhem_helper.utils.data import GameData
+
+logger = logging.getLogger(__name__)
+
+_API_PREFIX = "/liveclientdata/"
+
+
+def build_game_payload(
+    champion_name: str,
+    *,
+    riot_id: str = "召唤师#CN1",
+    game_time: float = 60.0,
+    teammates: tuple[str, ...] = ("Annie", "Ashe", "Garen", "Lux"),
+) -> dict[str, Any]:
+    """构造与真实客户端结构一致的最小 ``allgamedata`` 载荷（自己 + 4 名队友）。"""
+    players = [
+        {
+            "championName": name,
+            "rawChampionName": f"game_character_displayname_{name}",
+            "riotId": riot_id if idx == 0 else f"队友{idx}#CN1",
+            "summonerName": riot_id.split("#")[0] if idx == 0 else f"队友{idx}",
+            "team": "ORDER",
+            "level": 3,
+            "isBot": False,
+            "isDead": False,
+            "items": [],
+            "scores": {"kills": 0, "deaths": 0, "assists": 0, "creepScore": 0, "wardScore": 0.0},
+        }
+        for idx, name in enumerate((champion_name, *teammates))
+    ]
+    return {
+        "activePlayer": {
+            "riotId": riot_id,
+            "summonerName": riot_id.split("#")[0],
+            "level": 3,
+            "currentGold": 1400.0,
+        },
+        "allPlayers": players,
+        "events": {"Events": [{"EventID": 0, "EventName": "GameStart", "EventTime": 0.0}]},
+        "gameData": {
+            "gameMode": "ARAM",
+            "gameTime": game_time,
+            "mapName": "Map12",
+            "mapNumber": 12,
+            "mapTerrain": "Default",
+        },
+    }
+
+
+def load_game_payload(path: Path) -> dict[str, Any]:
+    """读取 ``allgamedata`` 载荷文件（如从真实客户端抓取的样本）。"""
+    with open(path, "r", encoding="utf-8") as f:
+        payload: dict[str, Any] = json.load(f)
+    return payload
+
+
+def generate_self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    """用 ``openssl`` 命令行在 ``directory`` 下生成 127.0.0.1 自签名证书，返回 (cert, key)。
+
+    Raises:
+        RuntimeError: 未找到 openssl 或生成失败
+    """
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        raise RuntimeError("未找到 openssl 命令，无法生成自签名证书（可改用 --certfile/--keyfile 或 --no-tls）")
+    certfile = directory / "stub-cert.pem"
+    keyfile = directory / "stub-key.pem"
+    try:
+        subprocess.run(
+            [
+                openssl,
+                "req",
+                "-x509",
+                "-newkey",
+                "rsa:2048",
+                "-nodes",
+                "-days",
+                "1",
+                "-subj",
+                "/CN=127.0.0.1",
+                "-keyout",
+                str(keyfile),
+                "-out",
+                str(certfile),
+            ],
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"生成自签名证书失败: {e.stderr.decode(errors='replace').strip()}") from e
+    return certfile, keyfile
+
+
+class LiveClientStub:
+    """Live Client Data API 替身服务器（后台线程运行，可用作上下文管理器）。
+
+    Args:
+        payload: ``allgamedata`` 载荷，各端点由其派生
+        host: 监听地址
+        port: 监听端口（0 = 随机空闲端口，真实客户端固定 2999）
+        latency: 每个请求的固定延迟（秒）
+        failure_rate: 按此概率返回 503（[0, 1]）
+        tls: 是否启用 HTTPS
+        certfile: 证书路径；启用 TLS 且未提供时自动生成自签名证书
+        keyfile: 私钥路径
+        seed: 故障注入随机种子（压测可复现）
+    """
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 2999,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        tls: bool = True,
+        certfile: Path | None = None,
+        keyfile: Path | None = None,
+        seed: int | None = None,
+    ) -> None:
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError(f"failure_rate 必须在 [0, 1] 区间: {failure_rate}")
+        self.payload = payload
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.tls = tls
+        self._certfile = certfile
+        self._keyfile = keyfile
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._base_game_time = float((payload.get("gameData") or {}).get("gameTime", 0.0))
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._cert_dir: tempfile.TemporaryDirectory[str] | None = None
+        self.request_count = 0
+
+    # ── 生命周期 ────────────────────────────────────────────────────────
+
+    @property
+    def base_url(self) -> str:
+        """``LiveClientData`` 可直接使用的 API 根地址。"""
+        scheme = "https" if self.tls else "http"
+        return f"{scheme}://{self.host}:{self.port}/liveclientdata"
+
+    def start(self) -> str:
+        """绑定端口并在守护线程中开始服务，返回 ``base_url``。"""
+        context: ssl.SSLContext | None = None
+        if self.tls:
+            certfile, keyfile = self._certfile, self._keyfile
+            if certfile is None or keyfile is None:
+                self._cert_dir = tempfile.TemporaryDirectory(prefix="live-client-stub-")
+                certfile, keyfile = generate_self_signed_cert(Path(self._cert_dir.name))
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile, keyfile)
+        server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        server.daemon_threads = True
+        if context is not None:
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+        self.port = server.server_address[1]
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="live-client-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"Live Client 替身服务器已启动: {self.base_url}")
+        return self.base_url
+
+    def stop(self) -> None:
+        """停止服务并清理自动生成的证书。"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._cert_dir is not None:
+            self._cert_dir.cleanup()
+            self._cert_dir = None
+
+    def __enter__(self) -> "LiveClientStub":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # ── 对局状态 ────────────────────────────────────────────────────────
+
+    def game_time(self) -> float:
+        """载荷中的初始对局时间 + 服务器运行时长。"""
+        return round(self._base_game_time + time.monotonic() - self._started_at, 3)
+
+    def reset_game(self, payload: dict[str, Any] | None = None) -> None:
+        """模拟进入新对局：对局时间从 0 重新计时，可同时替换载荷（如换英雄）。"""
+        if payload is not None:
+            self.payload = payload
+        self._base_game_time = 0.0
+        self._started_at = time.monotonic()
+
+    def count_request(self) -> None:
+        with self._random_lock:
+            self.request_count += 1
+
+    def should_fail(self) -> bool:
+        if self.failure_rate <= 0:
+            return False
+        with self._random_lock:
+            return self._random.random() < self.failure_rate
+
+    def resolve(self, endpoint: str) -> Any:
+        """端点名 → 响应体；未知端点返回 None。"""
+        payload = self.payload
+        game_data = {**(payload.get("gameData") or {}), "gameTime": self.game_time()}
+        active_player = payload.get("activePlayer") or {}
+        routes: dict[str, Any] = {
+            "allgamedata": {**payload, "gameData": game_data},
+            "activeplayer": active_player,
+            "activeplayername": active_player.get("riotId", ""),
+            "playerlist": payload.get("allPlayers") or [],
+            "gamestats": game_data,
+            "eventdata": payload.get("events") or {"Events": []},
+        }
+        return routes.get(endpoint)
+
+
+def _make_handler(stub: LiveClientStub) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive，与真实客户端一致
+        disable_nagle_algorithm = True  # 头与体分两次写出，避免 Nagle + 延迟 ACK 的 ~40ms 停顿
+
+        def do_GET(self) -> None:
+            stub.count_request()
+            if stub.latency > 0:
+                time.sleep(stub.latency)
+            path = self.path.split("?", 1)[0]
+            if stub.should_fail():
+                self._send_json(503, {"errorCode": "RPC_ERROR", "httpStatus": 503, "message": "injected failure"})
+                return
+            body = stub.resolve(path[len(_API_PREFIX) :]) if path.startswith(_API_PREFIX) else None
+            if body is None:
+                self._send_json(404, {"errorCode": "RESOURCE_NOT_FOUND", "httpStatus": 404, "message": path})
+                return
+            self._send_json(200, body)
+
+        def _send_json(self, status: int, body: Any) -> None:
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+
+    return _Handler
+
+
+# ── 推荐流程压测 ──────────────────────────────────────────────────────────
+
+
+def run_recommend_benchmark(
+    client: LiveClientData,
+    game_data: GameData,
+    *,
+    thresholds: SuggestConfig,
+    augments: list[str],
+    iterations: int,
+    cold: bool = False,
+) -> tuple[list[float], int]:
+    """重复执行「识别英雄 → 解析 ID/数据源 → 构建 Suggest → 生成推荐」（OCR 以固定名称代替）。
+
+    Args:
+        client: 指向替身服务器的 Live Client 客户端
+        game_data: 数据仓储
+        thresholds: 推荐阈值
+        augments: 模拟 OCR 输出的符文名称
+        iterations: 迭代次数
+        cold: 为 True 时每轮清空客户端的本局英雄缓存（测量完整 HTTP 路径）
+
+    Returns:
+        (成功迭代的耗时毫秒列表, 失败次数)
+    """
+    samples: list[float] = []
+    failures = 0
+    for _ in range(iterations):
+        if cold:
+            client.invalidate()
+        start = time.perf_counter()
+        champion_name = client.current_champion_name(log_errors=False)
+        champion_id = game_data.champion_id_by_name(champion_name) if champion_name else None
+        source = game_data.available_source(champion_id) if champion_id else None
+        if champion_id is None or source is None:
+            failures += 1
+            continue
+        Suggest(champion_id, game_data, source=source, thresholds=thresholds).suggest(augments)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, failures
+
+
+def summarize_latencies(samples: list[float]) -> dict[str, float]:
+    """耗时分布摘要（毫秒）：count/mean/p50/p90/p99/max。"""
+    if not samples:
+        return {"count": 0}
+    arr = np.asarray(samples)
+    p50, p90, p99 = np.percentile(arr, [50, 90, 99])
+    return {
+        "count": len(samples),
+        "mean": round(float(arr.mean()), 3),
+        "p50": round(float(p50), 3),
+        "p90": round(float(p90), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(arr.max()), 3),
+    }
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -55,18 +56,31 @@ class AramkitResources:
         self.resources_directory = resources_directory
         self.augment_id_name_dict: dict[str, dict[str, Any]] = {}
         self.augment_name_id_dict: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
 
-    def _load(self) -> None:
-        """加载最新版本子目录下的 augments.json。"""
-        if self.augment_id_name_dict:
+    def load(self) -> None:
+        """加载最新版本子目录下的 augments.json（并发首次查询只读取一次）。"""
+        if self._loaded:
             return
+        with self._lock:
+            if self._loaded:
+                return
+            id_name_dict, name_id_dict = self._read()
+            self.augment_id_name_dict = id_name_dict
+            self.augment_name_id_dict = name_id_dict
+            self._loaded = True
+
+    def _read(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        id_name_dict: dict[str, dict[str, Any]] = {}
+        name_id_dict: dict[str, dict[str, Any]] = {}
         if not self.resources_directory.exists():
-            return
+            return id_name_dict, name_id_dict
         version_dirs = [
             d for d in self.resources_directory.iterdir() if d.is_dir() and parse_version(d.name) is not None
         ]
         if not version_dirs:
-            return
+            return id_name_dict, name_id_dict
         latest_dir = max(version_dirs, key=lambda d: version_sort_key(d.name))
 
         augments_file = latest_dir / "augments.json"
@@ -83,23 +97,23 @@ class AramkitResources:
                     continue
                 level = RARITY_TO_LEVEL.get(str(info.get("rarity")), "0")
                 entry = {"name": name, "level": level}
-                self.augment_id_name_dict[aug_id] = entry
+                id_name_dict[aug_id] = entry
                 # 与 AugmentLookup 同一套 OCR 容错归一化（空格/连字符差异）
-                self.augment_name_id_dict[normalize_for_lookup(name)] = {"id": aug_id, "level": level}
+                name_id_dict[normalize_for_lookup(name)] = {"id": aug_id, "level": level}
+        return id_name_dict, name_id_dict
 
     def reload(self) -> None:
-        """清空缓存，下次查询时重新读取。"""
-        self.augment_id_name_dict = {}
-        self.augment_name_id_dict = {}
+        """标记失效，下次查询时重新读取（读取完成前查询仍使用旧表）。"""
+        self._loaded = False
 
     def get_augment_info(self, augment_id: str) -> dict[str, Any] | None:
         """根据符文 ID 获取 {"name", "level"}，未找到时返回 None。"""
-        self._load()
+        self.load()
         return self.augment_id_name_dict.get(augment_id)
 
     def get_augment_id(self, augment_name: str) -> str | None:
         """根据符文名称反查 ID（OCR 容错归一化后匹配），未找到时返回 None。"""
-        self._load()
+        self.load()
         normalized_name = normalize_for_lookup(augment_name)
         augment_info = self.augment_name_id_dict.get(normalized_name)
         if augment_info:
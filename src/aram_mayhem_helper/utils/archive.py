@@ -0,0 +1,371 @@
+"""历史数据归档：每次爬取后按数据版本记录英雄条目文件，支持跨版本趋势查询。
+
+爬虫每次都会原地覆盖 ``<英雄ID>.json``，归档在覆盖后把整个目录记录为一个版本：
+
+- ``objects/<前缀>/<sha256>.json.gz``：按内容寻址的原始数据（规范化 JSON 后 gzip），
+  与上一版本相同的英雄文件哈希相同，只在清单中多一个引用，不再占用存储
+- ``manifests/<数据源>-<数据集>.json``：按归档顺序排列的版本清单（版本 → 英雄 → 内容哈希）；
+  清单损坏时备份为 ``.corrupt`` 并报错，不会被新版本覆盖
+- ``index/<数据源>-<数据集>.npz``：列式时序索引（每个内容对象的每条符文统计一行），
+  趋势查询用 numpy 掩码筛选符文，无需解析各版本快照；新对象增量追加，无法读取的对象
+  以零行收录（只告警一次，不再重试）
+
+版本号：aramkit 取 ``discover_versions`` 发现的数据版本，OP.GG 无版本号，取爬取日期。
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from aram_mayhem_helper.utils.data import parse_augment_payload
+
+logger = logging.getLogger(__name__)
+
+_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ArchivedVersion:
+    """清单中的一个版本。"""
+
+    version: str
+    archived_at: str
+    champions: dict[str, str]  # 英雄 ID → 内容哈希
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    """一次归档的结果。"""
+
+    version: str
+    champions: int
+    new_objects: int  # 新写入的内容对象数（其余与已有版本去重）
+
+
+@dataclass(frozen=True)
+class TrendPoint:
+    """某英雄符文在一个归档版本下的统计。"""
+
+    version: str
+    archived_at: str
+    performance: float | None
+    popular: float | None
+    sample_count: int | None
+
+
+@dataclass(frozen=True)
+class _TrendIndex:
+    """列式索引：每行是某内容对象中的一条符文统计。"""
+
+    hashes: npt.NDArray[np.str_]  # 对象序号 → 内容哈希
+    blob: npt.NDArray[np.int32]
+    augment: npt.NDArray[np.str_]
+    performance: npt.NDArray[np.float64]
+    popular: npt.NDArray[np.float64]
+    sample_count: npt.NDArray[np.float64]  # 缺失为 NaN
+
+    @classmethod
+    def empty(cls) -> "_TrendIndex":
+        return cls(
+            hashes=np.array([], dtype=np.str_),
+            blob=np.array([], dtype=np.int32),
+            augment=np.array([], dtype=np.str_),
+            performance=np.array([], dtype=np.float64),
+            popular=np.array([], dtype=np.float64),
+            sample_count=np.array([], dtype=np.float64),
+        )
+
+    def extend(self, objects: dict[str, list[dict[str, Any]]]) -> "_TrendIndex":
+        """追加新内容对象的条目（已索引的对象不重复追加）。"""
+        offset = len(self.hashes)
+        blob: list[int] = []
+        augment: list[str] = []
+        performance: list[float] = []
+        popular: list[float] = []
+        sample_count: list[float] = []
+        for position, entries in enumerate(objects.values()):
+            for entry in entries:
+                if entry.get("id") is None:
+                    continue
+                blob.append(offset + position)
+                augment.append(str(entry["id"]))
+                performance.append(_as_float(entry.get("performance")))
+                popular.append(_as_float(entry.get("popular")))
+                sample_count.append(_as_float(entry.get("sampleCount")))
+        return _TrendIndex(
+            hashes=np.concatenate([self.hashes, np.array(list(objects), dtype=np.str_)]),
+            blob=np.concatenate([self.blob, np.array(blob, dtype=np.int32)]),
+            augment=np.concatenate([self.augment, np.array(augment, dtype=np.str_)]),
+            performance=np.concatenate([self.performance, np.array(performance, dtype=np.float64)]),
+            popular=np.concatenate([self.popular, np.array(popular, dtype=np.float64)]),
+            sample_count=np.concatenate([self.sample_count, np.array(sample_count, dtype=np.float64)]),
+        )
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float("nan") if value is None else float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _optional(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """同目录临时文件 + os.replace 原子写入（读取方不会看到半成品）。"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class StatsArchive:
+    """按数据版本归档的英雄条目历史（线程安全）。
+
+    Args:
+        root: 归档根目录（``AppConfig.archive_dir``）
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        self._manifests: dict[str, tuple[tuple[int, int], list[ArchivedVersion]]] = {}
+        self._indexes: dict[str, _TrendIndex] = {}
+
+    # ── 路径 ────────────────────────────────────────────────────────────
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.json.gz"
+
+    def _manifest_path(self, source: str, dataset: str) -> Path:
+        return self.root / "manifests" / f"{source}-{dataset}.json"
+
+    def _index_path(self, source: str, dataset: str) -> Path:
+        return self.root / "index" / f"{source}-{dataset}.npz"
+
+    # ── 写入 ────────────────────────────────────────────────────────────
+
+    def record(self, source: str, dataset: str, version: str, directory: Path) -> ArchiveResult:
+        """把目录中当前的全部 ``<英雄ID>.json`` 记录为 ``version``（同一版本再次归档时整体替换）。
+
+        损坏的文件跳过并记录日志；内容与已有对象相同的文件只记录引用。
+
+        Raises:
+            OSError: 归档目录不可写
+            ValueError: 已有清单损坏（已备份，不覆盖）
+        """
+        champions: dict[str, str] = {}
+        new_objects = 0
+        try:
+            scanned = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            scanned = []
+        for entry in scanned:
+            champion_id, ext = os.path.splitext(entry.name)
+            if ext != ".json" or not champion_id.isdigit() or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"归档时跳过无法读取的英雄数据文件: {entry.path}, 错误: {e}")
+                continue
+            # 规范化后再哈希：缩进/键序不同但内容相同的文件去重为同一对象
+            canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            digest = hashlib.sha256(canonical).hexdigest()
+            object_path = self._object_path(digest)
+            if not object_path.exists():
+                _write_atomic(object_path, gzip.compress(canonical, mtime=0))
+                new_objects += 1
+            champions[champion_id] = digest
+        archived = ArchivedVersion(
+            version=version, archived_at=datetime.now().isoformat(timespec="seconds"), champions=champions
+        )
+        with self._lock:
+            versions = [v for v in self._read_manifest(source, dataset) if v.version != version]
+            versions.append(archived)
+            payload_bytes = json.dumps(
+                {"versions": [asdict(v) for v in versions]}, ensure_ascii=False, indent=2
+            ).encode("utf-8")
+            _write_atomic(self._manifest_path(source, dataset), payload_bytes)
+        logger.info(f"已归档 {source}/{dataset} 版本 {version}：{len(champions)} 个英雄，新增 {new_objects} 个对象")
+        return ArchiveResult(version=version, champions=len(champions), new_objects=new_objects)
+
+    # ── 读取 ────────────────────────────────────────────────────────────
+
+    def _read_manifest(self, source: str, dataset: str) -> list[ArchivedVersion]:
+        """读取版本清单（按文件元数据缓存；调用方持有锁）。
+
+        Raises:
+            ValueError: 清单损坏（原文件保留并另存 ``.corrupt`` 备份，避免被新版本清单覆盖丢失历史）
+        """
+        path = self._manifest_path(source, dataset)
+        key = f"{source}-{dataset}"
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return []
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._manifests.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            versions = [
+                ArchivedVersion(
+                    version=str(v["version"]), archived_at=str(v["archived_at"]), champions=dict(v["champions"])
+                )
+                for v in raw.get("versions", [])
+            ]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            backup = path.with_name(path.name + ".corrupt")
+            try:
+                shutil.copy2(path, backup)
+            except OSError as copy_error:
+                logger.error(f"归档清单备份失败: {backup}, 错误: {copy_error}")
+            raise ValueError(f"归档清单损坏（已备份到 {backup}，请修复后重试）: {path}, 错误: {e}") from e
+        self._manifests[key] = (signature, versions)
+        return versions
+
+    def versions(self, source: str, dataset: str) -> list[ArchivedVersion]:
+        """已归档的版本（按归档顺序）。
+
+        Raises:
+            ValueError: 清单损坏
+        """
+        with self._lock:
+            return list(self._read_manifest(source, dataset))
+
+    def load(self, source: str, dataset: str, version: str, champion_id: str) -> dict[str, Any]:
+        """还原某版本下该英雄条目文件的原始内容。
+
+        Raises:
+            KeyError: 该版本未归档或不含该英雄
+        """
+        for archived in self.versions(source, dataset):
+            if archived.version == version and champion_id in archived.champions:
+                return self._read_object(archived.champions[champion_id])
+        raise KeyError(f"未归档: {source}/{dataset} 版本 {version} 英雄 {champion_id}")
+
+    def _read_object(self, digest: str) -> dict[str, Any]:
+        with gzip.open(self._object_path(digest), "rb") as f:
+            payload: dict[str, Any] = json.loads(f.read())
+        return payload
+
+    # ── 时序索引 ────────────────────────────────────────────────────────
+
+    def _load_index(self, source: str, dataset: str) -> _TrendIndex:
+        path = self._index_path(source, dataset)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format"]) != _INDEX_VERSION:
+                    return _TrendIndex.empty()
+                return _TrendIndex(
+                    hashes=data["hashes"],
+                    blob=data["blob"],
+                    augment=data["augment"],
+                    performance=data["performance"],
+                    popular=data["popular"],
+                    sample_count=data["sample_count"],
+                )
+        except FileNotFoundError:
+            return _TrendIndex.empty()
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"时序索引无法读取，将重新构建: {path}, 错误: {e}")
+            return _TrendIndex.empty()
+
+    def _save_index(self, source: str, dataset: str, index: _TrendIndex) -> None:
+        path = self._index_path(source, dataset)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp.npz")
+        try:
+            np.savez(
+                tmp_path,
+                format=np.int32(_INDEX_VERSION),
+                hashes=index.hashes,
+                blob=index.blob,
+                augment=index.augment,
+                performance=index.performance,
+                popular=index.popular,
+                sample_count=index.sample_count,
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug(f"时序索引写入失败（仅保留内存索引）: {path}, 错误: {e}")
+
+    def _index(self, source: str, dataset: str, versions: list[ArchivedVersion]) -> _TrendIndex:
+        """返回覆盖清单全部对象的索引；只解析索引中尚未收录的新对象（调用方持有锁）。
+
+        无法读取的对象以零行收录并随索引保存，之后的查询不再重试、也不再重写索引。
+        """
+        key = f"{source}-{dataset}"
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._load_index(source, dataset)
+        referenced = {digest for archived in versions for digest in archived.champions.values()}
+        missing = sorted(referenced - set(index.hashes.tolist()))
+        if missing:
+            objects: dict[str, list[dict[str, Any]]] = {}
+            for digest in missing:
+                try:
+                    objects[digest] = parse_augment_payload(self._read_object(digest), source) or []
+                except (OSError, EOFError, json.JSONDecodeError) as e:
+                    logger.warning(f"归档对象无法读取，已标记为损坏: {digest}, 错误: {e}")
+                    objects[digest] = []
+            index = index.extend(objects)
+            self._save_index(source, dataset, index)
+        self._indexes[key] = index
+        return index
+
+    def trend(self, source: str, dataset: str, champion_id: str, augment_id: str) -> list[TrendPoint]:
+        """该英雄符文在各归档版本下的统计（按归档顺序；该版本缺少此英雄/符文时跳过）。
+
+        Raises:
+            ValueError: 清单损坏
+        """
+        with self._lock:
+            versions = self._read_manifest(source, dataset)
+            index = self._index(source, dataset, versions)
+        mask = index.augment == str(augment_id)
+        rows = {
+            str(index.hashes[blob]): (performance, popular, sample_count)
+            for blob, performance, popular, sample_count in zip(
+                index.blob[mask], index.performance[mask], index.popular[mask], index.sample_count[mask]
+            )
+        }
+        points: list[TrendPoint] = []
+        for archived in versions:
+            row = rows.get(archived.champions.get(champion_id, ""))
+            if row is None:
+                continue
+            performance, popular, sample_count = row
+            count = _optional(sample_count)
+            points.append(
+                TrendPoint(
+                    version=archived.version,
+                    archived_at=archived.archived_at,
+                    performance=_optional(performance),
+                    popular=_optional(popular),
+                    sample_count=None if count is None else int(count),
+                )
+            )
+        return points
@@ -0,0 +1,84 @@
+"""融合数据源：按符文 ID 对齐 OP.GG 与 aramkit 的条目，按样本量加权合成一份引擎标准记录。
+
+两源尺度不同（OP.GG 表现分 0~100、aramkit 胜率 0~1），先在各自源内统一：
+- performance：源内 min-max 缩放到 [0,1]
+- popular：源内选取占比（popular / Σpopular），两源均为「该英雄对局中选此符文的比例」
+
+权重为样本量：aramkit 直接取 ``sampleCount``；OP.GG 不提供样本数，按其选取占比
+分摊与 aramkit 相同的总样本量（即视两源观测到的对局数相当）。只有一侧有数据的符文
+直接沿用该侧的缩放值。输出的 performance/popular 已在 [0,1]，进入打分流水线后
+照常按等级组 min-max 缩放。
+"""
+
+from typing import Any
+
+import numpy as np
+
+
+def _source_columns(entries: list[dict[str, Any]] | None) -> tuple[np.ndarray[Any, Any], ...]:
+    """有效条目（有 id/performance 且 popular 非 0）的 (ids, 表现, 选取占比, 样本数) 列，ids 升序去重。"""
+    rows = [
+        (str(e["id"]), float(e["performance"]), float(e["popular"]), float(e.get("sampleCount") or 0))
+        for e in entries or []
+        if e.get("id") is not None and e.get("performance") is not None and e.get("popular")
+    ]
+    ids = np.asarray([row[0] for row in rows], dtype=str)
+    ids, first = np.unique(ids, return_index=True)  # 同一符文重复出现时取首条
+    perf = np.asarray([rows[i][1] for i in first], dtype=np.float64)
+    pop = np.asarray([rows[i][2] for i in first], dtype=np.float64)
+    samples = np.asarray([rows[i][3] for i in first], dtype=np.float64)
+    if len(ids):
+        spread = perf.max() - perf.min()
+        perf = (perf - perf.min()) / spread if spread else np.zeros_like(perf)
+        pop = pop / pop.sum()
+    return ids, perf, pop, samples
+
+
+def blend_augment_records(
+    opgg_entries: list[dict[str, Any]] | None, aramkit_entries: list[dict[str, Any]] | None
+) -> list[dict[str, Any]]:
+    """把同一英雄两个数据源的条目融合为引擎标准记录（按符文 ID 升序）。
+
+    Args:
+        opgg_entries: OP.GG 条目（None/空表示该源无数据）
+        aramkit_entries: aramkit 条目（含 ``sampleCount``）
+
+    Returns:
+        ``{"id", "performance", "popular", "sampleCount"}`` 记录列表；performance/popular
+        为两源缩放值的样本量加权平均，sampleCount 为两侧权重之和（OP.GG 侧为估算值）
+    """
+    opgg_ids, opgg_perf, opgg_pop, _ = _source_columns(opgg_entries)
+    kit_ids, kit_perf, kit_pop, kit_samples = _source_columns(aramkit_entries)
+
+    total = kit_samples.sum()
+    if total <= 0:  # aramkit 缺样本数（或无数据）：两源总权重相同
+        total = 1.0
+        kit_samples = kit_pop * total
+    opgg_samples = opgg_pop * total
+
+    ids = np.union1d(opgg_ids, kit_ids)
+    perf_sum = np.zeros(len(ids))
+    pop_sum = np.zeros(len(ids))
+    weight = np.zeros(len(ids))
+    for source_ids, perf, pop, samples in (
+        (opgg_ids, opgg_perf, opgg_pop, opgg_samples),
+        (kit_ids, kit_perf, kit_pop, kit_samples),
+    ):
+        position = np.searchsorted(ids, source_ids)  # ids 为并集，源 ID 必然命中
+        perf_sum[position] += perf * samples
+        pop_sum[position] += pop * samples
+        weight[position] += samples
+
+    valid = weight > 0
+    performance = np.divide(perf_sum, weight, out=np.zeros_like(perf_sum), where=valid)
+    popular = np.divide(pop_sum, weight, out=np.zeros_like(pop_sum), where=valid)
+    return [
+        {
+            "id": int(augment_id) if augment_id.isdigit() else augment_id,
+            "performance": round(float(performance[i]), 4),
+            "popular": round(float(popular[i]), 6),
+            "sampleCount": int(round(weight[i])),
+        }
+        for i, augment_id in enumerate(ids.tolist())
+        if valid[i]
+    ]
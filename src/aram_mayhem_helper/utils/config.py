@@ -13,6 +13,11 @@ _DEFAULT_REPO_ROOT = Path(__file__).resolve().parents[3]
 _DEFAULT_CONFIG_PATH = _DEFAULT_REPO_ROOT / "config" / "config.toml"
 
 VALID_SOURCES = ("opgg", "aramkit")
+BLENDED_SOURCE = "blended"  # 两源按样本量加权融合（内存中派生，无独立数据文件）
+SCORING_SOURCES = (*VALID_SOURCES, BLENDED_SOURCE)  # 可用于打分/推荐的数据源
+VALID_STORAGE_BACKENDS = ("json", "sqlite")
+VALID_SCORERS = ("bayesian_sigmoid", "beta_binomial", "wilson")  # 贝叶斯-sigmoid / 经验贝叶斯后验 / Wilson 下界
+ARAMKIT_DATASETS = ("all", "high")  # 全体 / 高分段
 
 
 # ── 配置数据类 ────────────────────────────────────────────────────────────
@@ -63,7 +68,7 @@ class CrawlerConfig:
 
 @dataclass(frozen=True)
 class DataSourceConfig:
-    source: str  # "opgg" | "aramkit"，非法值在 load_config 时回退 "opgg"
+    source: str  # "opgg" | "aramkit" | "blended"，非法值在 load_config 时回退 "opgg"
 
 
 @dataclass(frozen=True)
@@ -73,6 +78,14 @@ class OcrConfig:
     debug_save_captures: bool = False  # 调试模式：每次识别把每个区域截图保存到日志目录
 
 
+@dataclass(frozen=True)
+class StorageConfig:
+    """符文统计存储后端：``json`` 直接读取爬虫文件，``sqlite`` 经本地数据库索引查询。"""
+
+    backend: str = "json"  # 非法值在 load_config 时回退 "json"
+    sqlite_file: str = "stats.sqlite3"  # 相对数据目录
+
+
 @dataclass(frozen=True)
 class SuggestConfig:
     shrinkage_tau_factor: float = 0.5
@@ -81,6 +94,7 @@ class SuggestConfig:
     consider_select_score_threshold: float = 0.50
     immediate_select_percentage_threshold: float = 0.10
     consider_select_percentage_threshold: float = 0.30
+    scorer: str = "bayesian_sigmoid"  # 样本量感知打分器仅作用于 aramkit 带 sampleCount 的组，其余回退贝叶斯-sigmoid
 
 
 @dataclass(frozen=True)
@@ -91,6 +105,7 @@ class AppConfig:
     data_source: DataSourceConfig
     suggest: SuggestConfig
     ocr: OcrConfig
+    storage: StorageConfig
     project_root: Path
     data_dir: Path
     config_path: Path
@@ -106,12 +121,22 @@ class AppConfig:
 
     @property
     def aramkit_augment_dir(self) -> Path:
-        return self.data_dir / self.crawler.aramkit.augment.save_directory / self.crawler.aramkit.augment.dataset
+        """配置默认数据集的 aramkit 条目目录。"""
+        return self.aramkit_dataset_dir(self.crawler.aramkit.augment.dataset)
+
+    def aramkit_dataset_dir(self, dataset: str) -> Path:
+        """指定数据集（"all"/"high"）的 aramkit 条目目录。"""
+        return self.data_dir / self.crawler.aramkit.augment.save_directory / dataset
 
     @property
     def aramkit_resources_dir(self) -> Path:
         return self.data_dir / self.crawler.aramkit.resources.save_directory
 
+    @property
+    def aramkit_version_file(self) -> Path:
+        """aramkit 爬虫记录的最新数据/资源版本号（位于配置的条目保存目录旁，随其迁移）。"""
+        return (self.data_dir / self.crawler.aramkit.augment.save_directory).parent / "version.json"
+
     @property
     def trans_file(self) -> Path:
         return self.data_dir / "augment_trans.json"
@@ -124,6 +149,16 @@ class AppConfig:
     def augment_desc_file(self) -> Path:
         return self.data_dir / "aram-mayhem-augments.zh_cn.json"
 
+    @property
+    def stats_db_file(self) -> Path:
+        """SQLite 存储后端的数据库文件。"""
+        return self.data_dir / self.storage.sqlite_file
+
+    @property
+    def archive_dir(self) -> Path:
+        """历史数据归档（每次爬取按数据版本记录，内容去重）。"""
+        return self.data_dir / "archive"
+
     @property
     def log_dir(self) -> Path:
         return self.project_root / "logs"
@@ -187,13 +222,18 @@ def load_config(*, config_path: Path | None = None, data_dir: Path | None = None
     crawler_raw = _as_section(raw, "crawler")
     suggest_raw = _as_section(raw, "suggest")
     ocr_raw = _as_section(raw, "ocr")
+    storage_raw = _as_section(raw, "storage")
 
     def suggest_float(old_key: str, new_key: str, default: float) -> float:
         # 正确拼写优先，旧拼写（precentage）回退兼容
         return float(_get(suggest_raw, new_key, default=_get(suggest_raw, old_key, default=default)))
 
     source_raw = str(_get(raw, "data_source", "source", default="opgg"))
-    source = source_raw if source_raw in VALID_SOURCES else "opgg"
+    source = source_raw if source_raw in SCORING_SOURCES else "opgg"
+    scorer_raw = str(_get(suggest_raw, "scorer", default="bayesian_sigmoid"))
+    scorer = scorer_raw if scorer_raw in VALID_SCORERS else "bayesian_sigmoid"
+    backend_raw = str(_get(storage_raw, "backend", default="json"))
+    backend = backend_raw if backend_raw in VALID_STORAGE_BACKENDS else "json"
 
     app = AppConfig(
         crawler=CrawlerConfig(
@@ -246,10 +286,15 @@ def load_config(*, config_path: Path | None = None, data_dir: Path | None = None
             consider_select_percentage_threshold=suggest_float(
                 "consider_select_precentage_threshold", "consider_select_percentage_threshold", 0.30
             ),
+            scorer=scorer,
         ),
         ocr=OcrConfig(
             debug_save_captures=bool(_get(ocr_raw, "debug_save_captures", default=False)),
         ),
+        storage=StorageConfig(
+            backend=backend,
+            sqlite_file=str(_get(storage_raw, "sqlite_file", default="stats.sqlite3")),
+        ),
         project_root=_DEFAULT_REPO_ROOT,
         data_dir=data_dir,
         config_path=config_path,
@@ -325,15 +370,15 @@ def set_data_source(source: str) -> AppConfig:
     读到新值。
 
     Args:
-        source: 数据源（"opgg"/"aramkit"）
+        source: 数据源（"opgg"/"aramkit"/"blended"）
 
     Raises:
         ValueError: source 非法，或 config.toml 缺少 [data_source].source
         OSError: 文件读取/写入失败
     """
     global _config_singleton
-    if source not in VALID_SOURCES:
-        raise ValueError(f"非法数据源 {source!r}，可选: {', '.join(VALID_SOURCES)}")
+    if source not in SCORING_SOURCES:
+        raise ValueError(f"非法数据源 {source!r}，可选: {', '.join(SCORING_SOURCES)}")
 
     current = get_config()
     if current.data_source.source == source:
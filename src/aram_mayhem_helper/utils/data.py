@@ -2,15 +2,32 @@
 
 import json
 import logging
+import threading
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from aram_mayhem_helper.utils.aramkit import AramkitResources, convert_augment_records
-from aram_mayhem_helper.utils.config import AppConfig, get_config
+from aram_mayhem_helper.utils.blend import blend_augment_records
+from aram_mayhem_helper.utils.config import ARAMKIT_DATASETS, BLENDED_SOURCE, VALID_SOURCES, AppConfig, get_config
+from aram_mayhem_helper.utils.single_flight import SingleFlight
+from aram_mayhem_helper.utils.store import StatsStore
+from aram_mayhem_helper.utils.summary import AugmentSummary, count_listed_entries
 from aram_mayhem_helper.utils.text_normalization import normalize_for_lookup
 from aram_mayhem_helper.utils.version import parse_version, version_sort_key
 
+if TYPE_CHECKING:
+    from aram_mayhem_helper.utils.archive import StatsArchive
+
+
+def parse_augment_payload(raw_data: dict[str, Any], source: str) -> list[dict[str, Any]] | None:
+    """把英雄条目文件的原始内容转换为引擎标准记录；OP.GG 文件缺少 ``data`` 字段时返回 None。"""
+    if source == "aramkit":
+        return convert_augment_records(raw_data.get("augments", {}).get("all", []))
+    data: list[dict[str, Any]] | None = raw_data.get("data")
+    return data
+
 
 class AugmentLookup:
     """翻译表（augment_trans.json）加载与名称↔ID 查询。
@@ -26,14 +43,26 @@ class AugmentLookup:
         self.id_name_dict: dict[str, dict[str, Any]] = {}
         self.name_id_dict: dict[str, dict[str, Any]] = {}
         self._name_norm_dict: dict[str, str] = {}  # 归一化名 → 原始名映射
+        self._loaded = False
+        self._lock = threading.Lock()
 
-    def _load(self) -> None:
-        if self.id_name_dict:
+    def load(self) -> None:
+        """首次查询时读取翻译表并构建索引（并发调用只读取一次）。"""
+        if self._loaded:
             return
+        with self._lock:
+            if not self._loaded:
+                self._build()
+
+    def _build(self) -> None:
+        """读取翻译表并构建索引；三张表构建完成后才发布（调用方持有锁）。"""
+        id_name_dict: dict[str, dict[str, Any]] = {}
+        name_id_dict: dict[str, dict[str, Any]] = {}
+        name_norm_dict: dict[str, str] = {}
         if self._trans_file.exists():
             try:
                 with open(self._trans_file, "r", encoding="utf-8") as f:
-                    self.id_name_dict = json.load(f)
+                    id_name_dict = json.load(f)
             except json.JSONDecodeError as e:
                 self.logger.error(f"翻译文件格式错误: {self._trans_file}, 错误: {str(e)}")
                 raise
@@ -42,7 +71,7 @@ class AugmentLookup:
                 raise
         else:
             self.logger.warning(f"未找到翻译文件: {self._trans_file}")
-        for aug_id, info in self.id_name_dict.items():
+        for aug_id, info in id_name_dict.items():
             name = info.get("name")
             level = info.get("level")
             if not name:
@@ -51,22 +80,24 @@ class AugmentLookup:
             if level is None:
                 self.logger.warning(f"翻译文件中符文 ID {aug_id}({name}) 缺少 'level' 字段，已跳过")
                 continue
-            self.name_id_dict[name] = {"id": aug_id, "level": level}
+            name_id_dict[name] = {"id": aug_id, "level": level}
             # 构建归一化名 → 原始名的索引
             norm = normalize_for_lookup(name)
-            if norm not in self._name_norm_dict:
-                self._name_norm_dict[norm] = name
+            if norm not in name_norm_dict:
+                name_norm_dict[norm] = name
+        self.id_name_dict = id_name_dict
+        self.name_id_dict = name_id_dict
+        self._name_norm_dict = name_norm_dict
+        self._loaded = True
 
     def reload(self) -> None:
-        """清空缓存并立即重新读取翻译表。"""
-        self.id_name_dict = {}
-        self.name_id_dict = {}
-        self._name_norm_dict = {}
-        self._load()
+        """立即重新读取翻译表（读取完成前查询仍使用旧表）。"""
+        with self._lock:
+            self._build()
 
     def get_augment_id(self, augment_name: str) -> str | None:
         """根据符文名称获取符文ID，支持空格/连字符的 OCR 变体容错匹配."""
-        self._load()
+        self.load()
         # 先精确匹配（快路径）
         augment_info = self.name_id_dict.get(augment_name)
         if augment_info:
@@ -84,42 +115,136 @@ class AugmentLookup:
 
     def get_augment_info(self, augment_id: str) -> dict[str, Any] | None:
         """根据符文 ID 获取翻译表条目。"""
-        self._load()
+        self.load()
         return self.id_name_dict.get(augment_id, None)
 
 
+class _Snapshot:
+    """GameData 单个数据版本的懒加载状态；``reload()`` 以新实例整体替换（单次引用赋值）。
+
+    各部分首次访问时加载：英雄表/翻译表/资源在 ``lock`` 下双重检查，符文条目按
+    (英雄, 数据源) 单飞加载，并发的冷启动请求不会重复解析同一文件。
+    """
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.lock = threading.Lock()
+        self.champion_data: dict[str, dict[str, Any]] | None = None
+        self.champion_name_by_key: dict[str, str] = {}  # key → 名称
+        self.champion_key_by_name: dict[str, str] = {}  # lower(name) → key
+        self.entries: dict[tuple[str, str, str], list[dict[str, Any]]] = {}  # (英雄, 数据源, 数据集) → 条目
+        self.entry_flights: SingleFlight[tuple[str, str, str], list[dict[str, Any]]] = SingleFlight()
+        self.lookup: AugmentLookup | None = None
+        self.resources: AramkitResources | None = None
+        self.summaries: dict[tuple[str, str], AugmentSummary] = {}  # (数据源, 数据集) → 英雄符文数摘要
+        self.base_generation = generation  # 最近一次全量重载的版本
+        self.champion_generations: dict[str, int] = {}  # 英雄 → 其条目最近变化的版本（增量失效）
+
+    def derive(self, invalidated: set[tuple[str, str]]) -> "_Snapshot":
+        """复制为下一版本快照：共享英雄表/翻译表/资源/摘要，仅丢弃失效的 (英雄, 数据源) 的各数据集条目。"""
+        snapshot = _Snapshot(self.generation + 1)
+        snapshot.champion_data = self.champion_data
+        snapshot.champion_name_by_key = self.champion_name_by_key
+        snapshot.champion_key_by_name = self.champion_key_by_name
+        # 融合条目由两源派生：任一源失效即一并丢弃
+        stale = {champion_id for champion_id, _ in invalidated}
+        snapshot.entries = {
+            key: entries
+            for key, entries in self.entries.items()
+            if key[:2] not in invalidated and not (key[1] == BLENDED_SOURCE and key[0] in stale)
+        }
+        snapshot.lookup = self.lookup
+        snapshot.resources = self.resources
+        snapshot.summaries = dict(self.summaries)
+        snapshot.base_generation = self.base_generation
+        snapshot.champion_generations = dict(self.champion_generations)
+        for champion_id, _ in invalidated:
+            snapshot.champion_generations[champion_id] = snapshot.generation
+        return snapshot
+
+
 class GameData:
     """游戏数据仓储门面：英雄元数据、符文条目（按 (champion, source) 缓存）、源感知查找。
 
     构造仅保存配置提供器，不产生任何文件读取（无导入期副作用）；全局单例通过
     ``get_config`` 提供最新配置，显式传入 ``AppConfig`` 时保留固定配置注入语义；
     ``reload()`` 清空全部缓存（含翻译表与 aramkit 资源）。
+
+    配置 ``[storage] backend = "sqlite"`` 时英雄表与符文条目经 ``StatsStore`` 读取：
+    变化的文件先增量导入数据库，再按索引查询（JSON 文件缺失/损坏时异常语义不变）。
+
+    线程安全：全部缓存状态保存在一个快照对象中，读取方法开头取一次快照引用，
+    ``reload()`` 构建（可选预热）新快照后原子换入，进行中的读取继续使用旧快照而
+    不会看到半清空的状态；``reload_async()`` 在后台线程完成同样的工作。
     """
 
     def __init__(self, config: AppConfig | Callable[[], AppConfig]) -> None:
         self.logger = logging.getLogger(__name__)
         self._config_provider: Callable[[], AppConfig] = config if callable(config) else lambda: config
-        self._champion_data: dict[str, dict[str, Any]] | None = None
-        self._champion_name_by_key: dict[str, str] | None = None  # key → 名称
-        self._champion_key_by_name: dict[str, str] | None = None  # lower(name) → key
-        self._entries_cache: dict[tuple[str, str], list[dict[str, Any]]] = {}
-        self._lookup: AugmentLookup | None = None
-        self._resources: AramkitResources | None = None
+        self._snapshot = _Snapshot(generation=0)
+        self._reload_lock = threading.Lock()
+        self._listeners: list[Callable[[int], None]] = []
+        self._changes: dict[int, frozenset[str] | None] = {}  # 版本 → 该版本变化的英雄（None 为全量）
+        self._reload_executor: ThreadPoolExecutor | None = None
+        self._store: StatsStore | None = None
+        self._store_lock = threading.Lock()
+        self._archive: "StatsArchive | None" = None
+
+    @property
+    def generation(self) -> int:
+        """数据版本：每次 reload() 递增，供派生缓存（如 SuggestCache）判断失效。"""
+        return self._snapshot.generation
+
+    def champion_generation(self, champion_id: str) -> int:
+        """该英雄条目最近一次变化时的数据版本（供按英雄缓存的派生结果判断失效）。"""
+        snapshot = self._snapshot
+        return snapshot.champion_generations.get(champion_id, snapshot.base_generation)
+
+    def changed_since(self, generation: int) -> frozenset[str] | None:
+        """自 ``generation`` 以来条目有变化的英雄；期间发生过全量重载（或历史已淘汰）时返回 None。"""
+        changed: set[str] = set()
+        for version in range(generation + 1, self.generation + 1):
+            champions = self._changes.get(version)
+            if champions is None:
+                return None
+            changed |= champions
+        return frozenset(changed)
 
     # ── 英雄元数据 ──────────────────────────────────────────────────────
 
-    def _champions(self) -> dict[str, dict[str, Any]]:
-        if self._champion_data is None:
-            self._load_champions()
-        assert self._champion_data is not None
-        return self._champion_data
+    def _champions(self, snapshot: _Snapshot) -> _Snapshot:
+        """返回英雄表已加载的快照（首次访问时在快照锁内加载一次）。"""
+        if snapshot.champion_data is None:
+            with snapshot.lock:
+                if snapshot.champion_data is None:
+                    self._load_champions(snapshot)
+        return snapshot
 
-    def _load_champions(self) -> None:
+    def _load_champions(self, snapshot: _Snapshot) -> None:
         """加载英雄元数据并构建 key↔name 查找索引（一次性，供后续 O(1) 反查）。"""
         path = self._config_provider().champion_dir
-        if not path.exists():
-            self._champion_data = {}
+        store = self.stats_store()
+        if store is None:
+            champion_data = self._read_champion_files(path)
         else:
+            champion_data = store.champions(path, lambda: self._read_champion_files(path))
+        name_by_key: dict[str, str] = {}
+        key_by_name: dict[str, str] = {}
+        for champ_info in champion_data.values():
+            # key→name 用显示名 name；name→key 用内部标识 id（与原按 id 匹配的语义一致，
+            # Data Dragon 部分英雄 id 与 name 不同，如 "Chogath" vs "Cho'Gath"），
+            # 两者都映射到数字 key
+            name_by_key[str(champ_info["key"])] = str(champ_info["name"])
+            key_by_name[str(champ_info["id"]).lower()] = str(champ_info["key"])
+        # 索引先于 champion_data 发布：无锁读取方看到 champion_data 非 None 时索引已完整
+        snapshot.champion_name_by_key = name_by_key
+        snapshot.champion_key_by_name = key_by_name
+        snapshot.champion_data = champion_data
+
+    def _read_champion_files(self, path: Path) -> dict[str, dict[str, Any]]:
+        """读取最新的有效 Data Dragon 英雄文件（新版本无效时依次回退旧版本），返回其 ``data`` 字段。"""
+        champion_data: dict[str, dict[str, Any]] = {}
+        if path.exists():
             files = [
                 f
                 for f in path.iterdir()
@@ -128,9 +253,7 @@ class GameData:
             files.sort(key=lambda f: version_sort_key(f.stem), reverse=True)
             if not files:
                 self.logger.error(f"没有找到任何有效英雄数据文件在: {path}")
-                self._champion_data = {}
             else:
-                self._champion_data = {}
                 for latest_file in files:
                     try:
                         with open(latest_file, "r", encoding="utf-8") as f:
@@ -141,50 +264,49 @@ class GameData:
                             for champ_info in data.values()
                         ):
                             raise ValueError("英雄数据文件缺少有效的 data 字段或英雄字段")
-                        self._champion_data = data
+                        champion_data = data
                         break
                     except (OSError, json.JSONDecodeError, TypeError, ValueError) as e:
                         self.logger.warning(f"跳过无效英雄数据文件: {latest_file}, 错误: {str(e)}")
                 else:
                     self.logger.error(f"所有英雄数据文件均无法读取: {path}")
-        self._champion_name_by_key = {}
-        self._champion_key_by_name = {}
-        for champ_info in self._champion_data.values():
-            # key→name 用显示名 name；name→key 用内部标识 id（与原按 id 匹配的语义一致，
-            # Data Dragon 部分英雄 id 与 name 不同，如 "Chogath" vs "Cho'Gath"），
-            # 两者都映射到数字 key
-            self._champion_name_by_key[str(champ_info["key"])] = str(champ_info["name"])
-            self._champion_key_by_name[str(champ_info["id"]).lower()] = str(champ_info["key"])
+        return champion_data
 
     def champion_ids(self) -> list[str]:
         """全部英雄 ID（按整数升序）。"""
-        return sorted((info["key"] for info in self._champions().values()), key=int)
+        champion_data = self._champions(self._snapshot).champion_data
+        assert champion_data is not None
+        return sorted((info["key"] for info in champion_data.values()), key=int)
 
     def champion_id_by_name(self, champion_name: str) -> str | None:
         """根据英雄名称获取英雄 ID（不区分大小写）。"""
-        _ = self._champions()  # 确保索引已构建
-        assert self._champion_key_by_name is not None
-        champ_id = self._champion_key_by_name.get(champion_name.lower())
+        champ_id = self._champions(self._snapshot).champion_key_by_name.get(champion_name.lower())
         if champ_id is None:
             self.logger.warning(f"未找到英雄名称 '{champion_name}' 对应的 ID")
         return champ_id
 
     def champion_name(self, champion_id: str) -> str | None:
         """根据英雄 ID（key）获取英雄名称。"""
-        _ = self._champions()  # 确保索引已构建
-        assert self._champion_name_by_key is not None
-        name = self._champion_name_by_key.get(champion_id if isinstance(champion_id, str) else str(champion_id))
+        return self._champion_name(self._snapshot, champion_id)
+
+    def _champion_name(self, snapshot: _Snapshot, champion_id: str) -> str | None:
+        name_by_key = self._champions(snapshot).champion_name_by_key
+        name = name_by_key.get(champion_id if isinstance(champion_id, str) else str(champion_id))
         if name is None:
             self.logger.warning(f"未找到英雄 ID '{champion_id}' 对应的名称")
         return name
 
     # ── 符文条目 ────────────────────────────────────────────────────────
 
-    def _augment_data_path(self, champion_id: str, source: str) -> Path:
-        """该英雄在指定数据源下的条目文件路径。"""
+    def _augment_dir(self, source: str, dataset: str | None = None) -> Path:
+        """指定数据源（及数据集，None 取配置）的条目目录。"""
         if source == "aramkit":
-            return self._config_provider().aramkit_augment_dir / f"{champion_id}.json"
-        return self._config_provider().opgg_augment_dir / f"{champion_id}.json"
+            return self._config_provider().aramkit_dataset_dir(dataset or self.dataset(source))
+        return self._config_provider().opgg_augment_dir
+
+    def _augment_data_path(self, champion_id: str, source: str, dataset: str | None = None) -> Path:
+        """该英雄在指定数据源/数据集下的条目文件路径。"""
+        return self._augment_dir(source, dataset) / f"{champion_id}.json"
 
     def available_source(self, champion_id: str, preferred: str | None = None) -> str | None:
         """返回该英雄首个有符文数据的数据源（默认源优先，缺数据时回退另一源）。
@@ -194,6 +316,11 @@ class GameData:
         文件存在性、静默跳过缺失的源，两个源都没有数据时返回 None。
         """
         preferred = preferred or self.default_source()
+        if preferred == BLENDED_SOURCE:  # 融合源只需任一源有数据
+            try:
+                return preferred if self.augment_entries(champion_id, preferred) is not None else None
+            except (FileNotFoundError, json.JSONDecodeError):
+                return None
         other = "opgg" if preferred == "aramkit" else "aramkit"
         for source in (preferred, other):
             if not self._augment_data_path(champion_id, source).exists():
@@ -205,24 +332,87 @@ class GameData:
                 continue
         return None
 
-    def augment_entries(self, champion_id: str, source: str | None = None) -> list[dict[str, Any]] | None:
+    def augment_entries(
+        self, champion_id: str, source: str | None = None, dataset: str | None = None
+    ) -> list[dict[str, Any]] | None:
         """返回该英雄的引擎标准符文条目。
 
         Args:
             champion_id: 英雄 ID
             source: 数据源（"opgg"/"aramkit"），None 取配置默认
+            dataset: 数据集（aramkit "all"/"high"），None 取配置；各数据集独立缓存，可同时加载
 
         Returns:
             条目列表；英雄未知时返回 None；文件缺失/损坏时照旧抛出
             ``FileNotFoundError``/``JSONDecodeError``
         """
         source = source or self.default_source()
-        if self.champion_name(champion_id) is None:
+        return self._entries(self._snapshot, champion_id, source, dataset or self.dataset(source))
+
+    def _entries(self, snapshot: _Snapshot, champion_id: str, source: str, dataset: str) -> list[dict[str, Any]] | None:
+        if self._champion_name(snapshot, champion_id) is None:
             return None
-        cache_key = (champion_id, source)
-        if cache_key in self._entries_cache:
-            return self._entries_cache[cache_key]
-        champion_data_path = self._augment_data_path(champion_id, source)
+        cache_key = (champion_id, source, dataset)
+        entries = snapshot.entries.get(cache_key)
+        if entries is not None:
+            return entries
+
+        def load() -> list[dict[str, Any]]:
+            cached = snapshot.entries.get(cache_key)  # 等待锁期间可能已被其他线程加载
+            if cached is None:
+                if source == BLENDED_SOURCE:
+                    cached = self._blend_entries(snapshot, champion_id, dataset)
+                else:
+                    cached = self.read_augment_entries(champion_id, source, dataset)
+                snapshot.entries[cache_key] = cached
+            return cached
+
+        return snapshot.entry_flights.do(cache_key, load)
+
+    def _blend_entries(self, snapshot: _Snapshot, champion_id: str, dataset: str) -> list[dict[str, Any]]:
+        """融合两源条目（各源条目经同一快照缓存；只缺一源时沿用另一源）。
+
+        Raises:
+            FileNotFoundError: 两个数据源都没有该英雄的条目文件
+        """
+        sides: list[list[dict[str, Any]] | None] = []
+        for source, source_dataset in (("opgg", "all"), ("aramkit", dataset)):
+            try:
+                sides.append(self._entries(snapshot, champion_id, source, source_dataset))
+            except FileNotFoundError:
+                sides.append(None)
+        if all(side is None for side in sides):
+            raise FileNotFoundError(f"英雄 {champion_id} 在 opgg/aramkit 数据源中都没有符文数据")
+        return blend_augment_records(sides[0], sides[1])
+
+    def read_augment_entries(self, champion_id: str, source: str, dataset: str | None = None) -> list[dict[str, Any]]:
+        """直接读取并转换该英雄的条目文件（不经缓存、不校验英雄是否已知）。
+
+        Raises:
+            FileNotFoundError: 文件缺失
+            json.JSONDecodeError: 文件损坏
+        """
+        dataset = dataset or self.dataset(source)
+        store = self.stats_store()
+        if store is None:
+            return self._parse_augment_file(champion_id, source, dataset)
+        path = self._augment_data_path(champion_id, source, dataset)
+        try:
+            return store.entries(
+                source,
+                dataset,
+                champion_id,
+                path,
+                lambda: self._parse_augment_file(champion_id, source, dataset),
+                version=self._data_version(source),
+            )
+        except FileNotFoundError:
+            self.logger.error(f"未找到英雄符文数据文件: {path}")
+            raise
+
+    def _parse_augment_file(self, champion_id: str, source: str, dataset: str) -> list[dict[str, Any]]:
+        """解析条目文件并转换为引擎标准记录（aramkit 原生字段经 ``convert_augment_records`` 转换）。"""
+        champion_data_path = self._augment_data_path(champion_id, source, dataset)
         try:
             with open(champion_data_path, "r", encoding="utf-8") as f:
                 raw_data = json.load(f)
@@ -235,34 +425,152 @@ class GameData:
         except Exception as e:
             self.logger.error(f"读取英雄符文数据文件时发生错误: {champion_data_path}, 错误: {str(e)}")
             raise
-        if source == "aramkit":
-            entries = convert_augment_records(raw_data.get("augments", {}).get("all", []))
-        else:
-            data = raw_data.get("data")
-            if data is None:
-                self.logger.warning(f"英雄符文数据文件缺少 'data' 字段: champion_id={champion_id}")
-                entries = []
-            else:
-                entries = data
-        self._entries_cache[cache_key] = entries
+        entries = parse_augment_payload(raw_data, source)
+        if entries is None:
+            self.logger.warning(f"英雄符文数据文件缺少 'data' 字段: champion_id={champion_id}")
+            entries = []
         return entries
 
+    def augment_counts(self, source: str | None = None, dataset: str | None = None) -> dict[str, int]:
+        """英雄 ID → 列表展示的有效符文数（经持久化摘要，仅重新解析有变化的文件）。"""
+        source = source or self.default_source()
+        dataset = dataset or self.dataset(source)
+        if source == BLENDED_SOURCE:
+            return self._blended_counts(dataset)
+        store = self.stats_store()
+        if store is None:
+            return self._summary(self._snapshot, source, dataset).counts()
+        _, failed = self._sync_source(store, source, dataset)
+        counts = store.listed_counts(source, dataset)
+        return {**counts, **dict.fromkeys(failed, 0)}
+
+    def _blended_counts(self, dataset: str) -> dict[str, int]:
+        """融合源的符文数（由内存中的融合条目计数；两源均无文件的英雄不列出）。"""
+        counts: dict[str, int] = {}
+        for champion_id in self.champion_ids():
+            try:
+                counts[champion_id] = count_listed_entries(self.augment_entries(champion_id, BLENDED_SOURCE, dataset))
+            except FileNotFoundError:
+                continue
+            except json.JSONDecodeError:
+                counts[champion_id] = 0
+        return counts
+
+    def _summary(self, snapshot: _Snapshot, source: str, dataset: str) -> AugmentSummary:
+        with snapshot.lock:
+            summary = snapshot.summaries.get((source, dataset))
+            if summary is None:
+                summary = AugmentSummary(
+                    self._augment_dir(source, dataset), lambda cid: self.read_augment_entries(cid, source, dataset)
+                )
+                snapshot.summaries[(source, dataset)] = summary
+        return summary
+
     def augment_entries_all(self, source: str | None = None) -> dict[str, list[dict[str, Any]] | None]:
         """全部英雄的条目（懒加载，供 web 列表构建）。"""
         source = source or self.default_source()
         return {cid: self.augment_entries(cid, source) for cid in self.champion_ids()}
 
-    # ── 源感知符文查找 ──────────────────────────────────────────────────
+    # ── SQLite 存储后端 ─────────────────────────────────────────────────
+
+    def stats_store(self) -> StatsStore | None:
+        """配置为 SQLite 后端时返回统计数据库（懒创建；数据库路径随配置变化时重建），否则 None。"""
+        config = self._config_provider()
+        if config.storage.backend != "sqlite":
+            return None
+        store = self._store
+        if store is None or store.db_path != config.stats_db_file:
+            with self._store_lock:
+                store = self._store
+                if store is None or store.db_path != config.stats_db_file:
+                    store = self._store = StatsStore(config.stats_db_file)
+        return store
+
+    def stats_archive(self) -> "StatsArchive":
+        """历史归档（懒创建；归档目录随配置变化时重建）。"""
+        from aram_mayhem_helper.utils.archive import StatsArchive  # archive 依赖本模块的条目解析
+
+        archive_dir = self._config_provider().archive_dir
+        archive = self._archive
+        if archive is None or archive.root != archive_dir:
+            with self._store_lock:
+                archive = self._archive
+                if archive is None or archive.root != archive_dir:
+                    archive = self._archive = StatsArchive(archive_dir)
+        return archive
+
+    def dataset(self, source: str) -> str:
+        """数据源默认使用的数据集（配置项；OP.GG 不分段，记为 "all"；融合源取 aramkit 侧的数据集）。"""
+        if source in ("aramkit", BLENDED_SOURCE):
+            return self._config_provider().crawler.aramkit.augment.dataset
+        return "all"
+
+    def datasets(self, source: str) -> tuple[str, ...]:
+        """数据源支持的全部数据集（aramkit 的 all/high 可同时加载对比）。"""
+        return ARAMKIT_DATASETS if source in ("aramkit", BLENDED_SOURCE) else ("all",)
+
+    def _data_version(self, source: str) -> str:
+        """数据源当前的数据版本：aramkit 取爬虫记录的 version.json，OP.GG 无版本号（空串）。"""
+        if source != "aramkit":
+            return ""
+        try:
+            with open(self._config_provider().aramkit_version_file, "r", encoding="utf-8") as f:
+                return str(json.load(f).get("data_version") or "")
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return ""
+
+    def _sync_source(self, store: StatsStore, source: str, dataset: str) -> tuple[int, set[str]]:
+        return store.sync_directory(
+            source,
+            dataset,
+            self._augment_dir(source, dataset),
+            lambda champion_id: self._parse_augment_file(champion_id, source, dataset),
+            version=self._data_version(source),
+        )
+
+    def sync_store(self) -> int:
+        """把英雄表、符文名称与各数据源/数据集的条目文件增量导入统计数据库。
+
+        Returns:
+            本次重新导入的英雄条目文件数
 
-    def _lookup_impl(self) -> AugmentLookup:
-        if self._lookup is None:
-            self._lookup = AugmentLookup(self._config_provider().trans_file, self._resources_impl())
-        return self._lookup
+        Raises:
+            ValueError: 未配置 SQLite 存储后端
+        """
+        store = self.stats_store()
+        if store is None:
+            raise ValueError('未启用 SQLite 存储后端（config.toml 中设置 [storage] backend = "sqlite"）')
+        snapshot = self._snapshot
+        self._champions(snapshot)
+        # 与 augment_info 相同的优先级：aramkit 资源覆盖手动翻译表
+        lookup = self._lookup_impl(snapshot)
+        lookup.load()
+        resources = self._resources_impl(snapshot)
+        resources.load()
+        store.sync_augments({**lookup.id_name_dict, **resources.augment_id_name_dict})
+        ingested = 0
+        for source in VALID_SOURCES:
+            for dataset in self.datasets(source):
+                count, _ = self._sync_source(store, source, dataset)
+                ingested += count
+        return ingested
 
-    def _resources_impl(self) -> AramkitResources:
-        if self._resources is None:
-            self._resources = AramkitResources(self._config_provider().aramkit_resources_dir)
-        return self._resources
+    # ── 源感知符文查找 ──────────────────────────────────────────────────
+
+    def _lookup_impl(self, snapshot: _Snapshot) -> AugmentLookup:
+        if snapshot.lookup is None:
+            resources = self._resources_impl(snapshot)
+            with snapshot.lock:
+                if snapshot.lookup is None:
+                    snapshot.lookup = AugmentLookup(self._config_provider().trans_file, resources)
+        return snapshot.lookup
+
+    def _resources_impl(self, snapshot: _Snapshot) -> AramkitResources:
+        if snapshot.resources is None:
+            with snapshot.lock:
+                if snapshot.resources is None:
+                    snapshot.resources = AramkitResources(self._config_provider().aramkit_resources_dir)
+        return snapshot.resources
 
     def augment_info(self, augment_id: str) -> dict[str, Any] | None:
         """根据符文 ID 获取名称/等级信息：自动下载的 aramkit 资源优先，手动翻译表回退。
@@ -271,9 +579,10 @@ class GameData:
         自动源跟随游戏版本更新，手动维护的 ``augment_trans.json`` 仅补齐
         aramkit 未收录的条目。
         """
-        info = self._resources_impl().get_augment_info(augment_id)
+        snapshot = self._snapshot
+        info = self._resources_impl(snapshot).get_augment_info(augment_id)
         if info is None:
-            info = self._lookup_impl().get_augment_info(augment_id)
+            info = self._lookup_impl(snapshot).get_augment_info(augment_id)
         return info
 
     def augment_id(self, augment_name: str) -> str | None:
@@ -281,23 +590,130 @@ class GameData:
 
         两个来源均做 OCR 容错归一化（空格/连字符差异），匹配失败返回 None。
         """
-        augment_id = self._resources_impl().get_augment_id(augment_name)
+        snapshot = self._snapshot
+        augment_id = self._resources_impl(snapshot).get_augment_id(augment_name)
         if augment_id is None:
-            augment_id = self._lookup_impl().get_augment_id(augment_name)
+            augment_id = self._lookup_impl(snapshot).get_augment_id(augment_name)
         return augment_id
 
     def default_source(self) -> str:
         """配置默认数据源。"""
         return self._config_provider().data_source.source
 
+    def stored_source(self, source: str | None = None) -> str:
+        """解析有原始数据文件（可入库/归档）的数据源：None 取配置默认，默认为融合源时取 aramkit。
+
+        Raises:
+            ValueError: 数据源不存在或没有原始数据（融合源在内存中派生，不入库也不归档）
+        """
+        if source is None:
+            source = self.default_source()
+            return source if source in VALID_SOURCES else "aramkit"
+        if source not in VALID_SOURCES:
+            raise ValueError(
+                f"数据源 {source} 没有原始数据文件（融合数据源在内存中派生），可选: {'/'.join(VALID_SOURCES)}"
+            )
+        return source
+
     # ── 刷新 ────────────────────────────────────────────────────────────
 
-    def reload(self) -> None:
-        """清空全部缓存（英雄数据、符文条目、翻译表、aramkit 资源），下次访问重新读取。"""
-        self._champion_data = None
-        self._entries_cache.clear()
-        self._lookup_impl().reload()
-        self._resources_impl().reload()
+    def add_reload_listener(self, listener: Callable[[int], None]) -> None:
+        """注册新快照发布后的回调（参数为新数据版本），供派生缓存在后台刷新；回调异常仅记录日志。"""
+        with self._reload_lock:
+            self._listeners.append(listener)
+
+    def _prewarm(self, snapshot: _Snapshot) -> int:
+        """在未发布的快照上预先加载全部文件：英雄表、资源/翻译表、各数据源（含已爬取的各数据集）的符文条目与摘要计数。
+
+        Returns:
+            已加载条目的 (英雄, 数据源) 数
+        """
+        self._champions(snapshot)
+        self._resources_impl(snapshot).load()
+        self._lookup_impl(snapshot).load()
+        assert snapshot.champion_data is not None
+        champion_ids = [str(info["key"]) for info in snapshot.champion_data.values()]
+        for source in VALID_SOURCES:
+            for dataset in self.datasets(source):
+                if dataset != self.dataset(source) and not self._augment_dir(source, dataset).is_dir():
+                    continue  # 未爬取的非默认数据集
+                for champion_id in champion_ids:
+                    if not self._augment_data_path(champion_id, source, dataset).exists():
+                        continue
+                    try:
+                        self._entries(snapshot, champion_id, source, dataset)
+                    except (OSError, json.JSONDecodeError):
+                        continue  # read_augment_entries 已记录错误；与懒加载时一样在访问时照旧抛出
+                store = self.stats_store()
+                if store is None:
+                    self._summary(snapshot, source, dataset).counts()
+                else:
+                    self._sync_source(store, source, dataset)
+        return len(snapshot.entries)
+
+    def reload(self, *, prewarm: bool = False) -> int:
+        """清空全部缓存（英雄数据、符文条目、翻译表、aramkit 资源），换入新数据快照。
+
+        新快照构建完成后以一次引用赋值发布：并发读取要么看到完整旧快照，要么看到
+        新快照，读取方从不等待。``prewarm=True`` 时先在新快照上解析全部文件再发布
+        （发布后的首批请求无需重新解析）；预热失败（如翻译表损坏）时抛出异常并保留旧快照。
+
+        Returns:
+            新数据版本（generation）
+        """
+        with self._reload_lock:
+            snapshot = _Snapshot(generation=self._snapshot.generation + 1)
+            if prewarm:
+                loaded = self._prewarm(snapshot)
+                self.logger.info(f"数据快照 {snapshot.generation} 预热完成：{loaded} 份英雄符文数据")
+            self._publish(snapshot, None)
+        return self._notify(snapshot.generation)
+
+    def invalidate(self, entries: set[tuple[str, str]]) -> int:
+        """增量失效：只丢弃指定 (英雄, 数据源) 的条目（该源全部数据集），其余缓存原样带入新快照。
+
+        新快照发布前先重新读取失效的条目（文件缺失/损坏时留待访问时照旧抛出），
+        发布后通知重载回调；派生缓存可通过 ``changed_since`` 只重算受影响的英雄。
+
+        Returns:
+            新数据版本（generation）
+        """
+        with self._reload_lock:
+            snapshot = self._snapshot.derive(entries)
+            if snapshot.champion_data is not None:
+                for champion_id, source in entries:
+                    for dataset in self.datasets(source):
+                        if self._augment_data_path(champion_id, source, dataset).exists():
+                            try:
+                                self._entries(snapshot, champion_id, source, dataset)
+                            except (OSError, json.JSONDecodeError):
+                                pass
+            self._publish(snapshot, frozenset(champion_id for champion_id, _ in entries))
+        return self._notify(snapshot.generation)
+
+    def _publish(self, snapshot: _Snapshot, changed: frozenset[str] | None) -> None:
+        """换入新快照并记录变化（调用方持有 ``_reload_lock``）；只保留最近 64 个版本的变化记录。"""
+        self._changes[snapshot.generation] = changed
+        self._changes.pop(snapshot.generation - 64, None)
+        self._snapshot = snapshot
+
+    def _notify(self, generation: int) -> int:
+        with self._reload_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(generation)
+            except Exception as e:
+                self.logger.warning(f"数据重载回调失败: {e}")
+        return generation
+
+    def reload_async(self, *, prewarm: bool = True) -> Future[int]:
+        """在后台线程中执行 ``reload``（默认预热），立即返回 Future；多次调用按顺序执行。"""
+        with self._reload_lock:
+            if self._reload_executor is None:
+                self._reload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gamedata-reload")
+            executor = self._reload_executor
+        return executor.submit(self.reload, prewarm=prewarm)
 
 
 _game_data_singleton: GameData | None = None
@@ -0,0 +1,68 @@
+"""单飞（single-flight）加载：同一键的并发未命中只执行一次加载，其余调用者等待并共享结果。
+
+多线程 web 服务冷启动时，突发请求会同时触发同一文件的解析（惊群）；经本模块
+去重后每个文件只解析一次，加载失败时异常同样传递给全部等待者（不缓存失败）。
+"""
+
+import functools
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, ParamSpec, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class SingleFlight(Generic[K, V]):
+    """按键去重进行中的加载（线程安全）；只合并同时发生的调用，不缓存结果。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, Future[V]] = {}
+
+    def do(self, key: K, load: Callable[[], V]) -> V:
+        """执行 ``load``；若同键加载正在进行，则等待其结果（或异常）而不重复执行。"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            value = load()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def single_flight_cache(maxsize: int | None = 128) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """``functools.lru_cache`` 的并发安全版本：相同参数的并发首次调用只执行一次函数体。
+
+    被装饰函数保留 ``cache_clear``/``cache_info``。
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        lru = functools.lru_cache(maxsize=maxsize)(func)
+        cached: Callable[..., R] = lru
+        flights: SingleFlight[Hashable, R] = SingleFlight()
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = (args, tuple(sorted(kwargs.items())))
+            return flights.do(key, lambda: cached(*args, **kwargs))
+
+        wrapper.cache_clear = lru.cache_clear  # type: ignore[attr-defined]
+        wrapper.cache_info = lru.cache_info  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
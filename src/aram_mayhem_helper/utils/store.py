@@ -0,0 +1,469 @@
+"""SQLite 存储后端：把爬虫写入的 JSON 文件增量导入本地数据库，按英雄/符文建立索引。
+
+JSON 文件仍是唯一数据来源（爬虫照常写文件），数据库只是可随时删除重建的索引副本：
+每个英雄文件按 (mtime_ns, 大小) 比对，仅新增/变化的文件重新导入。导入后跨英雄
+（某符文在所有英雄上的数据）、跨版本（同一英雄符文的历史）与排行榜查询都是一条
+走索引的 SQL，无需逐个解析全部 JSON。
+
+表结构：
+- ``champions``: 英雄 key → 名称/内部标识及 Data Dragon 原始记录
+- ``augments``: 符文 ID → 名称/等级（含归一化名称索引）
+- ``files``: 每个 (数据源, 数据集, 英雄) 当前导入的文件元数据与数据版本
+- ``stats``: (数据源, 数据集, 版本, 英雄, 序号) → 单条符文统计，按英雄、符文与各排行指标建索引
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from aram_mayhem_helper.utils.text_normalization import normalize_for_lookup
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS champions (
+    champion_id TEXT PRIMARY KEY,
+    alias TEXT NOT NULL,
+    name TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS augments (
+    augment_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    level TEXT,
+    name_norm TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS augments_name_norm ON augments (name_norm);
+CREATE TABLE IF NOT EXISTS files (
+    source TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    champion_id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (source, dataset, champion_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats (
+    source TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    version TEXT NOT NULL,
+    champion_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    augment_id TEXT,
+    performance REAL,
+    popular REAL,
+    sample_count INTEGER,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (source, dataset, version, champion_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS stats_champion ON stats (champion_id, source, dataset, version);
+CREATE INDEX IF NOT EXISTS stats_augment ON stats (augment_id, source, dataset, version);
+CREATE INDEX IF NOT EXISTS stats_performance ON stats (source, dataset, performance);
+CREATE INDEX IF NOT EXISTS stats_popular ON stats (source, dataset, popular);
+CREATE INDEX IF NOT EXISTS stats_sample_count ON stats (source, dataset, sample_count);
+"""
+
+# 当前版本的统计行：stats 与 files 按 (数据源, 数据集, 英雄, 版本) 连接
+_CURRENT_STATS = """
+stats AS s JOIN files AS f
+  ON f.source = s.source AND f.dataset = s.dataset AND f.champion_id = s.champion_id AND f.version = s.version
+"""
+
+LEADERBOARD_METRICS = ("performance", "popular", "sample_count")
+
+
+def _as_text(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+def _as_float(value: Any) -> float | None:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StatsStore:
+    """符文统计的 SQLite 索引副本（线程安全，每个线程/进程使用独立连接）。
+
+    Args:
+        db_path: 数据库文件路径（不存在时创建；结构版本不符时重建）
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ── 连接 ────────────────────────────────────────────────────────────
+
+    def _connection(self) -> sqlite3.Connection:
+        """当前线程的连接；fork 后的子进程重新连接（SQLite 连接不可跨进程共享）。"""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            conn.execute("PRAGMA journal_mode = WAL")  # 读不阻塞写：web 请求读取时爬虫数据可同时导入
+            with self._transaction(conn):
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version not in (0, _SCHEMA_VERSION):
+                    logger.info(f"统计数据库结构版本 {version} 已过期，重建: {self.db_path}")
+                    for table in ("meta", "champions", "augments", "files", "stats"):
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._schema_ready = True
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection | None = None) -> Iterator[sqlite3.Connection]:
+        """写事务：开始即获取写锁（IMMEDIATE），避免并发导入时读锁升级死锁。"""
+        conn = conn or self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """关闭当前线程的连接。"""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ── 英雄表 ──────────────────────────────────────────────────────────
+
+    def champions(self, directory: Path, read: Callable[[], dict[str, dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+        """经数据库读取英雄表；目录中版本文件有变化时先调用 ``read`` 重新导入。
+
+        Args:
+            directory: Data Dragon 英雄文件目录
+            read: 解析最新有效英雄文件的函数（返回 Data Dragon ``data`` 字段）
+
+        Returns:
+            与 Data Dragon ``data`` 同结构的英雄表
+        """
+        signature = json.dumps(_directory_signature(directory))
+        conn = self._connection()
+        row = conn.execute("SELECT value FROM meta WHERE key = 'champions_signature'").fetchone()
+        if row is None or row[0] != signature:
+            champion_data = read()
+            with self._transaction(conn):
+                conn.execute("DELETE FROM champions")
+                conn.executemany(
+                    "INSERT INTO champions (champion_id, alias, name, payload) VALUES (?, ?, ?, ?)",
+                    [
+                        (str(info["key"]), str(info["id"]), str(info["name"]), json.dumps(info, ensure_ascii=False))
+                        for info in champion_data.values()
+                    ],
+                )
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('champions_signature', ?)", (signature,))
+        return {
+            alias: json.loads(payload)
+            for alias, payload in conn.execute("SELECT alias, payload FROM champions ORDER BY CAST(champion_id AS INT)")
+        }
+
+    # ── 符文名称 ────────────────────────────────────────────────────────
+
+    def sync_augments(self, augments: dict[str, dict[str, Any]]) -> int:
+        """整体替换符文名称表（符文 ID → {"name", "level"}），返回写入行数。"""
+        rows = [
+            (str(augment_id), str(info["name"]), _as_text(info.get("level")), normalize_for_lookup(str(info["name"])))
+            for augment_id, info in augments.items()
+            if info.get("name")
+        ]
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM augments")
+            conn.executemany("INSERT INTO augments (augment_id, name, level, name_norm) VALUES (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def find_augment(self, name: str) -> str | None:
+        """按名称（OCR 容错归一化后）查找符文 ID。"""
+        row = (
+            self._connection()
+            .execute("SELECT augment_id FROM augments WHERE name_norm = ? LIMIT 1", (normalize_for_lookup(name),))
+            .fetchone()
+        )
+        return None if row is None else str(row[0])
+
+    # ── 英雄符文统计 ────────────────────────────────────────────────────
+
+    def entries(
+        self,
+        source: str,
+        dataset: str,
+        champion_id: str,
+        path: Path,
+        read: Callable[[], list[dict[str, Any]]],
+        version: str = "",
+    ) -> list[dict[str, Any]]:
+        """经数据库读取该英雄的条目；文件有变化时先调用 ``read`` 重新导入。
+
+        Raises:
+            FileNotFoundError: 文件缺失（同时删除该英雄已导入的当前数据）
+            json.JSONDecodeError: ``read`` 解析失败（数据库保持原样）
+        """
+        conn = self._connection()
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._remove_champions(conn, source, dataset, [champion_id])
+            raise
+        current = self._current_version(conn, source, dataset, champion_id, stat)
+        if current is None:
+            current = version
+            self._ingest(conn, source, dataset, champion_id, version, stat, read())
+        return [
+            json.loads(payload)
+            for (payload,) in conn.execute(
+                "SELECT payload FROM stats WHERE source = ? AND dataset = ? AND version = ? AND champion_id = ? "
+                "ORDER BY position",
+                (source, dataset, current, champion_id),
+            )
+        ]
+
+    def sync_directory(
+        self, source: str, dataset: str, directory: Path, read: Callable[[str], list[dict[str, Any]]], version: str = ""
+    ) -> tuple[int, set[str]]:
+        """导入目录中新增/变化的 ``<英雄ID>.json``，并移除已删除文件的当前数据。
+
+        Returns:
+            (重新导入的文件数, 读取失败的英雄 ID)
+        """
+        conn = self._connection()
+        known = {
+            champion_id: (mtime_ns, size)
+            for champion_id, mtime_ns, size in conn.execute(
+                "SELECT champion_id, mtime_ns, size FROM files WHERE source = ? AND dataset = ?", (source, dataset)
+            )
+        }
+        ingested = 0
+        failed: set[str] = set()
+        seen: set[str] = set()
+        try:
+            scanned = list(os.scandir(directory))
+        except FileNotFoundError:
+            scanned = []
+        for entry in scanned:
+            champion_id, ext = os.path.splitext(entry.name)
+            if ext != ".json" or not champion_id.isdigit() or not entry.is_file():
+                continue
+            seen.add(champion_id)
+            stat = entry.stat()
+            if known.get(champion_id) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                records = read(champion_id)
+            except Exception as e:
+                logger.warning(f"无法读取英雄 {champion_id} 的符文数据，跳过导入: {e}")
+                failed.add(champion_id)
+                continue
+            self._ingest(conn, source, dataset, champion_id, version, stat, records)
+            ingested += 1
+        removed = set(known) - seen
+        if removed:
+            self._remove_champions(conn, source, dataset, sorted(removed))
+        return ingested, failed
+
+    def _remove_champions(self, conn: sqlite3.Connection, source: str, dataset: str, champion_ids: list[str]) -> None:
+        """文件已删除的英雄：移除其文件记录与全部版本的统计行（不留孤立行）。"""
+        keys = [(source, dataset, champion_id) for champion_id in champion_ids]
+        with self._transaction(conn):
+            conn.executemany("DELETE FROM files WHERE source = ? AND dataset = ? AND champion_id = ?", keys)
+            conn.executemany("DELETE FROM stats WHERE source = ? AND dataset = ? AND champion_id = ?", keys)
+
+    def _current_version(
+        self, conn: sqlite3.Connection, source: str, dataset: str, champion_id: str, stat: os.stat_result
+    ) -> str | None:
+        """文件未变化时返回已导入的数据版本，否则 None。"""
+        row = conn.execute(
+            "SELECT version, mtime_ns, size FROM files WHERE source = ? AND dataset = ? AND champion_id = ?",
+            (source, dataset, champion_id),
+        ).fetchone()
+        if row is None or (row[1], row[2]) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return str(row[0])
+
+    def _ingest(
+        self,
+        conn: sqlite3.Connection,
+        source: str,
+        dataset: str,
+        champion_id: str,
+        version: str,
+        stat: os.stat_result,
+        records: list[dict[str, Any]],
+    ) -> None:
+        """替换该英雄在此数据版本下的统计行；其他版本的历史行保留。"""
+        rows = [
+            (
+                source,
+                dataset,
+                version,
+                champion_id,
+                position,
+                _as_text(record.get("id")),
+                _as_float(record.get("performance")),
+                _as_float(record.get("popular")),
+                _as_int(record.get("sampleCount")),
+                json.dumps(record, ensure_ascii=False),
+            )
+            for position, record in enumerate(records)
+        ]
+        with self._transaction(conn):
+            conn.execute(
+                "DELETE FROM stats WHERE source = ? AND dataset = ? AND version = ? AND champion_id = ?",
+                (source, dataset, version, champion_id),
+            )
+            conn.executemany("INSERT INTO stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.execute(
+                "INSERT OR REPLACE INTO files (source, dataset, champion_id, version, mtime_ns, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (source, dataset, champion_id, version, stat.st_mtime_ns, stat.st_size),
+            )
+
+    # ── 索引查询 ────────────────────────────────────────────────────────
+
+    def listed_counts(self, source: str, dataset: str) -> dict[str, int]:
+        """英雄 ID → 列表展示的有效符文数（与 ``count_listed_entries`` 同口径）。"""
+        rows = self._connection().execute(
+            """
+            SELECT f.champion_id, COUNT(s.position)
+            FROM files AS f LEFT JOIN stats AS s
+              ON f.source = s.source AND f.dataset = s.dataset AND f.champion_id = s.champion_id
+             AND f.version = s.version AND s.performance IS NOT NULL AND s.augment_id IS NOT NULL
+             AND COALESCE(s.popular, 0) != 0
+            WHERE f.source = ? AND f.dataset = ?
+            GROUP BY f.champion_id
+            """,
+            (source, dataset),
+        )
+        return {str(champion_id): int(count) for champion_id, count in rows}
+
+    def augment_stats(self, augment_id: str, source: str, dataset: str) -> list[dict[str, Any]]:
+        """某符文在各英雄上的当前统计（强制走 ``stats_augment`` 索引），按表现降序。
+
+        未 ANALYZE 时规划器倾向用排行指标索引省去排序，那需要扫描整个数据集，故显式指定索引。
+        """
+        rows = self._connection().execute(
+            """
+            SELECT s.champion_id, s.performance, s.popular, s.sample_count
+            FROM stats AS s INDEXED BY stats_augment JOIN files AS f
+              ON f.source = s.source AND f.dataset = s.dataset AND f.champion_id = s.champion_id
+             AND f.version = s.version
+            WHERE s.augment_id = ? AND s.source = ? AND s.dataset = ?
+            ORDER BY s.performance DESC
+            """,
+            (augment_id, source, dataset),
+        )
+        return [
+            {"champion_id": champion_id, "performance": performance, "popular": popular, "sample_count": sample_count}
+            for champion_id, performance, popular, sample_count in rows
+        ]
+
+    def leaderboard(
+        self,
+        source: str,
+        dataset: str,
+        *,
+        metric: str = "performance",
+        min_popular: float = 0.0,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """全部英雄×符文组合按 ``metric`` 降序的排行（附符文名称）。
+
+        Raises:
+            ValueError: 不支持的排序指标
+        """
+        if metric not in LEADERBOARD_METRICS:
+            raise ValueError(f"不支持的排行指标 {metric!r}，可选: {', '.join(LEADERBOARD_METRICS)}")
+        rows = self._connection().execute(
+            f"""
+            SELECT s.champion_id, s.augment_id, a.name, s.performance, s.popular, s.sample_count
+            FROM {_CURRENT_STATS} LEFT JOIN augments AS a ON a.augment_id = s.augment_id
+            WHERE s.source = ? AND s.dataset = ? AND s.{metric} IS NOT NULL AND COALESCE(s.popular, 0) >= ?
+            ORDER BY s.{metric} DESC, s.champion_id, s.position
+            LIMIT ?
+            """,
+            (source, dataset, min_popular, limit),
+        )
+        return [
+            {
+                "champion_id": champion_id,
+                "augment_id": augment_id,
+                "name": name,
+                "performance": performance,
+                "popular": popular,
+                "sample_count": sample_count,
+            }
+            for champion_id, augment_id, name, performance, popular, sample_count in rows
+        ]
+
+    def augment_history(self, champion_id: str, augment_id: str, source: str, dataset: str) -> list[dict[str, Any]]:
+        """同一英雄符文在各已导入数据版本下的统计（强制走 ``stats_augment`` 索引，版本有序免排序），按版本升序。"""
+        rows = self._connection().execute(
+            """
+            SELECT version, performance, popular, sample_count FROM stats INDEXED BY stats_augment
+            WHERE champion_id = ? AND source = ? AND dataset = ? AND augment_id = ?
+            ORDER BY version
+            """,
+            (champion_id, source, dataset, augment_id),
+        )
+        return [
+            {"version": version, "performance": performance, "popular": popular, "sample_count": sample_count}
+            for version, performance, popular, sample_count in rows
+        ]
+
+    def versions(self, source: str, dataset: str) -> list[str]:
+        """已导入的数据版本（升序）。"""
+        rows = self._connection().execute(
+            "SELECT DISTINCT version FROM stats WHERE source = ? AND dataset = ? ORDER BY version", (source, dataset)
+        )
+        return [str(version) for (version,) in rows]
+
+
+def _directory_signature(directory: Path) -> list[tuple[str, int, int]]:
+    """目录下 JSON 文件的 (文件名, mtime_ns, 大小)，用于判断英雄表是否需要重新导入。"""
+    try:
+        scanned = list(os.scandir(directory))
+    except FileNotFoundError:
+        return []
+    signature: list[tuple[str, int, int]] = []
+    for entry in scanned:
+        if entry.is_file() and entry.name.lower().endswith(".json"):
+            stat = entry.stat()
+            signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return sorted(signature)
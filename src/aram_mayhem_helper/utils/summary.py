@@ -0,0 +1,106 @@
+"""英雄条目摘要索引：列表页所需的每英雄有效符文数，免去逐个解析英雄数据文件。
+
+摘要按数据源目录持久化为 ``_summary.json``（记录每个英雄文件的 mtime/大小与计数），
+每次查询只对目录做一次 ``os.scandir`` 比对元数据：未变化的文件直接复用计数，
+新增/更新的文件才重新解析（爬虫写入新数据后自动生效，无需显式重建）。
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILE_NAME = "_summary.json"
+_SUMMARY_VERSION = 1
+
+
+def count_listed_entries(entries: list[dict[str, Any]] | None) -> int:
+    """英雄列表展示的符文数：有 performance/id 且 popular 非 0 的条目。"""
+    if not entries:
+        return 0
+    return sum(
+        1 for e in entries if e.get("performance") is not None and e.get("popular", 0) != 0 and e.get("id") is not None
+    )
+
+
+class AugmentSummary:
+    """单个数据源目录的英雄符文数摘要（线程安全）。
+
+    Args:
+        directory: 数据源目录（其中每个 ``<英雄ID>.json`` 为一个英雄）
+        read_entries: 不经缓存读取某英雄条目的函数（文件缺失/损坏时抛异常）
+    """
+
+    def __init__(self, directory: Path, read_entries: Callable[[str], list[dict[str, Any]] | None]) -> None:
+        self.directory = directory
+        self._read_entries = read_entries
+        self._lock = threading.Lock()
+        self._files: dict[str, dict[str, int]] | None = None  # 英雄 ID → {mtime_ns, size, count}
+
+    @property
+    def path(self) -> Path:
+        return self.directory / SUMMARY_FILE_NAME
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"英雄摘要文件无法读取，将重新构建: {self.path}, 错误: {e}")
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _SUMMARY_VERSION:
+            return {}
+        files = payload.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _save(self, files: dict[str, dict[str, int]]) -> None:
+        tmp_path = self.path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": _SUMMARY_VERSION, "files": files}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # 只读数据卷（如容器挂载）时仅保留内存摘要
+            logger.debug(f"英雄摘要文件写入失败: {self.path}, 错误: {e}")
+
+    def counts(self) -> dict[str, int]:
+        """英雄 ID → 有效符文数（目录中不存在文件的英雄不出现在结果中）。"""
+        with self._lock:
+            if self._files is None:
+                self._files = self._load()
+            files = self._files
+            seen: set[str] = set()
+            changed = False
+            try:
+                scanned = list(os.scandir(self.directory))
+            except FileNotFoundError:
+                scanned = []
+            for entry in scanned:
+                champion_id, ext = os.path.splitext(entry.name)
+                if ext != ".json" or not champion_id.isdigit() or not entry.is_file():
+                    continue
+                seen.add(champion_id)
+                stat = entry.stat()
+                cached = files.get(champion_id)
+                if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                    continue
+                try:
+                    count = count_listed_entries(self._read_entries(champion_id))
+                except Exception as e:
+                    logger.warning(f"无法读取英雄 {champion_id} 的符文数据，计数记为 0: {e}")
+                    count = 0
+                files[champion_id] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "count": count}
+                changed = True
+            for champion_id in set(files) - seen:
+                del files[champion_id]
+                changed = True
+            if changed:
+                self._save(files)
+            return {champion_id: info["count"] for champion_id, info in files.items()}
@@ -0,0 +1,310 @@
+"""数据目录监视：文件变化时增量失效 GameData，长期运行的服务无需重启即可使用新数据。
+
+- 英雄符文条目文件（``<英雄ID>.json``）变化 → ``GameData.invalidate`` 只失效这些英雄
+- 英雄表（ddragon）、翻译表、aramkit 资源变化 → ``GameData.reload(prewarm=True)`` 重建名称索引
+
+Linux 下优先使用 inotify（经 ctypes 调用 libc，无额外依赖），不可用时（其他平台、
+watch 数量超限、网络文件系统等）回退为按间隔比对目录元数据（mtime/大小）。启动时尚不存在的
+目录（如首次爬取前的数据集目录）改为监视其最近的已存在上级目录，目录创建后重建监视。
+为捕获翻译表的原子替换需监视数据根目录，事件按路径过滤：只有监视目标本身、其上级或其内部的
+变化才参与处理，根目录下的其他目录（归档、SQLite 数据库等）不会触发重建监视与全量重载。
+事件经去抖合并：爬虫连续写入多个文件时只在写入停止后应用一次。
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aram_mayhem_helper.utils.config import ARAMKIT_DATASETS, AppConfig
+from aram_mayhem_helper.utils.data import GameData
+from aram_mayhem_helper.utils.summary import SUMMARY_FILE_NAME
+
+logger = logging.getLogger(__name__)
+
+# inotify 事件掩码（linux/inotify.h）
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+@dataclass
+class DataChanges:
+    """一批文件变化的分类结果。"""
+
+    entries: set[tuple[str, str]] = field(default_factory=set)  # (英雄 ID, 数据源)
+    full_reload: bool = False
+
+    def __bool__(self) -> bool:
+        return self.full_reload or bool(self.entries)
+
+
+class _Inotify:
+    """最小 inotify 封装：监视若干目录，返回发生变化的路径。"""
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify 仅在 Linux 上可用")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 失败")
+        self._dirs: dict[int, Path] = {}
+
+    def watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"无法监视目录: {directory}")
+        self._dirs[wd] = directory
+
+    def read(self, timeout: float) -> tuple[set[Path], set[Path], bool]:
+        """等待至多 ``timeout`` 秒，返回 (变化的路径, 其中增删的目录, 是否丢失事件)。"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set(), set(), False
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set(), set(), False
+        paths: set[Path] = set()
+        directories: set[Path] = set()
+        overflow = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+            directory = self._dirs.get(wd)
+            if mask & _IN_Q_OVERFLOW or directory is None:
+                overflow = True  # 事件丢失，由调用方按全量变化处理
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            paths.add(path)
+            if mask & (_IN_DELETE_SELF | _IN_ISDIR):
+                directories.add(path)  # 目录增删（如 aramkit 新版本资源目录），由调用方决定是否重建监视
+        return paths, directories, overflow
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class DataWatcher:
+    """监视数据目录并增量失效 GameData 的后台线程。
+
+    Args:
+        data: 数据仓储
+        config: 应用配置或其提供器（解析监视路径）
+        interval: 轮询间隔（秒），inotify 模式下为事件等待超时
+        debounce: 最后一个变化后静默多久才应用（秒）
+        use_inotify: 是否尝试 inotify（False 时强制轮询）
+    """
+
+    def __init__(
+        self,
+        data: GameData,
+        config: AppConfig | Callable[[], AppConfig],
+        *,
+        interval: float = 2.0,
+        debounce: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        self.data = data
+        self._config_provider: Callable[[], AppConfig] = config if callable(config) else lambda: config
+        self.interval = interval
+        self.debounce = debounce
+        self._use_inotify = use_inotify
+        self._inotify: _Inotify | None = None
+        self._signature: dict[Path, tuple[int, int]] | None = None  # 轮询基线，None 为尚未建立
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ── 路径分类 ────────────────────────────────────────────────────────
+
+    def _entry_dirs(self) -> dict[Path, str]:
+        config = self._config_provider()
+        entry_dirs = {config.opgg_augment_dir: "opgg"}
+        for dataset in ARAMKIT_DATASETS:
+            entry_dirs[config.aramkit_dataset_dir(dataset)] = "aramkit"
+        return entry_dirs
+
+    def _index_paths(self) -> list[Path]:
+        """变化时需全量重载（重建名称索引）的文件/目录。"""
+        config = self._config_provider()
+        return [config.champion_dir, config.trans_file, config.aramkit_resources_dir]
+
+    def _relevant(self, path: Path) -> bool:
+        """路径是否为监视目标（条目目录、英雄表、资源目录、翻译表）本身、其上级或其内部。"""
+        config = self._config_provider()
+        targets = [*self._entry_dirs(), config.champion_dir, config.aramkit_resources_dir, config.trans_file]
+        return any(path == target or path in target.parents or target in path.parents for target in targets)
+
+    def classify(self, paths: set[Path]) -> DataChanges:
+        """把变化的路径分为单英雄条目失效与全量重载。"""
+        changes = DataChanges()
+        entry_dirs = self._entry_dirs()
+        index_paths = self._index_paths()
+        for path in paths:
+            name = path.name
+            if name == SUMMARY_FILE_NAME or name.endswith(".tmp"):
+                continue  # 摘要索引自身的写入
+            source = entry_dirs.get(path.parent)
+            if source is not None:
+                champion_id, ext = os.path.splitext(name)
+                if ext == ".json" and champion_id.isdigit():
+                    changes.entries.add((champion_id, source))
+                continue
+            if path in entry_dirs or any(path == p or p in path.parents for p in index_paths):
+                changes.full_reload = True
+        return changes
+
+    def apply(self, changes: DataChanges) -> None:
+        """应用变化：名称索引相关文件变化时全量重载，否则只失效变化的英雄条目。"""
+        if changes.full_reload:
+            logger.info("检测到英雄表/翻译表/资源变化，重新加载全部数据")
+            self.data.reload(prewarm=True)
+        elif changes.entries:
+            logger.info(f"检测到 {len(changes.entries)} 份英雄符文数据变化，增量更新")
+            self.data.invalidate(changes.entries)
+
+    # ── 轮询后端 ────────────────────────────────────────────────────────
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """当前监视范围内文件的 (mtime_ns, size)。"""
+        signature: dict[Path, tuple[int, int]] = {}
+        directories = list(self._entry_dirs()) + [self._config_provider().champion_dir]
+        for directory in directories:
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            signature[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                continue
+        config = self._config_provider()
+        for root, _, files in os.walk(config.aramkit_resources_dir):
+            for file_name in files:
+                path = Path(root) / file_name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                signature[path] = (stat.st_mtime_ns, stat.st_size)
+        try:
+            stat = config.trans_file.stat()
+            signature[config.trans_file] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return signature
+
+    def _poll_changes(self) -> set[Path]:
+        signature = self._scan()
+        previous = self._signature or {}
+        self._signature = signature
+        return {path for path in previous.keys() | signature.keys() if previous.get(path) != signature.get(path)}
+
+    # ── inotify 后端 ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _watch_target(directory: Path) -> Path:
+        """目录存在时即其本身，否则为最近的已存在上级目录（其下创建目录时触发重建监视）。"""
+        while not directory.is_dir() and directory.parent != directory:
+            directory = directory.parent
+        return directory
+
+    def _start_inotify(self) -> bool:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        if not self._use_inotify:
+            return False
+        config = self._config_provider()
+        directories = [*self._entry_dirs(), config.champion_dir, config.trans_file.parent]
+        directories += [Path(root) for root, _, _ in os.walk(config.aramkit_resources_dir)]
+        try:
+            inotify = _Inotify()
+        except OSError as e:
+            logger.info(f"inotify 不可用，改为每 {self.interval} 秒轮询数据目录: {e}")
+            return False
+        try:
+            for directory in dict.fromkeys(self._watch_target(d) for d in directories):
+                inotify.watch(directory)
+        except OSError as e:
+            inotify.close()
+            logger.info(f"inotify 监视失败，改为每 {self.interval} 秒轮询数据目录: {e}")
+            return False
+        self._inotify = inotify
+        return True
+
+    # ── 生命周期 ────────────────────────────────────────────────────────
+
+    def poll_once(self) -> DataChanges:
+        """轮询一次并立即应用（不去抖），返回本次的变化分类。首次调用仅建立基线。"""
+        first = self._signature is None
+        paths = self._poll_changes()
+        changes = DataChanges() if first else self.classify(paths)
+        self.apply(changes)
+        return changes
+
+    def _run(self) -> None:
+        using_inotify = self._start_inotify()
+        if not using_inotify:
+            self._signature = self._scan()
+        pending: set[Path] = set()
+        last_change = 0.0
+        while not self._stop_event.is_set():
+            try:
+                if self._inotify is not None:
+                    paths, directories, overflow = self._inotify.read(min(self.interval, self.debounce))
+                    paths = {path for path in paths if self._relevant(path)}
+                    if overflow or any(self._relevant(directory) for directory in directories):
+                        paths.add(self._config_provider().champion_dir)  # 视为全量变化
+                        self._start_inotify()
+                else:
+                    self._stop_event.wait(self.interval)
+                    paths = self._poll_changes()
+                if paths:
+                    pending |= paths
+                    last_change = time.monotonic()
+                elif pending and time.monotonic() - last_change >= self.debounce:
+                    changes = self.classify(pending)
+                    pending = set()
+                    self.apply(changes)
+            except Exception as e:  # 后台线程不能因单次失败退出
+                logger.warning(f"数据目录监视处理失败: {e}")
+                pending = set()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def start(self) -> None:
+        """启动后台监视线程（守护线程）。"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="data-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """停止监视线程并等待其退出。"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
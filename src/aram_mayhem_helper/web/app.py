@@ -1,15 +1,58 @@
 """ARAM Mayhem Helper 网页应用 — 浏览缓存的所有英雄符文数据。"""
 
 import logging
+import threading
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import asdict
+from typing import Any
 
 from flask import Flask, Response, jsonify, render_template, request
 
+from aram_mayhem_helper.algorithm.augment_index import AugmentChampionIndex
+from aram_mayhem_helper.algorithm.dataset_compare import compare_datasets
+from aram_mayhem_helper.utils.config import SCORING_SOURCES, get_config
 from aram_mayhem_helper.utils.data import GameData, get_game_data
-from aram_mayhem_helper.web.service import build_champion_augments, build_champion_list
+from aram_mayhem_helper.utils.single_flight import single_flight_cache
+from aram_mayhem_helper.web.cache import IDENTITY, SUPPORTED_ENCODINGS, ResponseCache, variant_etag
+from aram_mayhem_helper.web.service import (
+    AugmentQuery,
+    AugmentTable,
+    build_augment_leaderboard,
+    build_champion_augments,
+    build_champion_list,
+    preload_text_tables,
+    to_columnar,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_augment_query(args: Mapping[str, str]) -> AugmentQuery:
+    """解析符文表查询参数。
+
+    Raises:
+        ValueError: 参数格式非法或取值越界
+    """
+    level = args.get("level")
+    order = args.get("order", "asc")
+    if order not in ("asc", "desc"):
+        raise ValueError(f"order 只能为 asc/desc: {order}")
+    try:
+        limit = args.get("limit")
+        return AugmentQuery(
+            levels=None if level is None else frozenset(v for v in level.split(",") if v),
+            search=args.get("q", "").strip(),
+            min_performance=float(args.get("min_performance", 0)),
+            min_popular=float(args.get("min_popular", 0)),
+            sort=args.get("sort") or None,
+            descending=order == "desc",
+            offset=int(args.get("offset", 0)),
+            limit=None if limit is None else int(limit),
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"查询参数错误: {e}") from e
+
+
 def create_app(game_data: GameData | None = None) -> Flask:
     """创建 Flask 应用（工厂模式，便于测试注入 fixture 数据）。
 
@@ -18,6 +61,77 @@ def create_app(game_data: GameData | None = None) -> Flask:
     """
     gd = game_data or get_game_data()
     app = Flask(__name__)
+    preload_text_tables()
+    response_cache = ResponseCache()
+    augment_indexes: dict[str, AugmentChampionIndex] = {}
+    augment_indexes_lock = threading.Lock()
+
+    def augment_index(source: str) -> AugmentChampionIndex:
+        """按数据源懒建倒排索引（首次查询时构建，之后随数据重载增量更新）。
+
+        Raises:
+            ValueError: 不支持的数据源（索引表只为有效数据源建项，不随请求参数增长）
+        """
+        if source not in SCORING_SOURCES:
+            raise ValueError(f"unsupported source: {source}")
+        with augment_indexes_lock:
+            if source not in augment_indexes:
+                augment_indexes[source] = AugmentChampionIndex(gd, source=source, thresholds=get_config().suggest)
+            return augment_indexes[source]
+
+    def on_reload(generation: int) -> None:
+        """新数据快照发布后（在重载线程中）增量刷新已建的倒排索引；旧版本响应由 LRU 自然淘汰。"""
+        with augment_indexes_lock:
+            indexes = list(augment_indexes.values())
+        for index in indexes:
+            index.refresh()
+
+    gd.add_reload_listener(on_reload)
+
+    def data_version() -> tuple[Hashable, ...]:
+        """数据版本（缓存键）：GameData 重载代数 + 打分参数（任一变化即视为新数据，ETag 另由内容派生）。"""
+        return (gd.generation, get_config().suggest)
+
+    def champion_version(champion_id: str) -> tuple[Hashable, ...]:
+        """单个英雄的数据版本：其他英雄的增量失效不影响该英雄的缓存与 ETag。"""
+        return (gd.champion_generation(champion_id), get_config().suggest)
+
+    def request_dataset(source: str) -> str:
+        """解析 ``?dataset=``（缺省取配置）。
+
+        Raises:
+            ValueError: 数据集不属于该数据源
+        """
+        dataset = request.args.get("dataset") or gd.dataset(source)
+        if dataset not in gd.datasets(source):
+            raise ValueError(f"数据源 {source} 不支持数据集: {dataset}")
+        return dataset
+
+    def cached_json(key: tuple[Hashable, ...], build: Callable[[], Any]) -> Response:
+        """带 ETag 与压缩协商的 JSON 响应。
+
+        ``key`` 只用于进程内缓存查找，ETag 由序列化后的响应字节派生（重启/多 worker 间稳定）。
+        ``If-None-Match`` 命中任一编码变体的 ETag 即返回 304；否则按 ``Accept-Encoding``
+        选择 br/gzip/原始字节，复用缓存中已序列化（及已压缩）的结果。
+        """
+        wanted = request.accept_encodings.best_match(SUPPORTED_ENCODINGS, default=IDENTITY)
+        encoding, body, etag = response_cache.get_or_build(
+            key, lambda: f"{app.json.dumps(build())}\n".encode("utf-8"), wanted
+        )
+        for variant in (IDENTITY, *SUPPORTED_ENCODINGS):
+            if variant_etag(etag, variant) in request.if_none_match:
+                not_modified = Response(status=304)
+                not_modified.set_etag(variant_etag(etag, variant))
+                not_modified.vary.add("Accept-Encoding")
+                not_modified.headers["Cache-Control"] = "no-cache"  # 与 200 一致，304 会刷新客户端缓存头
+                return not_modified
+        response = Response(body, mimetype="application/json")
+        if encoding != IDENTITY:
+            response.content_encoding = encoding
+        response.vary.add("Accept-Encoding")
+        response.set_etag(variant_etag(etag, encoding))
+        response.headers["Cache-Control"] = "no-cache"  # 允许缓存，但每次向服务端校验 ETag
+        return response
 
     @app.route("/")
     def index() -> str:
@@ -29,19 +143,143 @@ def create_app(game_data: GameData | None = None) -> Flask:
         """Return a summary list of all champions with cached augment data."""
         source = request.args.get("source", gd.default_source())
         try:
-            return jsonify(build_champion_list(gd, source))
+            dataset = request_dataset(source)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        try:
+            # 数据文件变化经监视器失效/重载推进 generation，缓存键不在请求路径上扫描目录
+            key = ("champions", source, dataset, data_version())
+            return cached_json(key, lambda: build_champion_list(gd, source, dataset))
         except Exception as e:
             logger.error(f"构建英雄列表失败: {e}")
             return jsonify({"error": str(e)}), 500
 
+    @single_flight_cache(maxsize=64)
+    def augment_table(champion_id: str, source: str, dataset: str, version: tuple[Hashable, ...]) -> AugmentTable:
+        """英雄符文表查询索引（按数据版本缓存，预排序只做一次）。"""
+        return AugmentTable(build_champion_augments(gd, champion_id, source, dataset))
+
+    def query_augments(champion_id: str, source: str, dataset: str, query: AugmentQuery, columnar: bool) -> Any:
+        table = augment_table(champion_id, source, dataset, champion_version(champion_id))
+        rows, matched = table.query(query)
+        if not columnar:
+            return rows
+        return {**to_columnar(gd, champion_id, rows), "matched": matched, "total": len(table.rows)}
+
     @app.route("/api/champions/<champion_id>/augments")
     def api_champion_augments(champion_id: str) -> Response | tuple[Response, int]:
-        """Return normalized augment data for a specific champion."""
+        """Return normalized augment data for a specific champion.
+
+        ``?format=columnar`` returns champion metadata once plus one array per column
+        (with ``matched``/``total`` row counts). Optional server-side query parameters:
+        ``level`` (comma list), ``q`` (name search), ``min_performance``/``min_popular``
+        (display scale), ``sort``/``order`` (asc|desc), ``offset``/``limit``, ``dataset`` (all|high).
+        """
         source = request.args.get("source", gd.default_source())
+        output_format = request.args.get("format", "rows")
+        if output_format not in ("rows", "columnar"):
+            return jsonify({"error": f"unsupported format: {output_format}"}), 400
         try:
-            return jsonify(build_champion_augments(gd, champion_id, source))
+            dataset = request_dataset(source)
+            query = _parse_augment_query(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        try:
+            version = champion_version(champion_id)
+            key = ("champion_augments", champion_id, source, dataset, output_format, query, version)
+            if query == AugmentQuery() and output_format == "rows":
+                return cached_json(key, lambda: build_champion_augments(gd, champion_id, source, dataset))
+            columnar = output_format == "columnar"
+            return cached_json(key, lambda: query_augments(champion_id, source, dataset, query, columnar))
         except Exception as e:
             logger.error(f"构建英雄 {champion_id} 符文数据失败: {e}")
             return jsonify({"error": str(e)}), 500
 
+    @app.route("/api/champions/<champion_id>/augments/<augment_id>/trend")
+    def api_augment_trend(champion_id: str, augment_id: str) -> Response | tuple[Response, int]:
+        """Return archived per-version stats of an augment on a champion (oldest first).
+
+        Only sources with raw data files are archived; a blended default resolves to aramkit.
+        """
+        source = request.args.get("source")
+        if source is not None and source not in SCORING_SOURCES:
+            return jsonify({"error": f"unsupported source: {source}"}), 400
+        try:
+            source = gd.stored_source(source)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        try:
+            points = gd.stats_archive().trend(source, gd.dataset(source), champion_id, augment_id)
+            return jsonify(
+                {
+                    "champion_id": champion_id,
+                    "augment_id": augment_id,
+                    "source": source,
+                    "points": [asdict(point) for point in points],
+                }
+            )
+        except Exception as e:
+            logger.error(f"构建英雄 {champion_id} 符文 {augment_id} 趋势失败: {e}")
+            return jsonify({"error": str(e)}), 500
+
+    @app.route("/api/datasets/diff")
+    def api_dataset_diff() -> Response | tuple[Response, int]:
+        """Compare augment ranks between two datasets of a source (default aramkit all vs high).
+
+        Rows are (champion, augment) pairs ranked in both datasets, largest percentile shift first.
+        Optional ``champion`` restricts to one champion; ``limit`` caps the rows returned.
+        """
+        source = request.args.get("source", "aramkit")
+        base = request.args.get("base", "all")
+        other = request.args.get("other", "high")
+        champion = request.args.get("champion") or None
+        limit = request.args.get("limit", type=int)
+        if source not in SCORING_SOURCES:
+            return jsonify({"error": f"unsupported source: {source}"}), 400
+        if limit is not None and limit < 0:
+            return jsonify({"error": f"limit 不能为负数: {limit}"}), 400
+        valid = gd.datasets(source)
+        if base not in valid or other not in valid or base == other:
+            error = f"数据源 {source} 需要两个不同的数据集（{'/'.join(valid)}）: {base}, {other}"
+            return jsonify({"error": error}), 400
+
+        def build() -> dict[str, Any]:
+            comparison = compare_datasets(
+                gd,
+                thresholds=get_config().suggest,
+                source=source,
+                base=base,
+                other=other,
+                champion_ids=None if champion is None else [champion],
+            )
+            return {
+                "source": source,
+                "base": base,
+                "other": other,
+                "total": len(comparison),
+                "rows": list(comparison.records(limit)),
+            }
+
+        try:
+            return cached_json(("dataset_diff", source, base, other, champion, limit, data_version()), build)
+        except Exception as e:
+            logger.error(f"构建数据集对比失败: {e}")
+            return jsonify({"error": str(e)}), 500
+
+    @app.route("/api/augments/<augment_id>/champions")
+    def api_augment_champions(augment_id: str) -> Response | tuple[Response, int]:
+        """Return champions ranked by weighted_sum for a specific augment."""
+        source = request.args.get("source") or gd.default_source()
+        limit = request.args.get("limit", type=int)
+        if source not in SCORING_SOURCES:
+            return jsonify({"error": f"unsupported source: {source}"}), 400
+        if limit is not None and limit < 0:
+            return jsonify({"error": f"limit 不能为负数: {limit}"}), 400
+        try:
+            key = ("augment_champions", augment_id, source, limit, data_version())
+            return cached_json(key, lambda: build_augment_leaderboard(gd, augment_index(source), augment_id, limit))
+        except Exception as e:
+            logger.error(f"构建符文 {augment_id} 英雄排行失败: {e}")
+            return jsonify({"error": str(e)}), 500
+
     return app
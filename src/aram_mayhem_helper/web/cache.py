@@ -0,0 +1,102 @@
+"""API 响应缓存：按 (端点, 参数, 数据版本) 缓存序列化后的响应字节，并由字节内容派生强 ETag。
+
+数据只在爬取/重载后变化，重复请求命中缓存时不再重建与序列化；浏览器携带
+``If-None-Match`` 时只需比较 ETag 即可返回 304。缓存键中的数据版本是进程内计数，
+只用于缓存查找；ETag 只取决于响应内容，服务重启、多进程 worker 之间同一内容的
+ETag 一致，内容不同则 ETag 必然不同。压缩后的字节（gzip，安装了
+可选依赖 ``brotli`` 时另有 br）与原始字节存于同一缓存条目，每个数据版本只压缩一次。
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from aram_mayhem_helper.utils.single_flight import SingleFlight
+
+try:
+    import brotli
+except ImportError:  # 可选依赖（pip install aram-mayhem-helper[brotli]），未安装时仅提供 gzip
+    brotli = None
+
+IDENTITY = "identity"
+# 按服务端偏好排序（同等 q 值时优先 br）
+SUPPORTED_ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+MIN_COMPRESS_SIZE = 1024  # 小于此字节数的响应压缩收益不抵开销，按原样返回
+
+
+def etag_for(body: bytes) -> str:
+    """由序列化后的原始响应字节派生强 ETag 值（不含引号）。"""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def variant_etag(etag: str, encoding: str) -> str:
+    """压缩表示与原始表示字节不同，强 ETag 需按编码区分。"""
+    return etag if encoding == IDENTITY else f"{etag}-{encoding}"
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """按编码压缩（gzip 固定 mtime，保证同一数据版本的字节确定）。
+
+    Raises:
+        ValueError: 不支持的编码
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        compressed: bytes = brotli.compress(body)
+        return compressed
+    raise ValueError(f"不支持的压缩编码: {encoding}")
+
+
+class ResponseCache:
+    """序列化响应的 LRU 缓存（线程安全），每个条目保存 ETag、原始字节及已生成的压缩变体。
+
+    Args:
+        maxsize: 最多缓存的响应数
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[str, dict[str, bytes]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._builds: SingleFlight[tuple[Hashable, ...], bytes] = SingleFlight()  # 并发未命中只构建一次
+
+    def get_or_build(
+        self, key: tuple[Hashable, ...], build: Callable[[], bytes], encoding: str = IDENTITY
+    ) -> tuple[str, bytes, str]:
+        """返回 (实际编码, 响应字节, ETag)；未命中时调用 ``build`` 生成原始字节并放入缓存（构建失败不缓存）。
+
+        原始字节小于 ``MIN_COMPRESS_SIZE`` 时不压缩，实际编码为 ``identity``。ETag 由原始字节
+        派生（按编码区分见 ``variant_etag``），每个条目只计算一次。
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                etag, variants = entry
+                if encoding in variants:
+                    return encoding, variants[encoding], etag
+        if entry is not None:
+            raw = variants[IDENTITY]
+        else:
+            raw = self._builds.do(key, build)
+            etag = etag_for(raw)
+        if encoding != IDENTITY and len(raw) < MIN_COMPRESS_SIZE:
+            encoding = IDENTITY
+        body = raw if encoding == IDENTITY else compress(raw, encoding)
+        with self._lock:
+            _, stored = self._entries.setdefault(key, (etag, {IDENTITY: raw}))
+            stored[encoding] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return encoding, body, etag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
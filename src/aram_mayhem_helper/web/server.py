@@ -0,0 +1,194 @@
+"""生产模式 Web 服务：waitress 多线程托管 Flask 应用，POSIX 下可预派生多个工作进程。
+
+启动顺序：先绑定监听端口并预热 GameData/响应缓存，再开始接受请求（fork 的工作进程
+直接继承预热后的内存，意外退出后重新拉起的进程先重新加载数据）；收到 SIGTERM/SIGINT 时停止接受新连接，等待进行中的请求
+完成后退出。运行期间监视数据目录，爬虫写入的新数据自动增量生效。未安装可选依赖 ``waitress`` 时回退到 Flask 开发服务器。
+"""
+
+import logging
+import os
+import signal
+import socket
+from types import FrameType
+from typing import Any
+
+from flask import Flask
+
+from aram_mayhem_helper.utils.config import SCORING_SOURCES, VALID_SOURCES, get_config
+from aram_mayhem_helper.utils.data import GameData, get_game_data
+from aram_mayhem_helper.utils.watcher import DataWatcher
+from aram_mayhem_helper.web.app import create_app
+
+try:
+    import waitress
+    from waitress.server import create_server
+except ImportError:  # 可选依赖（pip install aram-mayhem-helper[server]）
+    waitress = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THREADS = 8
+DEFAULT_WATCH_INTERVAL = 2.0
+
+
+def warm_up(app: Flask, game_data: GameData) -> int:
+    """预热数据与响应缓存：英雄表、各数据源的符文条目、摘要计数与英雄列表响应（含融合源）。
+
+    Returns:
+        已加载条目的 (英雄, 数据源) 数
+    """
+    loaded = 0
+    for source in VALID_SOURCES:
+        for champion_id in game_data.champion_ids():
+            # available_source 会读取并缓存条目，缺失/损坏的文件静默跳过
+            if game_data.available_source(champion_id, preferred=source) == source:
+                loaded += 1
+    client = app.test_client()
+    for source in SCORING_SOURCES:
+        client.get(f"/api/champions?source={source}")
+    logger.info(f"预热完成：已加载 {loaded} 份英雄符文数据")
+    return loaded
+
+
+def _raise_system_exit(signum: int, frame: FrameType | None) -> None:
+    """把 SIGTERM 转为 SystemExit：waitress 捕获后等待进行中的请求完成再退出。"""
+    raise SystemExit(0)
+
+
+def _serve_socket(app: Flask, sock: socket.socket, threads: int, watcher: DataWatcher | None) -> None:
+    server: Any = create_server(app, sockets=[sock], threads=threads, ident="aram-mayhem-helper")
+    if watcher is not None:
+        watcher.start()  # 每个工作进程各自监视（线程不随 fork 继承）
+    try:
+        server.run()  # 阻塞；SystemExit/KeyboardInterrupt 时关闭线程池后返回
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+def _run_worker(
+    app: Flask,
+    game_data: GameData,
+    sock: socket.socket,
+    threads: int,
+    watcher: DataWatcher | None,
+    *,
+    respawned: bool,
+) -> None:
+    """工作进程主体（fork 之后执行）。
+
+    父进程不监视数据目录，其内存中的数据停留在启动预热时；重新拉起的进程先重新加载
+    并预热，再由监视器以当前磁盘状态为基线，不遗漏前一进程存活期间及其宕机后的数据变化。
+    """
+    if respawned:
+        game_data.reload()
+        warm_up(app, game_data)
+    _serve_socket(app, sock, threads, watcher)
+
+
+def _serve_prefork(
+    app: Flask,
+    game_data: GameData,
+    sock: socket.socket,
+    workers: int,
+    threads: int,
+    watcher: DataWatcher | None,
+) -> None:
+    """预派生 ``workers`` 个进程共享监听套接字；意外退出的工作进程会被重新拉起（重新加载数据后再服务）。"""
+    children: set[int] = set()
+    stopping = False
+
+    def spawn(*, respawned: bool = False) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, _raise_system_exit)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            try:
+                _run_worker(app, game_data, sock, threads, watcher, respawned=respawned)
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+    logger.info(f"已启动 {workers} 个工作进程（每进程 {threads} 线程）")
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            logger.warning(f"工作进程 {pid} 意外退出（状态 {status}），重新拉起")
+            spawn(respawned=True)
+
+
+def serve(
+    host: str,
+    port: int,
+    *,
+    workers: int = 1,
+    threads: int = DEFAULT_THREADS,
+    watch_interval: float = DEFAULT_WATCH_INTERVAL,
+    game_data: GameData | None = None,
+) -> None:
+    """以生产模式启动网页应用（阻塞至收到停止信号）。
+
+    Args:
+        host: 监听地址
+        port: 监听端口
+        workers: 工作进程数（>1 需 POSIX 与 waitress）
+        threads: 每个工作进程的请求处理线程数
+        watch_interval: 数据目录监视间隔（秒），0 关闭监视（数据变化需重启生效）
+
+    Raises:
+        ValueError: workers/threads 非正数，或当前平台/依赖不支持多进程
+    """
+    if workers < 1 or threads < 1:
+        raise ValueError("workers/threads 必须为正整数")
+    if workers > 1 and (waitress is None or not hasattr(os, "fork")):
+        raise ValueError("多进程模式需要 POSIX 系统并安装 waitress（pip install aram-mayhem-helper[server]）")
+
+    gd = game_data or get_game_data()
+    app = create_app(gd)
+    watcher = DataWatcher(gd, get_config, interval=watch_interval) if watch_interval > 0 else None
+    if waitress is None:
+        logger.warning("未安装 waitress，回退到 Flask 开发服务器（不适合并发负载）")
+        warm_up(app, gd)
+        if watcher is not None:
+            watcher.start()
+        try:
+            app.run(host=host, port=port, debug=False, threaded=True)
+        finally:
+            if watcher is not None:
+                watcher.stop()
+        return
+
+    # 先绑定端口再预热：端口被占用时立即失败，预热期间到达的连接在 backlog 中排队
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.create_server((host, port), family=family, backlog=1024)
+    try:
+        warm_up(app, gd)
+        logger.info(f"启动网页应用 at http://{host}:{port}（waitress）")
+        if workers == 1:
+            previous = signal.signal(signal.SIGTERM, _raise_system_exit)
+            try:
+                _serve_socket(app, sock, threads, watcher)
+            finally:
+                signal.signal(signal.SIGTERM, previous)
+        else:
+            _serve_prefork(app, gd, sock, workers, threads, watcher)
+    finally:
+        sock.close()
+    logger.info("网页应用已停止")
@@ -3,12 +3,17 @@
 import json
 import logging
 import re
-from functools import lru_cache
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from aram_mayhem_helper.algorithm.augment_index import AugmentChampionIndex
 from aram_mayhem_helper.algorithm.pipeline import build_scored_groups
 from aram_mayhem_helper.utils.config import get_config
 from aram_mayhem_helper.utils.data import GameData
+from aram_mayhem_helper.utils.single_flight import single_flight_cache
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +21,7 @@ logger = logging.getLogger(__name__)
 # ── i18n 名称与符文描述（懒加载 + 缓存）────────────────────────────────────
 
 
-@lru_cache(maxsize=1)
+@single_flight_cache(maxsize=1)
 def _load_champion_i18n() -> dict[str, dict[str, Any]]:
     path = get_config().i18n_file
     if path.exists():
@@ -29,17 +34,47 @@ def _load_champion_i18n() -> dict[str, dict[str, Any]]:
     return {}
 
 
-@lru_cache(maxsize=1)
-def _load_augment_descriptions() -> dict[str, dict[str, Any]]:
+# 符文描述中的伪 HTML 标签，如 <scaleAF>、<attention>、<keyword>、<br>
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def clean_augment_descriptions(raw: dict[str, dict[str, Any]]) -> dict[str, str]:
+    """把原始符文描述文件压缩为 符文 ID → 去标签描述（丢弃 tooltip 变量、spellDataValues 等页面不用的字段）。"""
+    return {
+        str(augment_id): _TAG_PATTERN.sub("", str(info.get("description", "") or info.get("tooltip", "")))
+        for augment_id, info in raw.items()
+        if isinstance(info, dict)
+    }
+
+
+@single_flight_cache(maxsize=1)
+def _read_augment_descriptions(path: Path, mtime_ns: int, size: int) -> dict[str, str]:
+    """按文件元数据缓存预处理结果：描述文件更新后下次访问自动重建。"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, dict[str, Any]] = json.load(f)
+    except Exception as e:
+        logger.warning(f"读取符文描述文件失败: {e}")
+        return {}
+    descriptions = clean_augment_descriptions(raw)
+    logger.debug(f"已预处理 {len(descriptions)} 条符文描述")
+    return descriptions
+
+
+def _load_augment_descriptions() -> dict[str, str]:
+    """符文 ID → 清理过伪 HTML 标签的描述（每个文件版本只解析/清理一次）。"""
     path = get_config().augment_desc_file
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data: dict[str, dict[str, Any]] = json.load(f)
-                return data
-        except Exception as e:
-            logger.warning(f"读取符文描述文件失败: {e}")
-    return {}
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    return _read_augment_descriptions(path, stat.st_mtime_ns, stat.st_size)
+
+
+def preload_text_tables() -> None:
+    """启动时加载英雄 i18n 与预处理符文描述表，首个请求无需解析原始文件。"""
+    _load_champion_i18n()
+    _load_augment_descriptions()
 
 
 def champion_display_name(champion_id: str) -> str:
@@ -57,23 +92,22 @@ def champion_alias(champion_id: str) -> str:
 
 def augment_description(augment_id: str) -> str:
     """返回清理过伪 HTML 标签的符文描述。"""
-    info = _load_augment_descriptions().get(augment_id, {})
-    desc = str(info.get("description", "") or info.get("tooltip", ""))
-    # Strip pseudo-HTML tags like <scaleAF>, <attention>, <keyword>, etc.
-    desc = re.sub(r"<[^>]+>", "", desc)
-    return desc
+    return _load_augment_descriptions().get(augment_id, "")
 
 
 # ── 列表/明细构建 ─────────────────────────────────────────────────────────
 
 
-def build_champion_augments(game_data: GameData, champion_id: str, source: str | None = None) -> list[dict[str, Any]]:
+def build_champion_augments(
+    game_data: GameData, champion_id: str, source: str | None = None, dataset: str | None = None
+) -> list[dict[str, Any]]:
     """构建单个英雄的归一化符文数据（JSON 记录形状与排序保持历史行为）。
 
     Args:
         game_data: 数据仓储
         champion_id: 英雄ID
-        source: 数据源（"opgg"/"aramkit"），None 时取配置默认
+        source: 数据源（"opgg"/"aramkit"/"blended"），None 时取配置默认
+        dataset: 数据集（aramkit "all"/"high"），None 时取配置
     """
     source = source or game_data.default_source()
     champion_name = game_data.champion_name(champion_id)
@@ -81,26 +115,33 @@ def build_champion_augments(game_data: GameData, champion_id: str, source: str |
         return []
 
     try:
-        entries = game_data.augment_entries(champion_id, source)
+        entries = game_data.augment_entries(champion_id, source, dataset)
     except Exception:
         logger.warning(f"无法读取英雄 {champion_id} 的符文数据，已跳过")
         return []
     if entries is None:
         return []
 
+    entries = [dict(entry) for entry in entries]  # 打分字段原地写入，不改动 GameData 共享的缓存条目
     config = get_config()
     build_scored_groups(
         entries,
         lookup=lambda augment_id: game_data.augment_info(augment_id),
         tau_factor=config.suggest.shrinkage_tau_factor,
         sigmoid_steepness=config.suggest.sigmoid_steepness,
+        scorer=config.suggest.scorer,
+        source=source,
         assign_rank=False,
         champion_id=champion_id,
         logger=logger,
     )
 
-    # 显示尺度统一：aramkit 原生 0~1（winRate/pickRate），×100 与 OP.GG 的 0-100 一致
-    display_scale = 100 if source == "aramkit" else 1
+    # 显示尺度统一：aramkit 原生 0~1（winRate/pickRate）与融合源的 0~1 缩放值，×100 与 OP.GG 的 0-100 一致
+    display_scale = 1 if source == "opgg" else 100
+    # 英雄级字段与描述表每次请求只取一次，逐行仅做字典查找
+    champion_name_cn = champion_display_name(champion_id)
+    alias = champion_alias(champion_id)
+    descriptions = _load_augment_descriptions()
     rows: list[dict[str, Any]] = []
     for entry in entries:
         perf = entry.get("performance")
@@ -119,11 +160,11 @@ def build_champion_augments(game_data: GameData, champion_id: str, source: str |
             {
                 "champion_id": champion_id,
                 "champion_name": champion_name,
-                "champion_name_cn": champion_display_name(champion_id),
-                "champion_alias": champion_alias(champion_id),
+                "champion_name_cn": champion_name_cn,
+                "champion_alias": alias,
                 "augment_id": str(item_id),
                 "augment_name": entry["name"],
-                "description": augment_description(str(item_id)),
+                "description": descriptions.get(str(item_id), ""),
                 "level": entry["level"],
                 "performance": perf,
                 "popular": pop,
@@ -139,32 +180,183 @@ def build_champion_augments(game_data: GameData, champion_id: str, source: str |
     return rows
 
 
-def build_champion_list(game_data: GameData, source: str | None = None) -> list[dict[str, Any]]:
-    """返回所有已缓存符文数据的英雄摘要列表。"""
+# 列式格式中英雄级字段只出现一次，其余字段按列输出并行数组
+CHAMPION_COLUMNS = ("champion_id", "champion_name", "champion_name_cn", "champion_alias")
+AUGMENT_COLUMNS = (
+    "augment_id",
+    "augment_name",
+    "description",
+    "level",
+    "performance",
+    "popular",
+    "performance_display",
+    "popular_display",
+    "performance_unit",
+    "popular_unit",
+    "weighted_sum",
+    "performance_norm",
+    "popular_norm",
+)
+
+
+def to_columnar(game_data: GameData, champion_id: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """把 ``build_champion_augments`` 的逐行记录转为列式：英雄元数据一次 + 每列一个数组。
+
+    Returns:
+        ``{"champion": {...} | None, "count": n, "columns": {列名: [值, ...]}}``；
+        英雄未知时 ``champion`` 为 None
+    """
+    champion: dict[str, Any] | None
+    if rows:
+        champion = {key: rows[0][key] for key in CHAMPION_COLUMNS}
+    else:
+        champion_name = game_data.champion_name(champion_id)
+        champion = (
+            {
+                "champion_id": champion_id,
+                "champion_name": champion_name,
+                "champion_name_cn": champion_display_name(champion_id),
+                "champion_alias": champion_alias(champion_id),
+            }
+            if champion_name
+            else None
+        )
+    return {
+        "champion": champion,
+        "count": len(rows),
+        "columns": {column: [row[column] for row in rows] for column in AUGMENT_COLUMNS},
+    }
+
+
+# 可作为 ``sort`` 参数的列
+SORTABLE_COLUMNS = (
+    "augment_name",
+    "level",
+    "performance",
+    "popular",
+    "performance_display",
+    "popular_display",
+    "weighted_sum",
+    "performance_norm",
+    "popular_norm",
+)
+
+
+@dataclass(frozen=True)
+class AugmentQuery:
+    """符文表查询参数（筛选 → 排序 → 分页）。
+
+    Attributes:
+        levels: 允许的等级集合，None 为不限
+        search: 符文名称子串（不区分大小写），空串为不限
+        min_performance: 最低表现（展示尺度，0~100）
+        min_popular: 最低流行度（展示尺度，0~100）
+        sort: 排序列（``SORTABLE_COLUMNS`` 之一），None 保持数据文件顺序
+        descending: 是否降序（同值保持文件顺序）
+        offset: 跳过的行数
+        limit: 最多返回的行数，None 为全部
+    """
+
+    levels: frozenset[str] | None = None
+    search: str = ""
+    min_performance: float = 0.0
+    min_popular: float = 0.0
+    sort: str | None = None
+    descending: bool = False
+    offset: int = 0
+    limit: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.sort is not None and self.sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"不支持的排序列: {self.sort}")
+        if self.offset < 0 or (self.limit is not None and self.limit < 0):
+            raise ValueError("offset/limit 不能为负")
+
+
+class AugmentTable:
+    """单个英雄符文表的查询索引：筛选列数组 + 每个可排序列的升/降序下标数组（构建时预排序）。"""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self._levels = np.array([row["level"] for row in rows], dtype=object)
+        self._names = [str(row["augment_name"]).lower() for row in rows]
+        self._perf_display = np.array([row["performance_display"] for row in rows], dtype=np.float64)
+        self._pop_display = np.array([row["popular_display"] for row in rows], dtype=np.float64)
+        self._orders: dict[tuple[str, bool], np.ndarray[Any, Any]] = {}
+        for column in SORTABLE_COLUMNS:
+            ascending = sorted(range(len(rows)), key=lambda i: rows[i][column])
+            # reverse=True 的 sorted 同样稳定：同值保持文件顺序（与页面原 Array.sort 行为一致）
+            descending = sorted(range(len(rows)), key=lambda i: rows[i][column], reverse=True)
+            self._orders[(column, False)] = np.array(ascending, dtype=np.intp)
+            self._orders[(column, True)] = np.array(descending, dtype=np.intp)
+
+    def query(self, query: AugmentQuery) -> tuple[list[dict[str, Any]], int]:
+        """执行查询，返回 (当前页的行, 筛选后总行数)。"""
+        mask = (self._perf_display >= query.min_performance) & (self._pop_display >= query.min_popular)
+        if query.levels is not None:
+            mask &= np.isin(self._levels, list(query.levels))
+        if query.search:
+            needle = query.search.lower()
+            mask &= np.fromiter((needle in name for name in self._names), dtype=bool, count=len(self._names))
+        if query.sort is None:
+            selected = np.flatnonzero(mask)
+        else:
+            order = self._orders[(query.sort, query.descending)]
+            selected = order[mask[order]]
+        end = None if query.limit is None else query.offset + query.limit
+        return [self.rows[i] for i in selected[query.offset : end]], len(selected)
+
+
+def build_champion_list(
+    game_data: GameData, source: str | None = None, dataset: str | None = None
+) -> list[dict[str, Any]]:
+    """返回所有英雄的摘要列表（符文数取自持久化摘要索引，不逐个解析英雄数据文件）。"""
     source = source or game_data.default_source()
+    counts = game_data.augment_counts(source, dataset)
     champions: list[dict[str, Any]] = []
     for cid in game_data.champion_ids():
         cname = game_data.champion_name(cid)
         if not cname:
             continue
-        count = 0
-        try:
-            entries = game_data.augment_entries(cid, source)
-            if entries:
-                count = sum(
-                    1
-                    for e in entries
-                    if e.get("performance") is not None and e.get("popular", 0) != 0 and e.get("id") is not None
-                )
-        except Exception:
-            count = 0
         champions.append(
             {
                 "champion_id": cid,
                 "champion_name": cname,
                 "champion_name_cn": champion_display_name(cid),
                 "champion_alias": champion_alias(cid),
-                "augment_count": count,
+                "augment_count": counts.get(cid, 0),
             }
         )
     return champions
+
+
+def build_augment_leaderboard(
+    game_data: GameData, index: AugmentChampionIndex, augment_id: str, limit: int | None = None
+) -> dict[str, Any]:
+    """单个符文的跨英雄排行（按综合评分降序）。
+
+    Args:
+        game_data: 数据仓储
+        index: 对应数据源的符文倒排索引
+        augment_id: 符文ID
+        limit: 最多返回的英雄数，None 为全部
+    """
+    info = game_data.augment_info(augment_id) or {}
+    champions = [
+        {
+            "champion_id": score.champion_id,
+            "champion_name": game_data.champion_name(score.champion_id),
+            "champion_name_cn": champion_display_name(score.champion_id),
+            "weighted_sum": score.weighted_sum,
+            "rank": score.rank,
+            "group_size": score.group_size,
+        }
+        for score in index.champions_for(augment_id, limit)
+    ]
+    return {
+        "augment_id": augment_id,
+        "augment_name": info.get("name"),
+        "level": info.get("level"),
+        "source": index.source,
+        "champions": champions,
+    }
@@ -1,6 +1,7 @@
 """共享测试夹具：将 tests/fixtures/ 复制到临时数据目录并构造注入 fixture 的 GameData。"""
 
 import json
+import logging
 import shutil
 from dataclasses import replace
 from pathlib import Path
@@ -13,6 +14,25 @@ from aram_mayhem_helper.utils.data import GameData
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def isolated_logging(tmp_path_factory: pytest.TempPathFactory, monkeypatch):
+    """日志文件（setup_logging 与 OCR 计时日志）写入临时目录，测试后恢复 logger 配置（不污染仓库 logs/ 与 caplog）。"""
+    log_root = tmp_path_factory.mktemp("project")  # 不占用测试自身的 tmp_path
+    (log_root / "logs").mkdir()
+    for module in ("aram_mayhem_helper.utils.log_config", "aram_mayhem_helper.ocr.ocr_tool"):
+        monkeypatch.setattr(f"{module}.get_config", lambda: replace(get_config(), project_root=log_root))
+    loggers = [logging.getLogger(name) for name in ("aram_mayhem_helper", "aram_mayhem_helper.perf")]
+    saved = [(list(logger.handlers), logger.level, logger.propagate) for logger in loggers]
+    yield
+    for logger, (handlers, level, propagate) in zip(loggers, saved, strict=True):
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handler.close()
+        logger.handlers[:] = handlers
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+
 @pytest.fixture
 def fixture_data_dir(tmp_path: Path) -> Path:
     """复制 fixtures 到 tmp_path/data，返回该目录。"""
@@ -37,3 +57,18 @@ def game_data(app_config) -> GameData:
 def fixture_trans_table() -> dict[str, dict]:
     """fixture 翻译表内容（augment_trans.json）。"""
     return json.loads((FIXTURES_DIR / "augment_trans.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def high_dataset(fixture_data_dir: Path) -> Path:
+    """在 fixture 数据目录中写入 aramkit 高分段数据集（103 的胜率顺序与 all 相反），返回该文件。"""
+    source = fixture_data_dir / "aramkit" / "aram_augments" / "all" / "103.json"
+    payload = json.loads(source.read_text(encoding="utf-8"))
+    records = payload["augments"]["all"]
+    win_rates = [record["winRate"] for record in records]
+    for record, win_rate in zip(records, reversed(win_rates), strict=True):
+        record["winRate"] = win_rate
+    target = fixture_data_dir / "aramkit" / "aram_augments" / "high" / "103.json"
+    target.parent.mkdir(parents=True)
+    target.write_text(json.dumps(payload), encoding="utf-8")
+    return target
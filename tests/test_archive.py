@@ -0,0 +1,117 @@
+"""utils.archive 历史归档测试（内容去重 / 版本清单 / 列式时序索引）。"""
+
+import json
+
+import pytest
+
+from aram_mayhem_helper.utils.archive import StatsArchive
+
+
+def _write_opgg(path, performance: float) -> None:
+    path.write_text(json.dumps({"data": [{"id": 1001, "performance": performance, "popular": 10.0}]}), encoding="utf-8")
+
+
+@pytest.fixture
+def archive(app_config) -> StatsArchive:
+    return StatsArchive(app_config.archive_dir)
+
+
+class TestRecord:
+    def test_unchanged_champions_are_deduplicated(self, archive, app_config) -> None:
+        first = archive.record("opgg", "all", "2026-10-01", app_config.opgg_augment_dir)
+        assert (first.champions, first.new_objects) == (2, 2)
+        _write_opgg(app_config.opgg_augment_dir / "22.json", 51.0)
+        second = archive.record("opgg", "all", "2026-10-02", app_config.opgg_augment_dir)
+        assert (second.champions, second.new_objects) == (2, 1)  # 103 未变化，只记录引用
+        objects = list((app_config.archive_dir / "objects").rglob("*.json.gz"))
+        assert len(objects) == 3
+
+    def test_reformatted_file_reuses_object(self, archive, app_config) -> None:
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        path = app_config.opgg_augment_dir / "103.json"
+        path.write_text(json.dumps(json.loads(path.read_text(encoding="utf-8")), indent=4), encoding="utf-8")
+        assert archive.record("opgg", "all", "v2", app_config.opgg_augment_dir).new_objects == 0
+
+    def test_rerecording_version_replaces_it(self, archive, app_config) -> None:
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        (app_config.opgg_augment_dir / "22.json").unlink()
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        versions = archive.versions("opgg", "all")
+        assert [v.version for v in versions] == ["v1"]
+        assert set(versions[0].champions) == {"103"}
+
+    def test_corrupt_file_is_skipped(self, archive, app_config) -> None:
+        (app_config.opgg_augment_dir / "22.json").write_text("{broken", encoding="utf-8")
+        assert archive.record("opgg", "all", "v1", app_config.opgg_augment_dir).champions == 1
+
+    def test_corrupt_manifest_is_backed_up_not_overwritten(self, archive, app_config) -> None:
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        manifest = app_config.archive_dir / "manifests" / "opgg-all.json"
+        manifest.write_text("{broken", encoding="utf-8")
+        with pytest.raises(ValueError, match="归档清单损坏"):
+            archive.record("opgg", "all", "v2", app_config.opgg_augment_dir)
+        with pytest.raises(ValueError):
+            archive.trend("opgg", "all", "22", "1001")
+        assert manifest.read_text(encoding="utf-8") == "{broken"  # 未被新版本清单覆盖
+        assert (manifest.parent / "opgg-all.json.corrupt").read_text(encoding="utf-8") == "{broken"
+
+    def test_load_restores_historical_payload(self, archive, app_config) -> None:
+        path = app_config.opgg_augment_dir / "22.json"
+        original = json.loads(path.read_text(encoding="utf-8"))
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        _write_opgg(path, 40.0)
+        archive.record("opgg", "all", "v2", app_config.opgg_augment_dir)
+        assert archive.load("opgg", "all", "v1", "22") == original
+        with pytest.raises(KeyError):
+            archive.load("opgg", "all", "v3", "22")
+
+
+class TestTrend:
+    def test_trend_follows_versions(self, archive, app_config) -> None:
+        path = app_config.opgg_augment_dir / "22.json"
+        for version, performance in (("v1", 50.0), ("v2", 55.0), ("v3", 55.0)):
+            _write_opgg(path, performance)
+            archive.record("opgg", "all", version, app_config.opgg_augment_dir)
+        points = archive.trend("opgg", "all", "22", "1001")
+        assert [(p.version, p.performance, p.popular) for p in points] == [
+            ("v1", 50.0, 10.0),
+            ("v2", 55.0, 10.0),
+            ("v3", 55.0, 10.0),
+        ]
+        assert archive.trend("opgg", "all", "22", "9999") == []
+
+    def test_aramkit_trend_keeps_sample_count(self, archive, app_config) -> None:
+        archive.record("aramkit", "all", "16.1-20260101-a", app_config.aramkit_augment_dir)
+        [point] = archive.trend("aramkit", "all", "103", "1001")
+        assert (point.performance, point.popular, point.sample_count) == (0.55, 0.1, 1000)
+
+    def test_index_is_persisted_and_extended_incrementally(self, archive, app_config) -> None:
+        path = app_config.opgg_augment_dir / "22.json"
+        _write_opgg(path, 50.0)
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        archive.trend("opgg", "all", "22", "1001")
+        assert (app_config.archive_dir / "index" / "opgg-all.npz").exists()
+
+        reopened = StatsArchive(app_config.archive_dir)
+        _write_opgg(path, 60.0)
+        reopened.record("opgg", "all", "v2", app_config.opgg_augment_dir)
+        parsed: list[str] = []
+        original = reopened._read_object
+        reopened._read_object = lambda digest: parsed.append(digest) or original(digest)  # type: ignore[method-assign]
+        assert [p.performance for p in reopened.trend("opgg", "all", "22", "1001")] == [50.0, 60.0]
+        assert len(parsed) == 1  # 只解析新版本中变化的对象
+
+    def test_unreadable_object_is_marked_once(self, archive, app_config, monkeypatch) -> None:
+        archive.record("opgg", "all", "v1", app_config.opgg_augment_dir)
+        for path in (app_config.archive_dir / "objects").rglob("*.json.gz"):
+            path.write_bytes(b"not gzip")
+        parsed: list[str] = []
+        original = archive._read_object
+        archive._read_object = lambda digest: parsed.append(digest) or original(digest)  # type: ignore[method-assign]
+        saves: list[str] = []
+        original_save = archive._save_index
+        monkeypatch.setattr(archive, "_save_index", lambda *args: saves.append(args[0]) or original_save(*args))
+        assert archive.trend("opgg", "all", "22", "1001") == []
+        assert archive.trend("opgg", "all", "103", "1001") == []
+        assert (len(parsed), len(saves)) == (2, 1)  # 损坏对象只读取一次，索引只保存一次
+        assert StatsArchive(app_config.archive_dir).trend("opgg", "all", "22", "1001") == []
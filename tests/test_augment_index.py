@@ -0,0 +1,123 @@
+"""algorithm.augment_index 倒排索引测试（排行正确性 + 增量更新 + web/CLI 入口）。"""
+
+import json
+
+import pytest
+
+import aram_mayhem_helper.cli as cli
+from aram_mayhem_helper.algorithm.augment_index import AugmentChampionIndex
+from aram_mayhem_helper.algorithm.suggest import Suggest
+from aram_mayhem_helper.utils.config import get_config
+from aram_mayhem_helper.web.app import create_app
+
+ASHE_ENTRIES = [
+    {"id": 1001, "performance": 55.0, "popular": 30.0},
+    {"id": 1004, "performance": 50.0, "popular": 10.0},
+    {"id": 1005, "performance": 90.0, "popular": 20.0},
+    {"id": 1002, "performance": 60.0, "popular": 15.0},
+    {"id": 1003, "performance": 40.0, "popular": 5.0},
+    {"id": 1006, "performance": 65.0, "popular": 25.0},
+]
+
+
+def _write_ashe(fixture_data_dir, entries) -> None:
+    (fixture_data_dir / "opgg" / "aram_augments" / "22.json").write_text(
+        json.dumps({"data": entries}), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def index(game_data, fixture_data_dir) -> AugmentChampionIndex:
+    _write_ashe(fixture_data_dir, ASHE_ENTRIES)
+    return AugmentChampionIndex(game_data, source="opgg", thresholds=get_config().suggest)
+
+
+class TestAugmentChampionIndex:
+    def test_ranks_champions_by_weighted_sum(self, index, game_data) -> None:
+        ranked = index.champions_for("1005")
+        assert [s.champion_id for s in ranked] == ["22", "103"]
+        assert ranked[0].weighted_sum > ranked[1].weighted_sum
+        # 与单英雄 Suggest 的分数/排名一致
+        item = Suggest("103", game_data, source="opgg", thresholds=get_config().suggest).get_augment_info_by_id("1005")
+        assert (ranked[1].weighted_sum, ranked[1].rank, ranked[1].group_size) == (
+            item["weighted_sum"],
+            item["rank"],
+            item["group_size"],
+        )
+
+    def test_limit_and_unknown_augment(self, index) -> None:
+        assert len(index.champions_for("1005", limit=1)) == 1
+        assert index.champions_for("9999") == ()  # 未收录于翻译表，不参与打分
+        assert index.champions_for("424242") == ()
+
+    def test_refresh_only_rescoring_changed_champions(self, index, game_data, fixture_data_dir) -> None:
+        assert index.refresh() == 3  # 首次构建：103、22 以及无数据的 266
+        assert index.refresh() == 0  # 数据未重载
+        game_data.reload()
+        assert index.refresh() == 0  # 重载但内容未变
+        _write_ashe(fixture_data_dir, [{**e, "performance": 100.0 - e["performance"]} for e in ASHE_ENTRIES])
+        game_data.reload()
+        assert index.refresh() == 1
+        assert [s.champion_id for s in index.champions_for("1005")] == ["103", "22"]
+
+    def test_removed_champion_data_drops_out(self, index, game_data, fixture_data_dir) -> None:
+        assert len(index.champions_for("1005")) == 2
+        (fixture_data_dir / "opgg" / "aram_augments" / "22.json").unlink()
+        game_data.reload()
+        assert [s.champion_id for s in index.champions_for("1005")] == ["103"]
+
+
+class TestAugmentChampionsEntrypoints:
+    def test_api_endpoint(self, index, game_data, monkeypatch) -> None:
+        import aram_mayhem_helper.web.service as service
+
+        monkeypatch.setattr(service, "_load_champion_i18n", lambda: {})
+        client = create_app(game_data).test_client()
+        body = client.get("/api/augments/1005/champions?source=opgg&limit=5").get_json()
+        assert body["augment_name"] == "测试坚决"
+        assert body["source"] == "opgg"
+        assert [c["champion_name"] for c in body["champions"]] == ["Ashe", "Ahri"]
+        assert set(body["champions"][0]) == {
+            "champion_id",
+            "champion_name",
+            "champion_name_cn",
+            "weighted_sum",
+            "rank",
+            "group_size",
+        }
+        assert client.get("/api/augments/424242/champions").get_json()["champions"] == []
+
+    @pytest.mark.parametrize("query", ["source=bogus", "source=opgg&limit=-1"])
+    def test_api_rejects_bad_params(self, game_data, query) -> None:
+        client = create_app(game_data).test_client()
+        assert client.get(f"/api/augments/1005/champions?{query}").status_code == 400
+
+    def test_index_only_built_for_valid_sources(self, game_data, monkeypatch) -> None:
+        import aram_mayhem_helper.web.app as web_app
+
+        built: list[str] = []
+        real_index = web_app.AugmentChampionIndex
+
+        def spy(data, *, source, thresholds):
+            built.append(source)
+            return real_index(data, source=source, thresholds=thresholds)
+
+        monkeypatch.setattr(web_app, "AugmentChampionIndex", spy)
+        client = create_app(game_data).test_client()
+        for source in ("bogus", "x" * 64, "opgg", ""):
+            client.get(f"/api/augments/1005/champions?source={source}")
+        assert set(built) == {"opgg", game_data.default_source()}  # 非法参数不建索引，空参数取默认源
+
+    def test_cli_accepts_name_or_id(self, index, game_data, app_config, monkeypatch, capsys) -> None:
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        assert cli.augment_champions("测试坚决", source="opgg") == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("测试坚决（ID 1005")
+        assert "Ashe" in lines[1]
+        assert cli.augment_champions("424242", source="opgg") == 1
+        assert cli.augment_champions("不存在的符文", source="opgg") == 1
+
+    def test_parse_args(self) -> None:
+        args = cli.parse_args(["augment-champions", "1005", "--source", "aramkit", "--limit", "3"])
+        assert (args.augment, args.source, args.limit) == ("1005", "aramkit", 3)
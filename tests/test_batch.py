@@ -0,0 +1,109 @@
+"""algorithm.batch 批量推荐测试（与单英雄 Suggest 结论一致性 + CLI JSONL 流）。"""
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+import aram_mayhem_helper.cli as cli
+from aram_mayhem_helper.algorithm.batch import MISSING, TIER_ORDER, suggest_batch
+from aram_mayhem_helper.algorithm.suggest import Suggest, SuggestCache
+from aram_mayhem_helper.utils.config import get_config
+
+
+def _batch(game_data, champions, augments, **kwargs):
+    return suggest_batch(champions, augments, game_data, thresholds=get_config().suggest, **kwargs)
+
+
+class TestSuggestBatch:
+    def test_matches_single_champion_verdicts(self, game_data) -> None:
+        result = _batch(
+            game_data,
+            ["103", "103"],
+            [["1001", "1002", "1005"], ["1004", "9999", "1003"]],
+            source="opgg",
+        )
+        single = Suggest("103", game_data, source="opgg", thresholds=get_config().suggest)
+        for row, ids in enumerate(result.augment_ids):
+            for col, augment_id in enumerate(ids):
+                verdict = single.get_verdict(augment_id)
+                if verdict is None:
+                    assert result.tier_codes[row, col] == MISSING
+                    assert np.isnan(result.weighted_sums[row, col])
+                    continue
+                assert TIER_ORDER[result.tier_codes[row, col]] is verdict.tier
+                assert (result.ranks[row, col], result.group_sizes[row, col]) == (verdict.rank, verdict.group_size)
+        assert list(result.sources) == ["opgg", "opgg"]
+
+    def test_best_index_picks_highest_weighted_sum(self, game_data) -> None:
+        result = _batch(game_data, ["103", "103"], [["1001", "1005", "1004"], ["9999"]], source="opgg")
+        assert list(result.best_index()) == [1, MISSING]  # 1005 ws=0.6746 为组内最高
+
+    def test_ragged_rows_are_padded(self, game_data) -> None:
+        result = _batch(game_data, ["103", "103"], [["1001"], ["1001", "1002", "1003"]], source="opgg")
+        assert result.augment_ids.shape == (2, 3)
+        assert list(result.augment_ids[0]) == ["1001", "", ""]
+        assert list(result.tier_codes[0, 1:]) == [MISSING, MISSING]
+
+    def test_champion_without_data_falls_back_or_reports_none(self, game_data) -> None:
+        result = _batch(game_data, ["22", "266"], [["1001"], ["1001"]], source="aramkit")
+        assert list(result.sources) == ["opgg", None]  # 22 回退 opgg；266 两源均无数据
+        assert (result.tier_codes == MISSING).all()  # 22 的条目 popular 全为 0，均被过滤
+
+    def test_scores_each_champion_once(self, game_data) -> None:
+        cache = SuggestCache()
+        _batch(game_data, ["103"] * 50, [["1001", "1002", "1003"]] * 50, source="opgg", cache=cache)
+        assert len(cache) == 1
+
+    def test_records_are_json_ready(self, game_data) -> None:
+        result = _batch(game_data, ["103"], [["1001", "9999"]], source="opgg")
+        (record,) = list(result.records())
+        assert record == {
+            "champion_id": "103",
+            "source": "opgg",
+            "augments": [
+                {"augment_id": "1001", "tier": "consider", "rank": 2, "group_size": 3, "weighted_sum": 0.5},
+                {"augment_id": "9999", "tier": None, "rank": None, "group_size": None, "weighted_sum": None},
+            ],
+            "best_augment_id": "1001",
+        }
+        json.dumps(record, ensure_ascii=False)
+
+    def test_empty_input(self, game_data) -> None:
+        result = _batch(game_data, [], [])
+        assert len(result) == 0
+        assert list(result.records()) == []
+
+    def test_length_mismatch_raises(self, game_data) -> None:
+        with pytest.raises(ValueError):
+            _batch(game_data, ["103"], [])
+
+
+class TestSuggestBatchCommand:
+    def test_streams_jsonl_in_chunks(self, monkeypatch, game_data, app_config) -> None:
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        lines = [json.dumps({"champion_id": "103", "augments": ["1001", "1002", "1005"]})] * 5
+        out = io.StringIO()
+        assert cli.suggest_batch_command(io.StringIO("\n".join(lines)), out, source="opgg", chunk_size=2) == 0
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert len(records) == 5
+        assert records[0]["best_augment_id"] == "1005"
+
+    def test_invalid_lines_are_skipped(self, monkeypatch, game_data, app_config) -> None:
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        text = '{"champion_id": "103", "augments": ["1001"]}\nnot json\n\n{"augments": []}\n'
+        out = io.StringIO()
+        assert cli.suggest_batch_command(io.StringIO(text), out, source="opgg") == 1
+        assert len(out.getvalue().splitlines()) == 1
+
+    def test_cli_routes_input_file(self, monkeypatch, tmp_path, game_data, app_config, capsys) -> None:
+        monkeypatch.setattr(cli, "setup_logging", lambda: None)
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        queries = tmp_path / "queries.jsonl"
+        queries.write_text(json.dumps({"champion_id": "103", "augments": ["1001"]}) + "\n", encoding="utf-8")
+        assert cli.cli_main(["suggest-batch", "--input", str(queries), "--source", "opgg"]) == 0
+        assert json.loads(capsys.readouterr().out)["augments"][0]["tier"] == "consider"
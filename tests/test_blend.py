@@ -0,0 +1,38 @@
+"""utils.blend 两源融合测试（按 ID 对齐、源内缩放、样本量加权）。"""
+
+import pytest
+
+from aram_mayhem_helper.utils.blend import blend_augment_records
+
+OPGG = [
+    {"id": 1, "performance": 80.0, "popular": 10.0},
+    {"id": 2, "performance": 60.0, "popular": 30.0},
+    {"id": 4, "performance": 70.0, "popular": 0.0},  # 未被选取，不参与融合
+]
+ARAMKIT = [
+    {"id": 1, "performance": 0.5, "popular": 0.1, "sampleCount": 300},
+    {"id": 3, "performance": 0.6, "popular": 0.3, "sampleCount": 100},
+]
+
+
+class TestBlendAugmentRecords:
+    def test_aligns_by_id_and_weights_by_samples(self) -> None:
+        blended = {record["id"]: record for record in blend_augment_records(OPGG, ARAMKIT)}
+        assert set(blended) == {1, 2, 3}
+        # OP.GG 按选取占比 (0.25/0.75) 分摊 aramkit 总样本 400 → 100/300
+        assert blended[1] == {"id": 1, "performance": 0.25, "popular": 0.25, "sampleCount": 400}
+        assert blended[2] == {"id": 2, "performance": 0.0, "popular": 0.75, "sampleCount": 300}
+        assert blended[3] == {"id": 3, "performance": 1.0, "popular": 0.75, "sampleCount": 100}
+
+    def test_single_source_keeps_its_scaled_values(self) -> None:
+        records = blend_augment_records(None, ARAMKIT)
+        assert [(r["id"], r["performance"], r["popular"]) for r in records] == [(1, 0.0, 0.25), (3, 1.0, 0.75)]
+        assert [r["id"] for r in blend_augment_records(OPGG, [])] == [1, 2]
+
+    def test_missing_sample_counts_weight_sources_equally(self) -> None:
+        aramkit = [{k: v for k, v in entry.items() if k != "sampleCount"} for entry in ARAMKIT]
+        [first] = [r for r in blend_augment_records(OPGG, aramkit) if r["id"] == 1]
+        assert first["performance"] == pytest.approx(0.5)
+
+    def test_no_entries_returns_empty(self) -> None:
+        assert blend_augment_records(None, None) == []
@@ -1,11 +1,17 @@
 """cli 参数解析与分发行为测试。"""
 
+import json
 import sys
+import threading
+import time
+from dataclasses import replace
 
 import pytest
 
 import aram_mayhem_helper.cli as cli
 from aram_mayhem_helper.cli import parse_args
+from aram_mayhem_helper.utils.config import StorageConfig
+from aram_mayhem_helper.utils.data import GameData
 
 
 def _parse(monkeypatch: pytest.MonkeyPatch, argv: list[str]):
@@ -44,11 +50,17 @@ class TestParseArgs:
         args = _parse(monkeypatch, ["web"])
         assert args.command == "web"
         assert (args.host, args.port) == ("127.0.0.1", 5000)
+        assert (args.workers, args.threads) == (1, 8)
 
     def test_web_custom_host_port(self, monkeypatch) -> None:
         args = _parse(monkeypatch, ["web", "--host", "0.0.0.0", "--port", "8000"])
         assert (args.host, args.port) == ("0.0.0.0", 8000)
 
+    def test_live_client_stub_defaults(self, monkeypatch) -> None:
+        args = _parse(monkeypatch, ["live-client-stub"])
+        assert args.command == "live-client-stub"
+        assert (args.port, args.champion, args.benchmark, args.no_tls) == (2999, "Ahri", 0, False)
+
     def test_no_command_returns_none(self, monkeypatch) -> None:
         assert _parse(monkeypatch, []).command is None
 
@@ -102,32 +114,168 @@ class TestCliMain:
         assert called == [(5, 999, "high")]
 
     def test_routes_web_with_host_port(self, monkeypatch) -> None:
-        class FakeApp:
-            def __init__(self) -> None:
-                self.kwargs = None
+        calls = []
+
+        def fake_serve(host, port, **kwargs) -> None:
+            calls.append((host, port, kwargs))
 
-            def run(self, **kwargs) -> None:
-                self.kwargs = kwargs
+        monkeypatch.setattr("aram_mayhem_helper.web.server.serve", fake_serve)
+        self._stub(monkeypatch)
+        assert cli.cli_main(["web", "--host", "0.0.0.0", "--port", "8000", "--workers", "2"]) == 0
+        assert calls == [("0.0.0.0", 8000, {"workers": 2, "threads": 8, "watch_interval": 2.0})]
 
-        fake_app = FakeApp()
-        monkeypatch.setattr("aram_mayhem_helper.web.create_app", lambda: fake_app)
+    def test_web_invalid_workers_returns_error(self, monkeypatch) -> None:
         self._stub(monkeypatch)
-        assert cli.cli_main(["web", "--host", "0.0.0.0", "--port", "8000"]) == 0
-        assert fake_app.kwargs == {"host": "0.0.0.0", "port": 8000, "debug": False}
+        assert cli.cli_main(["web", "--threads", "0"]) == 1
+
+    def test_ingest_requires_sqlite_backend(self, monkeypatch, game_data) -> None:
+        self._stub(monkeypatch, get_game_data=lambda: game_data)
+        assert cli.cli_main(["ingest"]) == 1
+
+    def test_ingest_prints_leaderboard(self, monkeypatch, app_config, capsys) -> None:
+        config = replace(app_config, storage=StorageConfig(backend="sqlite"))
+        self._stub(monkeypatch, get_game_data=lambda: GameData(config))
+        assert cli.cli_main(["ingest", "--leaderboard", "2", "--source", "opgg"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("已导入 3 份")
+        assert "泰坦的坚决" in lines[1]
+        assert len(lines) == 3
+
+    def test_ingest_resolves_blended_default_to_stored_source(self, monkeypatch, app_config, capsys) -> None:
+        config = replace(
+            app_config,
+            storage=StorageConfig(backend="sqlite"),
+            data_source=replace(app_config.data_source, source="blended"),
+        )
+        self._stub(monkeypatch, get_game_data=lambda: GameData(config))
+        assert cli.cli_main(["ingest", "--leaderboard", "1"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2  # 默认融合源时按 aramkit 输出排行，而非空结果
+        assert cli.ingest(source="blended") == 1
+
+    def test_ingest_prints_augment_queries(self, monkeypatch, app_config, capsys) -> None:
+        config = replace(app_config, storage=StorageConfig(backend="sqlite"))
+        self._stub(monkeypatch, get_game_data=lambda: GameData(config))
+        assert cli.cli_main(["ingest", "--source", "opgg", "--augment", "泰坦的坚决"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1].split() == ["Ahri", "80.0000", "10.0000", "-"]
+        assert cli.cli_main(["ingest", "--source", "opgg", "--augment", "1001", "--champion", "Ahri"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[1] == "已导入 1 个数据版本"
+        assert lines[2].split() == ["-", "80.0000", "10.0000", "-"]
+        assert cli.cli_main(["ingest", "--source", "opgg", "--augment", "不存在"]) == 1
+        assert cli.cli_main(["ingest", "--champion", "Ahri"]) == 1
+
+    def test_trend_prints_archived_versions(self, monkeypatch, game_data, app_config, capsys) -> None:
+        game_data.stats_archive().record("opgg", "all", "2026-10-01", app_config.opgg_augment_dir)
+        self._stub(monkeypatch, get_game_data=lambda: game_data)
+        assert cli.cli_main(["trend", "103", "泰坦的坚决", "--source", "opgg"]) == 0
+        assert capsys.readouterr().out.split()[:3] == ["2026-10-01", "80.0000", "10.0000"]
+        assert cli.cli_main(["trend", "103", "1001", "--source", "aramkit"]) == 1
+        assert cli.trend("103", "1001", source="blended") == 1
+
+    def test_trend_blended_default_reads_aramkit_archive(self, monkeypatch, app_config, capsys) -> None:
+        config = replace(app_config, data_source=replace(app_config.data_source, source="blended"))
+        game_data = GameData(config)
+        game_data.stats_archive().record("aramkit", "all", "16.1-a", config.aramkit_augment_dir)
+        self._stub(monkeypatch, get_game_data=lambda: game_data)
+        assert cli.cli_main(["trend", "103", "1001"]) == 0
+        assert capsys.readouterr().out.split()[0] == "16.1-a"
+
+
+class _StubOcr:
+    def __init__(self, augments: list[str] | None = None) -> None:
+        self.augments = augments or []
+        self.calls = 0
+
+    def get_augments(self) -> list[str]:
+        self.calls += 1
+        return self.augments
+
+
+class TestLiveClientStub:
+    def test_benchmark_prints_latency_summary(self, monkeypatch, game_data, app_config, capsys) -> None:
+        monkeypatch.setattr(cli, "setup_logging", lambda: None)
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        argv = ["live-client-stub", "--port", "0", "--no-tls", "--benchmark", "3", "--cold"]
+        assert cli.cli_main(argv) == 0
+        summary = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert (summary["count"], summary["failures"]) == (3, 0)
+        assert summary["p50"] > 0
+
+    def test_benchmark_without_data_fails(self, monkeypatch, game_data, app_config) -> None:
+        monkeypatch.setattr(cli, "setup_logging", lambda: None)
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        argv = ["live-client-stub", "--port", "0", "--no-tls", "--champion", "Aatrox", "--benchmark", "3"]
+        assert cli.cli_main(argv) == 1
 
 
 class TestRecommend:
     def test_no_game_returns_gracefully(self, monkeypatch) -> None:
         monkeypatch.setattr(cli, "get_current_champion_name", lambda: None)
+        monkeypatch.setattr(cli, "get_ocr_tool", lambda: _StubOcr())
         cli.recommend()  # 不应抛异常
 
+    def test_early_return_does_not_wait_for_ocr(self, monkeypatch) -> None:
+        release = threading.Event()
+
+        class _SlowOcr:
+            def get_augments(self) -> list[str]:
+                release.wait(5)
+                return []
+
+        monkeypatch.setattr(cli, "get_current_champion_name", lambda: None)
+        monkeypatch.setattr(cli, "get_ocr_tool", lambda: _SlowOcr())
+        start = time.perf_counter()
+        try:
+            cli.recommend()
+            assert time.perf_counter() - start < 1.0  # 未等待仍在运行的 OCR
+        finally:
+            release.set()
+
     def test_error_is_caught_and_logged(self, monkeypatch) -> None:
         def boom() -> str:
             raise RuntimeError("game client exploded")
 
         monkeypatch.setattr(cli, "get_current_champion_name", boom)
+        monkeypatch.setattr(cli, "get_ocr_tool", lambda: _StubOcr())
         cli.recommend()  # 不应向上传播异常
 
+    def test_ocr_error_is_caught_and_logged(self, monkeypatch, game_data, app_config, caplog) -> None:
+        class _BrokenOcr:
+            def get_augments(self) -> list[str]:
+                raise RuntimeError("screen capture failed")
+
+        monkeypatch.setattr(cli, "get_current_champion_name", lambda: "Ahri")
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        monkeypatch.setattr(cli, "get_ocr_tool", lambda: _BrokenOcr())
+        with caplog.at_level("ERROR", logger="aram_mayhem_helper.cli"):
+            cli.recommend()
+        assert any("screen capture failed" in r.message for r in caplog.records)
+
+    def test_ocr_overlaps_champion_lookup(self, monkeypatch, game_data, app_config, capsys) -> None:
+        """OCR 与英雄识别并发执行：OCR 等待英雄识别开始的信号，串行执行会超时。"""
+        lookup_started = threading.Event()
+
+        class _WaitingOcr:
+            def get_augments(self) -> list[str]:
+                assert lookup_started.wait(2), "OCR 未与英雄识别并发执行"
+                return ["泰坦的坚决"]
+
+        def champion_name() -> str:
+            lookup_started.set()
+            return "Ahri"
+
+        monkeypatch.setattr(cli, "get_current_champion_name", champion_name)
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        monkeypatch.setattr(cli, "get_ocr_tool", lambda: _WaitingOcr())
+        cli.recommend()
+        assert "泰坦的坚决" in capsys.readouterr().out
+
     def test_falls_back_to_opgg_when_aramkit_missing(self, monkeypatch, game_data, app_config) -> None:
         """默认源(aramkit)缺数据时回退 opgg 并传给 Suggest（修复推荐硬中断）。"""
         calls: list[tuple[str, str | None]] = []
@@ -156,8 +304,9 @@ class TestRecommend:
         assert captured_ocr == [["泰坦的坚决"]]
 
     def test_no_data_in_either_source_returns_gracefully(self, monkeypatch, game_data, app_config, caplog) -> None:
-        """266 在 opgg/aramkit 均无数据 → 记录错误并返回，不调用 Suggest/OCR。"""
+        """266 在 opgg/aramkit 均无数据 → 记录错误并返回，不调用 Suggest（OCR 已并发启动，结果丢弃）。"""
         calls: list[tuple[str, str | None]] = []
+        monkeypatch.setattr(cli, "get_ocr_tool", lambda: _StubOcr())
 
         class _FakeSuggest:
             def __init__(self, champion_id: str, data, *, source=None, thresholds=None) -> None:
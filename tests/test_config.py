@@ -1,5 +1,6 @@
 """utils.config 配置加载行为测试（TOML → 冻结数据类、拼写回退、env 注入）。"""
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -103,11 +104,39 @@ class TestLoadConfig:
         cfg = load_config(config_path=_write_config(tmp_path, content))
         assert cfg.suggest.immediate_select_percentage_threshold == 0.42
 
+    def test_storage_defaults_to_json_backend(self, tmp_path) -> None:
+        cfg = load_config(config_path=_write_config(tmp_path))
+        assert cfg.storage.backend == "json"
+        assert cfg.stats_db_file == cfg.data_dir / "stats.sqlite3"
+
+    def test_storage_section_parsed(self, tmp_path) -> None:
+        content = MINIMAL_TOML + '\n[storage]\nbackend = "sqlite"\nsqlite_file = "db/stats.db"\n'
+        cfg = load_config(config_path=_write_config(tmp_path, content))
+        assert cfg.storage.backend == "sqlite"
+        assert cfg.stats_db_file == cfg.data_dir / "db" / "stats.db"
+
+    def test_invalid_storage_backend_falls_back_to_json(self, tmp_path) -> None:
+        cfg = load_config(config_path=_write_config(tmp_path, MINIMAL_TOML + '\n[storage]\nbackend = "pg"\n'))
+        assert cfg.storage.backend == "json"
+
     def test_invalid_source_falls_back_to_opgg(self, tmp_path) -> None:
         content = MINIMAL_TOML.replace('source = "aramkit"', 'source = "invalid"')
         cfg = load_config(config_path=_write_config(tmp_path, content))
         assert cfg.data_source.source == "opgg"
 
+    def test_scorer_parsed_and_invalid_falls_back(self, tmp_path) -> None:
+        assert load_config(config_path=_write_config(tmp_path)).suggest.scorer == "bayesian_sigmoid"
+        content = MINIMAL_TOML.replace("[suggest]\n", '[suggest]\nscorer = "wilson"\n')
+        (tmp_path / "a").mkdir()
+        assert load_config(config_path=_write_config(tmp_path / "a", content)).suggest.scorer == "wilson"
+        content = MINIMAL_TOML.replace("[suggest]\n", '[suggest]\nscorer = "elo"\n')
+        (tmp_path / "b").mkdir()
+        assert load_config(config_path=_write_config(tmp_path / "b", content)).suggest.scorer == "bayesian_sigmoid"
+
+    def test_blended_source_accepted(self, tmp_path) -> None:
+        content = MINIMAL_TOML.replace('source = "aramkit"', 'source = "blended"')
+        assert load_config(config_path=_write_config(tmp_path, content)).data_source.source == "blended"
+
     def test_missing_config_raises_file_not_found(self, tmp_path) -> None:
         with pytest.raises(FileNotFoundError):
             load_config(config_path=tmp_path / "nope" / "config.toml")
@@ -139,10 +168,20 @@ class TestLoadConfig:
         assert cfg.trans_file == cfg.data_dir / "augment_trans.json"
         assert cfg.i18n_file == cfg.data_dir / "champions-names-i18n.json"
         assert cfg.augment_desc_file == cfg.data_dir / "aram-mayhem-augments.zh_cn.json"
+        assert cfg.aramkit_version_file == cfg.data_dir / "aramkit" / "version.json"
         assert cfg.log_dir == cfg.project_root / "logs"
         assert cfg.ocr_failure_dir == cfg.log_dir / "ocr_failures"
         assert cfg.ocr_debug_dir == cfg.log_dir / "ocr_debug"
 
+    def test_aramkit_version_file_follows_save_directory(self, tmp_path) -> None:
+        cfg = load_config(config_path=_write_config(tmp_path))
+        moved = replace(
+            cfg.crawler.aramkit,
+            augment=replace(cfg.crawler.aramkit.augment, save_directory="mirror/aramkit/augments/"),
+        )
+        cfg = replace(cfg, crawler=replace(cfg.crawler, aramkit=moved))
+        assert cfg.aramkit_version_file == cfg.data_dir / "mirror" / "aramkit" / "version.json"
+
     def test_data_source_dataclass_shape(self) -> None:
         assert DataSourceConfig(source="opgg").source == "opgg"
 
@@ -142,6 +142,28 @@ class TestBatchCrawl:
         url = session.calls[0][0]
         assert url.startswith("https://lol-api-champion.op.gg/api/contents/stats/champions/")
         assert session.calls[0][1] == {"params": None, "timeout": crawler.timeout}
+        # 爬取完成后以爬取日期为版本归档
+        [archived] = crawler.archive.versions("opgg", "all")
+        assert set(archived.champions) == {"22", "103", "266"}
+
+    def test_archive_failure_does_not_fail_crawl(self, crawler_env, monkeypatch) -> None:
+        crawler = _make_opgg_crawler(crawler_env, monkeypatch)
+        crawler.session = FakeSession()
+
+        def fail(*args) -> None:
+            raise OSError("read-only")
+
+        monkeypatch.setattr(crawler.archive, "record", fail)
+        assert all(crawler.batch_crawl(1, 999).values())
+
+    def test_corrupt_archive_manifest_does_not_fail_crawl(self, crawler_env, monkeypatch) -> None:
+        crawler = _make_opgg_crawler(crawler_env, monkeypatch)
+        crawler.session = FakeSession()
+        manifest = crawler_env.archive_dir / "manifests" / "opgg-all.json"
+        manifest.parent.mkdir(parents=True)
+        manifest.write_text("{broken", encoding="utf-8")
+        assert all(crawler.batch_crawl(1, 999).values())
+        assert manifest.read_text(encoding="utf-8") == "{broken"
 
     def test_stops_after_10_consecutive_failures(self, crawler_env, monkeypatch) -> None:
         crawler = _make_opgg_crawler(crawler_env, monkeypatch)
@@ -166,6 +188,11 @@ class TestAramkitCrawler:
         monkeypatch.setattr(time, "sleep", lambda s: None)
         return crawler
 
+    def test_dataset_selects_save_directory(self, crawler_env) -> None:
+        assert AramkitCrawler(config=crawler_env).save_directory == crawler_env.aramkit_dataset_dir("all")
+        high = AramkitCrawler(dataset="high", config=crawler_env)
+        assert high.save_directory == crawler_env.data_dir / "aramkit" / "aram_augments" / "high"
+
     def test_discover_versions_from_html(self, crawler_env, monkeypatch) -> None:
         crawler = self._make(crawler_env, monkeypatch)
         html = (
@@ -209,12 +236,15 @@ class TestAramkitCrawler:
             '<link href="/assets/resources/16.15-abc123456789.css">'
         )
         calls: list[str] = []
-        crawler.fetch_json = lambda url: calls.append(url) or {"a": 1}  # type: ignore[method-assign]
-        crawler.batch_crawl = lambda start_id, end_id: {"22": True, "103": True, "266": True}  # type: ignore[method-assign]
+        crawler.fetch_json = lambda url, params=None: calls.append(url) or {"a": 1}  # type: ignore[method-assign]
         assert crawler.crawl(1, 999) is True
         # 版本发现结果保存到实例并被资源 URL 使用
         assert crawler.data_version == "16.15-20260801-aaaaaaaaaaaa"
         assert any("16.15-abc123456789/zh-CN/resources/augments.json" in u for u in calls)
+        assert any("16.15-20260801-aaaaaaaaaaaa/stats/all/champion-details/103.json" in u for u in calls)
+        # 批量爬取结束时经统一钩子按数据版本归档
+        [archived] = crawler.archive.versions("aramkit", "all")
+        assert (archived.version, set(archived.champions)) == ("16.15-20260801-aaaaaaaaaaaa", {"22", "103", "266"})
 
     def test_crawl_empty_results_returns_false(self, crawler_env, monkeypatch) -> None:
         # 英雄数据未抓取时结果为空：all({}) 恒为 True 会误报「全部成功」，需显式判空
@@ -1,10 +1,13 @@
 """utils.data 数据层测试（GameData 仓储 / AugmentLookup 翻译表）。"""
 
 import json
+import threading
+import time
 
 import pytest
 
-from aram_mayhem_helper.utils.data import AugmentLookup
+from aram_mayhem_helper.utils.data import AugmentLookup, GameData
+from aram_mayhem_helper.utils.summary import SUMMARY_FILE_NAME
 
 
 class TestGameDataChampions:
@@ -89,6 +92,46 @@ class TestGameDataAugmentEntries:
         }
         assert len(entries) == 7
 
+    def test_datasets_load_side_by_side(self, game_data, high_dataset) -> None:
+        all_entries = game_data.augment_entries("103", "aramkit")
+        high_entries = game_data.augment_entries("103", "aramkit", "high")
+        assert all_entries is game_data.augment_entries("103", "aramkit", "all")
+        assert all_entries is not None and high_entries is not None
+        assert [e["performance"] for e in high_entries] == [e["performance"] for e in reversed(all_entries)]
+        assert game_data.augment_counts("aramkit", "high") == {"103": 7}
+        assert game_data.datasets("aramkit") == ("all", "high") and game_data.datasets("opgg") == ("all",)
+
+    def test_invalidate_rereads_every_dataset(self, game_data, high_dataset) -> None:
+        high_entries = game_data.augment_entries("103", "aramkit", "high")
+        high_dataset.write_text(json.dumps({"augments": {"all": []}}), encoding="utf-8")
+        game_data.invalidate({("103", "aramkit")})
+        assert game_data.augment_entries("103", "aramkit", "high") == []
+        assert high_entries
+
+    def test_blended_joins_both_sources(self, game_data) -> None:
+        blended = game_data.augment_entries("103", "blended")
+        assert blended is not None
+        opgg_ids = {str(e["id"]) for e in game_data.augment_entries("103", "opgg") or []}
+        aramkit_ids = {str(e["id"]) for e in game_data.augment_entries("103", "aramkit") or []}
+        assert {str(e["id"]) for e in blended} == opgg_ids | aramkit_ids
+        assert all(0 <= e["performance"] <= 1 and e["sampleCount"] > 0 for e in blended)
+        assert game_data.augment_entries("22", "blended") == []  # 仅 OP.GG 的 popular=0 条目
+        with pytest.raises(FileNotFoundError):
+            game_data.augment_entries("266", "blended")
+
+    def test_blended_available_source_and_counts(self, game_data) -> None:
+        assert game_data.available_source("103", preferred="blended") == "blended"
+        assert game_data.available_source("266", preferred="blended") is None
+        assert game_data.augment_counts("blended") == {"22": 0, "103": 8}
+
+    def test_invalidating_a_source_drops_blended_entries(self, game_data, fixture_data_dir) -> None:
+        before = game_data.augment_entries("103", "blended")
+        (fixture_data_dir / "aramkit" / "aram_augments" / "all" / "103.json").unlink()
+        game_data.invalidate({("103", "aramkit")})
+        after = game_data.augment_entries("103", "blended")
+        assert after is not before and after is not None
+        assert {e["id"] for e in after} == {e["id"] for e in game_data.augment_entries("103", "opgg") or []}
+
     def test_unknown_champion_returns_none(self, game_data) -> None:
         assert game_data.augment_entries("999", "opgg") is None
 
@@ -116,6 +159,54 @@ class TestGameDataAugmentEntries:
             game_data.augment_entries_all("opgg")
 
 
+class TestGameDataAugmentCounts:
+    @staticmethod
+    def _count_reads(monkeypatch, game_data) -> list[str]:
+        reads: list[str] = []
+        original = game_data.read_augment_entries
+
+        def read(champion_id, source, dataset=None):
+            reads.append(champion_id)
+            return original(champion_id, source, dataset)
+
+        monkeypatch.setattr(game_data, "read_augment_entries", read)
+        return reads
+
+    def test_counts_and_persists_summary(self, game_data, fixture_data_dir) -> None:
+        assert game_data.augment_counts("opgg") == {"103": 7, "22": 0}
+        assert game_data.augment_counts("aramkit") == {"103": 7}
+        summary = json.loads((fixture_data_dir / "opgg" / "aram_augments" / SUMMARY_FILE_NAME).read_text())
+        assert summary["files"]["103"]["count"] == 7
+
+    def test_unchanged_files_are_not_parsed_again(self, monkeypatch, game_data, app_config) -> None:
+        game_data.augment_counts("opgg")
+        reads = self._count_reads(monkeypatch, game_data)
+        assert game_data.augment_counts("opgg") == {"103": 7, "22": 0}
+        fresh = GameData(app_config)  # 新进程：读取持久化摘要
+        fresh_reads = self._count_reads(monkeypatch, fresh)
+        assert fresh.augment_counts("opgg") == {"103": 7, "22": 0}
+        assert reads == fresh_reads == []
+
+    def test_changed_and_removed_files_refresh(self, monkeypatch, game_data, fixture_data_dir) -> None:
+        game_data.augment_counts("opgg")
+        directory = fixture_data_dir / "opgg" / "aram_augments"
+        (directory / "22.json").write_text(
+            json.dumps({"data": [{"id": 1001, "performance": 50.0, "popular": 1.0}]}), encoding="utf-8"
+        )
+        (directory / "103.json").unlink()
+        reads = self._count_reads(monkeypatch, game_data)
+        assert game_data.augment_counts("opgg") == {"22": 1}
+        assert reads == ["22"]
+
+    def test_corrupt_summary_is_rebuilt(self, game_data, fixture_data_dir) -> None:
+        (fixture_data_dir / "opgg" / "aram_augments" / SUMMARY_FILE_NAME).write_text("{", encoding="utf-8")
+        assert game_data.augment_counts("opgg") == {"103": 7, "22": 0}
+
+    def test_corrupt_champion_file_counts_zero(self, game_data, fixture_data_dir) -> None:
+        (fixture_data_dir / "opgg" / "aram_augments" / "22.json").write_text("{", encoding="utf-8")
+        assert game_data.augment_counts("opgg")["22"] == 0
+
+
 class TestGameDataAvailableSource:
     """推荐流程的数据源解析：默认源缺数据时回退另一源（修复默认源切换后部分英雄硬中断）。"""
 
@@ -196,6 +287,91 @@ class TestGameDataReload:
         game_data.reload()
         assert game_data.augment_info("7777") is None
 
+    def test_concurrent_cold_reads_parse_file_once(self, game_data, monkeypatch) -> None:
+        original = game_data.read_augment_entries
+        calls: list[str] = []
+
+        def slow_read(champion_id: str, source: str, dataset: str | None = None) -> list:
+            calls.append(champion_id)
+            time.sleep(0.1)
+            return original(champion_id, source, dataset)
+
+        monkeypatch.setattr(game_data, "read_augment_entries", slow_read)
+        barrier = threading.Barrier(8)
+        results: list = []
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(game_data.augment_entries("103", "opgg"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert calls == ["103"]
+        assert len(results) == 8 and all(r is results[0] for r in results)
+
+    def test_reload_keeps_in_flight_snapshot_intact(self, game_data, fixture_data_dir) -> None:
+        old_snapshot = game_data._snapshot
+        entries = game_data.augment_entries("103", "opgg")
+        game_data.reload()
+        # 旧快照整体保留（进行中的读取不受影响），新快照从空白开始
+        assert old_snapshot.entries[("103", "opgg", "all")] is entries
+        assert game_data._snapshot is not old_snapshot
+        assert game_data._snapshot.entries == {}
+        assert game_data.augment_entries("103", "opgg") == entries
+
+    def test_prewarm_publishes_fully_loaded_snapshot(self, game_data, fixture_data_dir) -> None:
+        (fixture_data_dir / "opgg" / "aram_augments" / "103.json").write_text(
+            json.dumps({"data": [{"id": 1, "performance": 1.0, "popular": 1.0}]}), encoding="utf-8"
+        )
+        assert game_data.reload(prewarm=True) == 1
+        snapshot = game_data._snapshot
+        assert snapshot.champion_data
+        assert snapshot.lookup is not None and snapshot.resources is not None
+        assert len(snapshot.entries[("103", "opgg", "all")]) == 1
+        assert set(snapshot.summaries) == {("opgg", "all"), ("aramkit", "all")}
+
+    def test_failed_prewarm_keeps_old_snapshot(self, game_data, fixture_data_dir) -> None:
+        entries = game_data.augment_entries("103", "opgg")
+        (fixture_data_dir / "augment_trans.json").write_text("{broken", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            game_data.reload(prewarm=True)
+        assert game_data.generation == 0
+        assert game_data.augment_entries("103", "opgg") is entries
+
+    def test_reload_async_notifies_listeners(self, game_data) -> None:
+        generations: list[int] = []
+        game_data.add_reload_listener(generations.append)
+        game_data.add_reload_listener(lambda generation: 1 / 0)  # 回调异常不影响重载
+        assert game_data.reload_async().result(timeout=10) == 1
+        assert game_data.reload_async(prewarm=False).result(timeout=10) == 2
+        assert generations == [1, 2]
+        assert game_data.generation == 2
+
+    def test_invalidate_drops_only_changed_entries(self, game_data, fixture_data_dir) -> None:
+        ashe = game_data.augment_entries("22", "opgg")
+        (fixture_data_dir / "opgg" / "aram_augments" / "103.json").write_text(
+            json.dumps({"data": [{"id": 1, "performance": 1.0, "popular": 1.0}]}), encoding="utf-8"
+        )
+        assert game_data.invalidate({("103", "opgg")}) == 1
+        assert game_data.augment_entries("22", "opgg") is ashe
+        assert len(game_data._snapshot.entries[("103", "opgg", "all")]) == 1  # 发布前已重新读取
+        assert game_data.champion_generation("103") == 1
+        assert game_data.champion_generation("22") == 0
+        assert game_data.changed_since(0) == frozenset({"103"})
+        game_data.reload()
+        assert game_data.changed_since(0) is None
+        assert game_data.changed_since(1) is None
+        assert game_data.changed_since(2) == frozenset()
+
+    def test_reload_bumps_generation(self, game_data) -> None:
+        assert game_data.generation == 0
+        game_data.reload()
+        game_data.reload()
+        assert game_data.generation == 2
+
 
 class TestAugmentLookup:
     def test_missing_trans_file_initializes_empty(self, tmp_path) -> None:
@@ -204,7 +380,7 @@ class TestAugmentLookup:
         assert lookup.get_augment_id("泰坦的坚决") is None
 
     def test_exact_and_normalized_lookup(self, game_data) -> None:
-        lookup = game_data._lookup_impl()
+        lookup = game_data._lookup_impl(game_data._snapshot)
         assert lookup.get_augment_id("泰坦的坚决") == "1001"
         assert lookup.get_augment_id("泰坦的 坚决") == "1001"
         assert lookup.get_augment_info("1001") == {"name": "泰坦的坚决", "level": "2"}
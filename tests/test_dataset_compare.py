@@ -0,0 +1,59 @@
+"""algorithm.dataset_compare 数据集对比测试（与单数据集 Suggest 排名一致性）。"""
+
+import numpy as np
+import pytest
+
+from aram_mayhem_helper.algorithm.dataset_compare import compare_datasets, dataset_scores
+from aram_mayhem_helper.algorithm.suggest import Suggest
+from aram_mayhem_helper.utils.config import get_config
+
+
+class TestDatasetScores:
+    def test_matches_suggest_ranks(self, game_data, high_dataset) -> None:
+        thresholds = get_config().suggest
+        scores = dataset_scores(game_data, source="aramkit", dataset="high", thresholds=thresholds)
+        single = Suggest("103", game_data, source="aramkit", dataset="high", thresholds=thresholds)
+        assert list(scores.keys) == sorted(scores.keys)
+        assert set(scores.champion_ids) == {"103"}  # 22/266 无 aramkit 数据，静默跳过
+        for augment_id, rank, group_size in zip(scores.augment_ids, scores.ranks, scores.group_sizes, strict=True):
+            verdict = single.get_verdict(augment_id)
+            assert verdict is not None
+            assert (rank, group_size) == (verdict.rank, verdict.group_size)
+        np.testing.assert_allclose(scores.percentiles, scores.ranks / scores.group_sizes)
+
+
+class TestCompareDatasets:
+    def test_joins_and_orders_by_percentile_shift(self, game_data, high_dataset) -> None:
+        result = compare_datasets(game_data, thresholds=get_config().suggest)
+        assert len(result) == len(
+            dataset_scores(game_data, source="aramkit", dataset="all", thresholds=get_config().suggest)
+        )
+        assert list(result.base_scores.keys) == list(result.other_scores.keys)
+        np.testing.assert_array_equal(result.rank_diff, result.base_scores.ranks - result.other_scores.ranks)
+        shifts = np.abs(result.percentile_diff)
+        assert list(shifts) == sorted(shifts, reverse=True)
+        assert shifts[0] > 0  # 高分段胜率顺序反转，排名必然变化
+
+    def test_records_shape(self, game_data, high_dataset) -> None:
+        result = compare_datasets(game_data, thresholds=get_config().suggest, champion_ids=["103"])
+        [record] = list(result.records(limit=1))
+        assert set(record) == {
+            "champion_id",
+            "augment_id",
+            "augment_name",
+            "level",
+            "all",
+            "high",
+            "rank_diff",
+            "percentile_diff",
+        }
+        assert record["rank_diff"] == record["all"]["rank"] - record["high"]["rank"]
+
+    def test_missing_dataset_yields_empty_comparison(self, game_data) -> None:
+        result = compare_datasets(game_data, thresholds=get_config().suggest)
+        assert len(result) == 0 and list(result.records()) == []
+
+    @pytest.mark.parametrize(("base", "other"), [("all", "all"), ("all", "low")])
+    def test_rejects_invalid_datasets(self, game_data, base, other) -> None:
+        with pytest.raises(ValueError):
+            compare_datasets(game_data, thresholds=get_config().suggest, base=base, other=other)
@@ -0,0 +1,131 @@
+"""league_client_api.game_watcher 后台监视器测试（假 Live Client + fixture GameData）。"""
+
+import threading
+
+from aram_mayhem_helper.league_client_api.game_watcher import GameStateWatcher
+from aram_mayhem_helper.utils.config import get_config
+
+
+class FakeClient:
+    def __init__(self, champion_name: str | None) -> None:
+        self.champion_name = champion_name
+        self.calls: list[bool] = []
+
+    def current_champion_name(self, *, log_errors: bool = True) -> str | None:
+        self.calls.append(log_errors)
+        return self.champion_name
+
+
+def _watcher(game_data, client: FakeClient, source: str = "opgg") -> GameStateWatcher:
+    return GameStateWatcher(
+        source,
+        client=client,  # type: ignore[arg-type]
+        game_data=lambda: game_data,
+        thresholds=lambda: get_config().suggest,
+        interval=0.01,
+    )
+
+
+class TestPollOnce:
+    def test_builds_suggest_for_current_champion(self, game_data) -> None:
+        client = FakeClient("Ahri")
+        watcher = _watcher(game_data, client)
+        prepared = watcher.poll_once()
+        assert prepared is not None
+        assert (prepared.champion_name, prepared.champion_id, prepared.source) == ("Ahri", "103", "opgg")
+        assert prepared.suggest.get_augment_info_by_id("1001") is not None
+        assert watcher.prepared("opgg") is prepared
+        assert client.calls == [False]  # 后台轮询静默记录连接错误
+
+    def test_reuses_prepared_while_champion_unchanged(self, game_data) -> None:
+        watcher = _watcher(game_data, FakeClient("Ahri"))
+        first = watcher.poll_once()
+        assert watcher.poll_once() is first
+
+    def test_falls_back_to_other_source(self, game_data) -> None:
+        watcher = _watcher(game_data, FakeClient("Ashe"), source="aramkit")  # 22 无 aramkit fixture
+        prepared = watcher.poll_once()
+        assert prepared is not None
+        assert (prepared.preferred_source, prepared.source) == ("aramkit", "opgg")
+
+    def test_no_game_clears_prepared(self, game_data) -> None:
+        client = FakeClient("Ahri")
+        watcher = _watcher(game_data, client)
+        watcher.poll_once()
+        client.champion_name = None
+        assert watcher.poll_once() is None
+        assert watcher.prepared("opgg") is None
+
+    def test_no_data_in_either_source_returns_none(self, game_data) -> None:
+        assert _watcher(game_data, FakeClient("Aatrox")).poll_once() is None  # 266 两源均无数据
+
+    def test_unknown_champion_returns_none(self, game_data) -> None:
+        assert _watcher(game_data, FakeClient("不存在")).poll_once() is None
+
+
+class TestInvalidation:
+    def test_prepared_requires_matching_source(self, game_data) -> None:
+        watcher = _watcher(game_data, FakeClient("Ahri"))
+        watcher.poll_once()
+        assert watcher.prepared("aramkit") is None
+
+    def test_set_source_drops_and_rebuilds(self, game_data) -> None:
+        watcher = _watcher(game_data, FakeClient("Ahri"))
+        watcher.poll_once()
+        watcher.set_source("aramkit")
+        assert watcher.prepared("opgg") is None
+        prepared = watcher.poll_once()
+        assert prepared is not None and prepared.source == "aramkit"
+
+    def test_invalidate_drops_prepared(self, game_data) -> None:
+        watcher = _watcher(game_data, FakeClient("Ahri"))
+        first = watcher.poll_once()
+        watcher.invalidate()
+        assert watcher.prepared("opgg") is None
+        second = watcher.poll_once()
+        assert second is not None and second is not first
+
+    def test_invalidate_during_build_discards_result(self, game_data) -> None:
+        watcher = _watcher(game_data, FakeClient("Ahri"))
+        original = game_data.available_source
+
+        def racing_available_source(*args, **kwargs):
+            watcher.invalidate()  # 构建期间数据被重新加载
+            return original(*args, **kwargs)
+
+        game_data.available_source = racing_available_source
+        assert watcher.poll_once() is None
+        assert watcher.prepared("opgg") is None
+
+
+class TestLifecycle:
+    def test_start_polls_in_background_and_stop_joins(self, game_data) -> None:
+        polled = threading.Event()
+
+        class SignallingClient(FakeClient):
+            def current_champion_name(self, *, log_errors: bool = True) -> str | None:
+                polled.set()
+                return super().current_champion_name(log_errors=log_errors)
+
+        watcher = _watcher(game_data, SignallingClient("Ahri"))
+        watcher.start()
+        watcher.start()  # 重复启动无副作用
+        assert polled.wait(2)
+        watcher.stop(timeout=2)
+        assert watcher._thread is None
+
+    def test_poll_errors_do_not_kill_thread(self, game_data) -> None:
+        calls: list[int] = []
+        done = threading.Event()
+
+        class FlakyClient(FakeClient):
+            def current_champion_name(self, *, log_errors: bool = True) -> str | None:
+                calls.append(1)
+                if len(calls) >= 2:
+                    done.set()
+                raise RuntimeError("boom")
+
+        watcher = _watcher(game_data, FlakyClient(None))
+        watcher.start()
+        assert done.wait(2)
+        watcher.stop(timeout=2)
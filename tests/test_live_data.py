@@ -1,13 +1,14 @@
-"""league_client_api.live_data 行为锁定测试（mock requests.get）。"""
+"""league_client_api.live_data 行为锁定测试（注入假 Session）。"""
 
 import pytest
 import requests
 
 import aram_mayhem_helper.league_client_api.live_data as live_data
+from aram_mayhem_helper.league_client_api.live_data import LiveClientData
 
 
 class FakeResponse:
-    def __init__(self, payload: dict | None = None, error: Exception | None = None) -> None:
+    def __init__(self, payload: object = None, error: Exception | None = None) -> None:
         self._payload = payload
         self._error = error
 
@@ -15,53 +16,123 @@ class FakeResponse:
         if self._error is not None:
             raise self._error
 
-    def json(self) -> dict:
+    def json(self) -> object:
         return self._payload
 
 
-def _mock_get(monkeypatch: pytest.MonkeyPatch, response: FakeResponse) -> dict:
-    captured: dict = {}
-
-    def fake_get(url: str, **kwargs):
-        captured["url"] = url
-        captured["kwargs"] = kwargs
-        return response
-
-    monkeypatch.setattr(requests, "get", fake_get)
-    return captured
-
-
-def _game_payload(riot_id: str = "召唤师#1234") -> dict:
-    return {
-        "activePlayer": {"riotId": riot_id},
-        "allPlayers": [
-            {"riotId": "队友#9999", "rawChampionName": "game_character_Annie"},
-            {"riotId": riot_id, "rawChampionName": "game_character_Ahri"},
-        ],
-    }
+class FakeSession:
+    """按端点名返回预设响应，并记录请求的 URL。"""
+
+    def __init__(self, responses: dict[str, FakeResponse]) -> None:
+        self.responses = responses
+        self.urls: list[str] = []
+        self.kwargs: list[dict] = []
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        self.urls.append(url)
+        self.kwargs.append(kwargs)
+        return self.responses[url.rsplit("/", 1)[-1]]
+
+
+def _players(riot_id: str = "召唤师#1234") -> list[dict]:
+    return [
+        {"riotId": "队友#9999", "rawChampionName": "game_character_Annie"},
+        {"riotId": riot_id, "rawChampionName": "game_character_Ahri"},
+    ]
+
+
+def _session(game_time: float = 120.0, riot_id: object = "召唤师#1234", players: list | None = None) -> FakeSession:
+    return FakeSession(
+        {
+            "gamestats": FakeResponse({"gameTime": game_time}),
+            "activeplayername": FakeResponse(riot_id),
+            "playerlist": FakeResponse(_players() if players is None else players),
+        }
+    )
+
+
+def _endpoints(session: FakeSession) -> list[str]:
+    return [url.rsplit("/", 1)[-1] for url in session.urls]
+
+
+class TestLiveClientData:
+    def test_returns_own_champion_name_via_light_endpoints(self) -> None:
+        session = _session()
+        client = LiveClientData(session=session)
+        assert client.current_champion_name() == "Ahri"
+        assert session.urls == [
+            "https://127.0.0.1:2999/liveclientdata/gamestats",
+            "https://127.0.0.1:2999/liveclientdata/activeplayername",
+            "https://127.0.0.1:2999/liveclientdata/playerlist",
+        ]
+        assert session.kwargs[0] == {"verify": False, "timeout": 2}
+
+    def test_caches_champion_while_game_time_advances(self) -> None:
+        session = _session(game_time=120.0)
+        client = LiveClientData(session=session)
+        assert client.current_champion_name() == "Ahri"
+        session.responses["gamestats"] = FakeResponse({"gameTime": 300.0})
+        assert client.current_champion_name() == "Ahri"
+        # 第二次只查 gamestats，不再请求 activeplayername/playerlist
+        assert _endpoints(session)[3:] == ["gamestats"]
+
+    def test_game_time_reset_invalidates_cache(self) -> None:
+        session = _session(game_time=900.0)
+        client = LiveClientData(session=session)
+        assert client.current_champion_name() == "Ahri"
+        session.responses["gamestats"] = FakeResponse({"gameTime": 5.0})  # 新对局
+        session.responses["playerlist"] = FakeResponse(
+            [{"riotId": "召唤师#1234", "rawChampionName": "game_character_Ashe"}]
+        )
+        assert client.current_champion_name() == "Ashe"
+        assert _endpoints(session)[3:] == ["gamestats", "activeplayername", "playerlist"]
+
+    def test_matches_legacy_summoner_name(self) -> None:
+        players = [{"summonerName": "老玩家", "rawChampionName": "game_character_Ahri"}]
+        client = LiveClientData(session=_session(riot_id="老玩家", players=players))
+        assert client.current_champion_name() == "Ahri"
+
+    def test_missing_riot_id_returns_none(self) -> None:
+        client = LiveClientData(session=_session(riot_id="", players=[]))
+        assert client.current_champion_name() is None
+
+    def test_no_matching_player_returns_none(self) -> None:
+        players = _players()
+        players[1]["rawChampionName"] = None  # 匹配到但无 rawChampionName
+        client = LiveClientData(session=_session(players=players))
+        assert client.current_champion_name() is None
+
+    def test_connection_error_returns_none_and_invalidates(self) -> None:
+        session = _session()
+        client = LiveClientData(session=session)
+        assert client.current_champion_name() == "Ahri"
+        session.responses["gamestats"] = FakeResponse(error=requests.exceptions.ConnectionError("refused"))
+        assert client.current_champion_name() is None
+        session.responses["gamestats"] = FakeResponse({"gameTime": 600.0})
+        assert client.current_champion_name() == "Ahri"
+        assert _endpoints(session)[-2:] == ["activeplayername", "playerlist"]  # 缓存已失效，重新解析
+
+    def test_generic_error_returns_none(self) -> None:
+        session = _session()
+        session.responses["playerlist"] = FakeResponse(error=requests.exceptions.Timeout("slow"))
+        assert LiveClientData(session=session).current_champion_name() is None
 
 
 class TestGetCurrentChampionName:
-    def test_returns_own_champion_name(self, monkeypatch) -> None:
-        captured = _mock_get(monkeypatch, FakeResponse(_game_payload()))
+    def test_delegates_to_singleton(self, monkeypatch) -> None:
+        client = LiveClientData(session=_session())
+        monkeypatch.setattr(live_data, "_live_client_singleton", client)
+        assert live_data.get_live_client() is client
         assert live_data.get_current_champion_name() == "Ahri"
-        assert captured["url"] == "https://127.0.0.1:2999/liveclientdata/allgamedata"
-        assert captured["kwargs"] == {"verify": False, "timeout": 2}
-
-    def test_missing_riot_id_returns_none(self, monkeypatch) -> None:
-        _mock_get(monkeypatch, FakeResponse({"activePlayer": {}, "allPlayers": []}))
-        assert live_data.get_current_champion_name() is None
-
-    def test_no_matching_player_returns_none(self, monkeypatch) -> None:
-        payload = _game_payload(riot_id="召唤师#1234")
-        payload["allPlayers"][1]["rawChampionName"] = None  # 匹配到但无 rawChampionName
-        _mock_get(monkeypatch, FakeResponse(payload))
-        assert live_data.get_current_champion_name() is None
-
-    def test_connection_error_returns_none(self, monkeypatch) -> None:
-        _mock_get(monkeypatch, FakeResponse(error=requests.exceptions.ConnectionError("refused")))
-        assert live_data.get_current_champion_name() is None
-
-    def test_generic_error_returns_none(self, monkeypatch) -> None:
-        _mock_get(monkeypatch, FakeResponse(error=requests.exceptions.Timeout("slow")))
-        assert live_data.get_current_champion_name() is None
+
+    def test_singleton_is_lazy(self, monkeypatch) -> None:
+        monkeypatch.setattr(live_data, "_live_client_singleton", None)
+        client = live_data.get_live_client()
+        assert isinstance(client, LiveClientData)
+        assert live_data.get_live_client() is client
+
+    @pytest.mark.parametrize("payload", [{}, [], {"gameTime": "x"}])
+    def test_game_time_missing_returns_none(self, payload) -> None:
+        session = _session()
+        session.responses["gamestats"] = FakeResponse(payload)
+        assert LiveClientData(session=session).game_time() is None
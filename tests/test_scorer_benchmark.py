@@ -0,0 +1,42 @@
+"""algorithm.scorer_benchmark 打分器基准测试（样本组提取 + CLI 输出）。"""
+
+import json
+
+import pytest
+
+import aram_mayhem_helper.cli as cli
+from aram_mayhem_helper.algorithm.scorer_benchmark import benchmark_scorers, extract_sample_groups
+from aram_mayhem_helper.utils.config import VALID_SCORERS, get_config
+
+
+class TestBenchmarkScorers:
+    def test_only_groups_with_sample_counts(self, game_data) -> None:
+        assert extract_sample_groups(game_data, "opgg", get_config().suggest) == []
+        assert extract_sample_groups(game_data, "blended", get_config().suggest) == []
+        groups = extract_sample_groups(game_data, "aramkit", get_config().suggest)
+        assert groups and all(item["sampleCount"] > 0 for group in groups for item in group)
+
+    def test_reports_every_scorer(self, game_data) -> None:
+        results = benchmark_scorers(game_data, source="aramkit", base=get_config().suggest, repeat=2)
+        assert tuple(results) == VALID_SCORERS
+        assert all(summary["items"] > 0 and summary["min"] <= summary["mean"] for summary in results.values())
+
+    def test_rejects_non_positive_repeat(self, game_data) -> None:
+        with pytest.raises(ValueError):
+            benchmark_scorers(game_data, source="aramkit", base=get_config().suggest, repeat=0)
+
+
+class TestScorerBenchmarkCommand:
+    def test_prints_one_line_per_scorer(self, monkeypatch, game_data, app_config, capsys) -> None:
+        monkeypatch.setattr(cli, "setup_logging", lambda: None)
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        assert cli.cli_main(["scorer-benchmark", "--repeat", "1"]) == 0
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [line["scorer"] for line in lines] == list(VALID_SCORERS)
+
+    def test_source_without_samples_fails(self, monkeypatch, game_data, app_config) -> None:
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        assert cli.scorer_benchmark(source="opgg") == 1
+        assert cli.scorer_benchmark(repeat=0) == 1
@@ -1,8 +1,21 @@
 """打分函数测试：algorithm.scoring 的缩放与贝叶斯-sigmoid 打分行为（自 utils.norm 迁移）。"""
 
+import numpy as np
 import pytest
 
-from aram_mayhem_helper.algorithm.scoring import add_bayesian_sigmoid_score_attr, add_unit_scale_attr
+from aram_mayhem_helper.algorithm.scoring import (
+    BETA_BINOMIAL,
+    WILSON,
+    add_bayesian_sigmoid_score_attr,
+    add_sample_size_score_attr,
+    add_unit_scale_attr,
+    bayesian_sigmoid_scores,
+    beta_binomial_posterior,
+    descending_order,
+    descending_ranks,
+    top_k_indices,
+    wilson_lower_bound,
+)
 
 
 def _sample_group() -> list[dict]:
@@ -73,6 +86,18 @@ class TestAddBayesianSigmoidScoreAttr:
         )
         assert items[1]["popular_norm"] == 1.0  # popular_unit 最高者
 
+    def test_rank_attr_matches_stable_sort(self) -> None:
+        items = _sample_group() + [{"id": "e", "performance": 0.55, "popular": 0.1}]  # 与 a 同分
+        add_bayesian_sigmoid_score_attr(items, rank_attr="rank")
+        expected = sorted(items, key=lambda x: x["weighted_sum"], reverse=True)
+        assert [i["rank"] for i in expected] == [1, 2, 3, 4, 5]
+        assert items[0]["rank"] < items[4]["rank"]  # 同分保持原顺序
+
+    def test_no_rank_attr_by_default(self) -> None:
+        items = _sample_group()
+        add_bayesian_sigmoid_score_attr(items)
+        assert all("rank" not in i for i in items)
+
     def test_empty_list_raises_value_error(self) -> None:
         with pytest.raises(ValueError, match="data_list is empty"):
             add_bayesian_sigmoid_score_attr([])
@@ -89,3 +114,88 @@ class TestAddBayesianSigmoidScoreAttr:
         ]
         with pytest.raises(ValueError, match="performance std is 0"):
             add_bayesian_sigmoid_score_attr(items)
+
+
+class TestBayesianSigmoidScores:
+    @pytest.mark.parametrize(("tau", "steepness"), [(0.5, 1.0), (0.0, 0.5), (2.0, 3.0)])
+    def test_matches_per_item_implementation(self, tau, steepness) -> None:
+        items = _sample_group()
+        add_bayesian_sigmoid_score_attr(items, tau_factor=tau, sigmoid_steepness=steepness)
+        perf = np.array([i["performance"] for i in items])
+        pop = np.array([i["popular"] for i in items])
+        grid = bayesian_sigmoid_scores(perf, pop, np.array([1.0, tau]), np.array([1.0, steepness]))
+        assert grid.shape == (2, 4)
+        assert list(grid[1]) == [i["weighted_sum"] for i in items]
+
+    def test_zero_perf_variance_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            bayesian_sigmoid_scores(np.array([0.5, 0.5]), np.array([1.0, 1.0]), np.array([0.5]), np.array([1.0]))
+
+    def test_zero_popularity_raises_zero_division(self) -> None:
+        with pytest.raises(ZeroDivisionError):
+            bayesian_sigmoid_scores(np.array([0.1, 0.5]), np.array([0.0, 0.0]), np.array([0.5]), np.array([1.0]))
+
+
+class TestSampleSizeScorers:
+    def test_wilson_lower_bound_known_values(self) -> None:
+        bounds = wilson_lower_bound(np.array([0.5, 0.5]), np.array([100.0, 10000.0]))
+        np.testing.assert_allclose(bounds, [0.4038, 0.4902], atol=1e-4)
+
+    def test_beta_binomial_shrinks_small_samples_harder(self) -> None:
+        rate = np.array([0.70, 0.70, 0.50, 0.52, 0.48])
+        samples = np.array([20.0, 5000.0, 5000.0, 5000.0, 5000.0])
+        posterior = beta_binomial_posterior(rate, samples)
+        mu = float((rate * samples).sum() / samples.sum())
+        assert mu < posterior[0] < posterior[1] < 0.70
+
+    def test_beta_binomial_pure_noise_collapses_to_mean(self) -> None:
+        posterior = beta_binomial_posterior(np.array([0.5, 0.6]), np.array([10.0, 10.0]))
+        np.testing.assert_allclose(posterior, [0.55, 0.55])
+
+    @pytest.mark.parametrize("method", [BETA_BINOMIAL, WILSON])
+    def test_writes_scores_ranks_and_display_fields(self, method) -> None:
+        items = [dict(item, sampleCount=n) for item, n in zip(_sample_group(), [1000, 2000, 30, 500], strict=True)]
+        add_unit_scale_attr(items)
+        add_sample_size_score_attr(
+            items, method=method, perf_display_attr="pn", pop_display_attr="pp", rank_attr="rank"
+        )
+        scores = [item["weighted_sum"] for item in items]
+        assert all(0 < score < 1 for score in scores)
+        assert sorted(item["rank"] for item in items) == [1, 2, 3, 4]
+        assert items[int(np.argmax(scores))]["rank"] == 1
+        assert all("pn" in item and "pp" in item for item in items)
+
+    def test_small_sample_outlier_ranked_below_bayesian_sigmoid(self) -> None:
+        # c 胜率最高但只有 30 场：Wilson 下界把它排在样本充足的 a 之后
+        items = [dict(item, sampleCount=n) for item, n in zip(_sample_group(), [1000, 2000, 30, 500], strict=True)]
+        add_sample_size_score_attr(items, method=WILSON, rank_attr="rank")
+        assert items[0]["rank"] < items[2]["rank"]
+
+    @pytest.mark.parametrize(
+        ("items", "method", "match"),
+        [
+            ([], WILSON, "empty"),
+            ([{"performance": 0.5, "sampleCount": 10}], "bogus", "unknown"),
+            ([{"performance": 0.5, "sampleCount": 0}], WILSON, "positive"),
+            ([{"performance": 55.0, "sampleCount": 10}], WILSON, "rate"),
+            ([{"performance": 0.5, "sampleCount": 10}, {"performance": 0.5, "sampleCount": 10}], WILSON, "std is 0"),
+        ],
+    )
+    def test_invalid_input_raises(self, items, method, match) -> None:
+        with pytest.raises(ValueError, match=match):
+            add_sample_size_score_attr(items, method=method)
+
+
+class TestRankingHelpers:
+    def test_descending_order_is_stable(self) -> None:
+        values = np.array([0.2, 0.9, 0.2, 0.5, 0.9])
+        assert list(descending_order(values)) == [1, 4, 3, 0, 2]
+        assert list(descending_ranks(values)) == [3, 0, 4, 2, 1]
+
+    @pytest.mark.parametrize("k", [0, 1, 3, 7, 50, 200])
+    def test_top_k_matches_full_sort_with_ties(self, k) -> None:
+        values = np.random.default_rng(k).integers(0, 10, size=50) / 10  # 大量并列值
+        assert list(top_k_indices(values, k)) == list(descending_order(values)[:k])
+
+    def test_top_k_empty_input(self) -> None:
+        assert len(top_k_indices(np.array([]), 3)) == 0
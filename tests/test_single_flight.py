@@ -0,0 +1,90 @@
+"""utils.single_flight 并发去重加载测试。"""
+
+import threading
+import time
+
+import pytest
+
+from aram_mayhem_helper.utils.single_flight import SingleFlight, single_flight_cache
+
+
+def _run_concurrently(target, n: int = 8) -> list:
+    """n 个线程经 Barrier 同时调用 target，返回各自结果（异常对象原样收集）。"""
+    barrier = threading.Barrier(n)
+    results: list = [None] * n
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_load(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls: list[int] = []
+
+        def load() -> int:
+            calls.append(1)
+            time.sleep(0.1)
+            return 42
+
+        assert _run_concurrently(lambda: flights.do("k", load)) == [42] * 8
+        assert len(calls) == 1
+
+    def test_exception_propagates_to_waiters_and_is_not_cached(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        def fail() -> int:
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        results = _run_concurrently(lambda: flights.do("k", fail))
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flights.do("k", lambda: 7) == 7
+
+    def test_distinct_keys_load_independently(self) -> None:
+        flights: SingleFlight[str, str] = SingleFlight()
+        assert flights.do("a", lambda: "A") == "A"
+        assert flights.do("b", lambda: "B") == "B"
+
+
+class TestSingleFlightCache:
+    def test_caches_and_deduplicates(self) -> None:
+        calls: list[int] = []
+
+        @single_flight_cache(maxsize=4)
+        def load(x: int) -> int:
+            calls.append(x)
+            time.sleep(0.1)
+            return x * 2
+
+        assert _run_concurrently(lambda: load(3)) == [6] * 8
+        assert load(3) == 6
+        assert calls == [3]
+        load.cache_clear()  # type: ignore[attr-defined]
+        assert load(3) == 6
+        assert calls == [3, 3]
+
+    def test_failures_are_retried(self) -> None:
+        attempts: list[int] = []
+
+        @single_flight_cache(maxsize=1)
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("transient")
+            return "ok"
+
+        with pytest.raises(OSError):
+            flaky()
+        assert flaky() == "ok"
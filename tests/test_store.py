@@ -0,0 +1,160 @@
+"""utils.store SQLite 存储后端测试（增量导入 / 与 JSON 后端一致 / 索引查询）。"""
+
+import json
+import os
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+from aram_mayhem_helper.utils.config import StorageConfig
+from aram_mayhem_helper.utils.data import GameData
+from aram_mayhem_helper.utils.store import StatsStore
+
+
+@pytest.fixture
+def sqlite_config(app_config):
+    return replace(app_config, storage=StorageConfig(backend="sqlite"))
+
+
+@pytest.fixture
+def sqlite_data(sqlite_config) -> GameData:
+    return GameData(sqlite_config)
+
+
+def _touch_entries(path, entries) -> None:
+    """重写 OP.GG 条目文件并推进 mtime（同一时间戳粒度内的重写也能被识别）。"""
+    stat = path.stat()
+    path.write_text(json.dumps({"data": entries}), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSqliteBackend:
+    def test_matches_json_backend(self, game_data, sqlite_data) -> None:
+        assert sqlite_data.champion_ids() == game_data.champion_ids()
+        assert sqlite_data.champion_id_by_name("Ahri") == game_data.champion_id_by_name("Ahri")
+        for source in ("opgg", "aramkit"):
+            assert sqlite_data.augment_counts(source) == game_data.augment_counts(source)
+            assert sqlite_data.augment_entries("103", source) == game_data.augment_entries("103", source)
+
+    def test_missing_file_still_raises(self, sqlite_data) -> None:
+        with pytest.raises(FileNotFoundError):
+            sqlite_data.augment_entries("22", "aramkit")
+
+    def test_corrupt_file_still_raises(self, sqlite_data, sqlite_config) -> None:
+        (sqlite_config.opgg_augment_dir / "22.json").write_text("{broken", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            sqlite_data.augment_entries("22", "opgg")
+        assert sqlite_data.augment_counts("opgg")["22"] == 0
+
+    def test_only_changed_files_are_reingested(self, sqlite_data, sqlite_config) -> None:
+        assert sqlite_data.sync_store() == 3
+        assert sqlite_data.sync_store() == 0
+        path = sqlite_config.opgg_augment_dir / "22.json"
+        _touch_entries(path, [{"id": 1001, "performance": 60.0, "popular": 5.0}])
+        assert sqlite_data.sync_store() == 1
+        sqlite_data.invalidate({("22", "opgg")})
+        assert sqlite_data.augment_entries("22", "opgg") == [{"id": 1001, "performance": 60.0, "popular": 5.0}]
+
+    def test_deleted_file_removed_from_counts(self, sqlite_data, sqlite_config) -> None:
+        sqlite_data.sync_store()
+        (sqlite_config.opgg_augment_dir / "22.json").unlink()
+        assert "22" not in sqlite_data.augment_counts("opgg")
+
+    def test_deleted_file_drops_stats_rows(self, sqlite_data, sqlite_config) -> None:
+        sqlite_data.sync_store()
+        store = sqlite_data.stats_store()
+        assert store is not None
+        (sqlite_config.opgg_augment_dir / "22.json").unlink()
+        assert sqlite_data.sync_store() == 0
+        assert store.augment_stats("2001", "opgg", "all") == []
+        (sqlite_config.opgg_augment_dir / "103.json").unlink()
+        with pytest.raises(FileNotFoundError):
+            sqlite_data.augment_entries("103", "opgg")
+        assert store.leaderboard("opgg", "all") == []
+
+    def test_reads_through_database_after_restart(self, sqlite_data, sqlite_config) -> None:
+        sqlite_data.sync_store()
+        entries = sqlite_data.augment_entries("103", "opgg")
+        reopened = GameData(sqlite_config)
+        reopened._parse_augment_file = None  # 文件未变化时不再解析 JSON
+        assert reopened.augment_entries("103", "opgg") == entries
+
+    def test_sync_store_requires_sqlite_backend(self, game_data) -> None:
+        assert game_data.stats_store() is None
+        with pytest.raises(ValueError):
+            game_data.sync_store()
+
+
+class TestQueries:
+    @pytest.fixture
+    def store(self, sqlite_data) -> StatsStore:
+        sqlite_data.sync_store()
+        store = sqlite_data.stats_store()
+        assert store is not None
+        return store
+
+    def test_augment_stats_across_champions(self, store) -> None:
+        assert store.augment_stats("1001", "opgg", "all") == [
+            {"champion_id": "103", "performance": 80.0, "popular": 10.0, "sample_count": None}
+        ]
+        assert [row["champion_id"] for row in store.augment_stats("2001", "opgg", "all")] == ["22"]
+
+    def test_leaderboard_orders_by_metric_with_names(self, store) -> None:
+        rows = store.leaderboard("opgg", "all", limit=2)
+        assert [row["augment_id"] for row in rows] == ["1001", "1005"]
+        assert rows[0]["name"] == "泰坦的坚决"
+        popular = store.leaderboard("opgg", "all", metric="popular", min_popular=20.0)
+        assert all(row["popular"] >= 20.0 for row in popular)
+        with pytest.raises(ValueError):
+            store.leaderboard("opgg", "all", metric="payload")
+
+    def test_find_augment_by_normalized_name(self, store) -> None:
+        assert store.find_augment("泰坦的坚决") == "1001"
+        assert store.find_augment("不存在") is None
+
+    def test_versions_keep_history(self, sqlite_data, sqlite_config, store) -> None:
+        version_file = sqlite_config.aramkit_version_file
+        version_file.write_text(json.dumps({"data_version": "16.2-20260101-a"}), encoding="utf-8")
+        path = sqlite_config.aramkit_augment_dir / "103.json"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        sqlite_data.sync_store()
+        assert store.versions("aramkit", "all") == ["", "16.2-20260101-a"]
+        augment_id = sqlite_data.augment_entries("103", "aramkit")[0]["id"]
+        history = store.augment_history("103", str(augment_id), "aramkit", "all")
+        assert [row["version"] for row in history] == ["", "16.2-20260101-a"]
+
+    @pytest.mark.parametrize(
+        ("query", "index"),
+        [
+            ("leaderboard", "stats_performance"),
+            ("augment_stats", "stats_augment"),
+            ("augment_history", "stats_augment"),
+        ],
+    )
+    def test_queries_use_indexes(self, store, query, index) -> None:
+        plans: list[str] = []
+        conn = store._connection()
+        conn.set_trace_callback(plans.append)
+        if query == "leaderboard":
+            store.leaderboard("opgg", "all")
+        elif query == "augment_stats":
+            store.augment_stats("1001", "opgg", "all")
+        else:
+            store.augment_history("103", "1001", "opgg", "all")
+        conn.set_trace_callback(None)
+        sql = next(statement for statement in plans if "FROM" in statement)
+        detail = " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        assert f"INDEX {index}" in detail
+        assert "SCAN s " not in f"{detail} " and "SCAN stats " not in f"{detail} "
+
+    def test_outdated_schema_is_rebuilt(self, sqlite_config) -> None:
+        db_path = sqlite_config.stats_db_file
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE stats (legacy TEXT)")
+        conn.execute("PRAGMA user_version = 99")
+        conn.commit()
+        conn.close()
+        data = GameData(sqlite_config)
+        assert data.sync_store() == 3
@@ -0,0 +1,107 @@
+"""league_client_api.stub_server 替身服务器测试（真实 HTTP 往返 + fixture 载荷）。"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import requests
+
+from aram_mayhem_helper.league_client_api.live_data import LiveClientData
+from aram_mayhem_helper.league_client_api.stub_server import (
+    LiveClientStub,
+    build_game_payload,
+    load_game_payload,
+    run_recommend_benchmark,
+    summarize_latencies,
+)
+from aram_mayhem_helper.utils.config import get_config
+
+PAYLOAD_FILE = Path(__file__).parent / "fixtures" / "liveclient" / "allgamedata.json"
+
+
+@pytest.fixture
+def stub():
+    with LiveClientStub(load_game_payload(PAYLOAD_FILE), port=0, tls=False) as server:
+        yield server
+
+
+class TestEndpoints:
+    def test_endpoints_derived_from_allgamedata(self, stub) -> None:
+        base = stub.base_url
+        assert requests.get(f"{base}/activeplayername", timeout=2).json() == "测试玩家#CN1"
+        assert requests.get(f"{base}/activeplayer", timeout=2).json()["summonerName"] == "测试玩家"
+        players = requests.get(f"{base}/playerlist", timeout=2).json()
+        assert [p["championName"] for p in players] == ["Ahri", "Annie", "Ashe", "Garen", "Lux"]
+        full = requests.get(f"{base}/allgamedata", timeout=2).json()
+        assert full["allPlayers"] == players
+        assert full["gameData"]["gameTime"] >= 125.5
+
+    def test_game_time_advances_and_resets(self, stub) -> None:
+        assert requests.get(f"{stub.base_url}/gamestats", timeout=2).json()["gameTime"] >= 125.5
+        stub.reset_game()
+        assert requests.get(f"{stub.base_url}/gamestats", timeout=2).json()["gameTime"] < 5
+
+    def test_unknown_endpoint_returns_404(self, stub) -> None:
+        resp = requests.get(f"{stub.base_url}/nope", timeout=2)
+        assert resp.status_code == 404
+        assert resp.json()["errorCode"] == "RESOURCE_NOT_FOUND"
+
+    def test_failure_injection_returns_503(self) -> None:
+        with LiveClientStub(build_game_payload("Ahri"), port=0, tls=False, failure_rate=1.0) as server:
+            assert requests.get(f"{server.base_url}/gamestats", timeout=2).status_code == 503
+            assert LiveClientData(server.base_url).current_champion_name() is None
+
+    def test_invalid_failure_rate_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            LiveClientStub(build_game_payload("Ahri"), failure_rate=1.5)
+
+    @pytest.mark.skipif(shutil.which("openssl") is None, reason="需要 openssl 生成自签名证书")
+    def test_https_with_self_signed_cert(self) -> None:
+        with LiveClientStub(build_game_payload("Ashe"), port=0) as server:
+            assert server.base_url.startswith("https://")
+            assert LiveClientData(server.base_url).current_champion_name() == "Ashe"
+
+
+class TestLiveClientAgainstStub:
+    def test_resolves_and_caches_champion(self, stub) -> None:
+        client = LiveClientData(stub.base_url)
+        assert client.current_champion_name() == "Ahri"
+        requests_before = stub.request_count
+        assert client.current_champion_name() == "Ahri"
+        assert stub.request_count - requests_before == 1  # 仅 gamestats
+
+    def test_new_game_invalidates_cached_champion(self, stub) -> None:
+        client = LiveClientData(stub.base_url)
+        assert client.current_champion_name() == "Ahri"
+        stub.reset_game(build_game_payload("Ashe", riot_id="测试玩家#CN1"))
+        assert client.current_champion_name() == "Ashe"
+
+
+class TestBenchmark:
+    def test_runs_recommend_pipeline(self, stub, game_data) -> None:
+        samples, failures = run_recommend_benchmark(
+            LiveClientData(stub.base_url),
+            game_data,
+            thresholds=get_config().suggest,
+            augments=["泰坦的坚决", "尖端发明家"],
+            iterations=5,
+            cold=True,
+        )
+        assert (len(samples), failures) == (5, 0)
+        assert all(s > 0 for s in samples)
+
+    def test_counts_failures(self, game_data) -> None:
+        with LiveClientStub(build_game_payload("Aatrox"), port=0, tls=False) as server:  # 266 无符文数据
+            samples, failures = run_recommend_benchmark(
+                LiveClientData(server.base_url),
+                game_data,
+                thresholds=get_config().suggest,
+                augments=[],
+                iterations=3,
+            )
+        assert (samples, failures) == ([], 3)
+
+    def test_summarize_latencies(self) -> None:
+        summary = summarize_latencies([1.0, 2.0, 3.0, 4.0])
+        assert summary == {"count": 4, "mean": 2.5, "p50": 2.5, "p90": 3.7, "p99": 3.97, "max": 4.0}
+        assert summarize_latencies([]) == {"count": 0}
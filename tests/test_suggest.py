@@ -1,7 +1,11 @@
 """algorithm.suggest 引擎测试（分组/打分/推荐字符串，基于 GameData 注入）。"""
 
-from aram_mayhem_helper.algorithm.suggest import Suggest
+from dataclasses import replace
+from typing import Any
+
+from aram_mayhem_helper.algorithm.suggest import Suggest, SuggestCache, SuggestTier
 from aram_mayhem_helper.utils.config import get_config
+from aram_mayhem_helper.web.service import build_champion_augments
 
 
 def _build_suggest(game_data, champion_id: str = "103", source: str = "opgg") -> Suggest:
@@ -66,6 +70,28 @@ class TestSuggestInit:
         s = _build_suggest(game_data)
         assert "1" in s.augment_group  # 组保留（无分数）
 
+    def test_sample_size_scorer_applies_only_with_sample_counts(self, game_data) -> None:
+        t = get_config().suggest
+        wilson = replace(t, scorer="wilson")
+        opgg = Suggest("103", game_data, source="opgg", thresholds=t)
+        assert Suggest("103", game_data, source="opgg", thresholds=wilson).champion_augment_data == (
+            opgg.champion_augment_data
+        )  # OP.GG 无 sampleCount：回退贝叶斯-sigmoid
+        baseline = Suggest("103", game_data, source="aramkit", thresholds=t)
+        baseline_scores = {str(i["id"]): i["weighted_sum"] for i in baseline.champion_augment_data}
+        sampled = Suggest("103", game_data, source="aramkit", thresholds=wilson)
+        scores = {str(i["id"]): i["weighted_sum"] for i in sampled.champion_augment_data}
+        assert scores.keys() == baseline_scores.keys() and scores != baseline_scores
+        assert all(sampled.get_verdict(augment_id) is not None for augment_id in scores)
+
+    def test_sample_size_scorer_skips_blended_source(self, game_data) -> None:
+        # 融合源的 performance 为缩放值、sampleCount 为合成值：即使组内样本数齐全也回退贝叶斯-sigmoid
+        t = get_config().suggest
+        blended = Suggest("103", game_data, source="blended", thresholds=t)
+        assert all((i.get("sampleCount") or 0) > 0 for i in blended.champion_augment_data)
+        wilson = Suggest("103", game_data, source="blended", thresholds=replace(t, scorer="wilson"))
+        assert wilson.champion_augment_data == blended.champion_augment_data
+
     def test_default_source_used_when_omitted(self, game_data) -> None:
         s = _build_suggest(game_data, source=None)
         assert s.source == game_data.default_source()
@@ -80,6 +106,13 @@ class TestSuggestMethods:
         assert info["name"] == "泰坦的坚决"
         assert s.get_augment_info_by_id("") is None
 
+    def test_top_augments_across_levels(self, game_data) -> None:
+        s = _build_suggest(game_data)
+        expected = sorted(s.champion_augment_data, key=lambda x: x["weighted_sum"], reverse=True)
+        assert s.top_augments(3) == expected[:3]
+        assert s.top_augments(100) == expected
+        assert s.top_augments(0) == []
+
     def test_suggest_recommendation_strings_opgg(self, game_data) -> None:
         s = _build_suggest(game_data)
         results = s.suggest(["泰坦的坚决", "尖端发明家", "不存在符文"])
@@ -165,6 +198,45 @@ class TestSuggestMethods:
         assert s.get_suggest_info([{"name": "X"}]) == []
 
 
+class TestSuggestVerdicts:
+    def test_verdict_table_precomputed_for_ranked_items(self, game_data) -> None:
+        s = _build_suggest(game_data)
+        verdict = s.get_verdict("1001")
+        assert verdict is not None
+        assert (verdict.tier, verdict.rank, verdict.group_size) == (SuggestTier.CONSIDER, 2, 3)
+        assert verdict.message == "考虑符文：泰坦的坚决，2/3，表现: 0.8616，流行度: 0.0"
+        assert s.get_verdict("9999") is None
+
+    def test_verdicts_match_on_the_fly_messages(self, game_data) -> None:
+        s = _build_suggest(game_data, source="aramkit")
+        for item in s.champion_augment_data:
+            verdict = s.get_verdict(str(item["id"]))
+            assert verdict is not None
+            assert s.get_suggest_info([item]) == [verdict.message]
+
+    def test_suggest_hot_path_skips_get_suggest_info(self, game_data, monkeypatch) -> None:
+        s = _build_suggest(game_data)
+
+        def fail(_augments):
+            raise AssertionError("热路径不应现场计算")
+
+        monkeypatch.setattr(s, "get_suggest_info", fail)
+        assert s.suggest(["泰坦的坚决"]) == ["考虑符文：泰坦的坚决，2/3，表现: 0.8616，流行度: 0.0"]
+
+    def test_unranked_group_falls_back_to_get_suggest_info(self, game_data, fixture_data_dir) -> None:
+        import json
+
+        entries = game_data.augment_entries("103", "opgg")
+        single = [e for e in entries if e["id"] == 1002]
+        (fixture_data_dir / "opgg" / "aram_augments" / "103.json").write_text(
+            json.dumps({"data": single}), encoding="utf-8"
+        )
+        game_data.reload()
+        s = _build_suggest(game_data)
+        assert s.get_verdict("1002") is None  # 单元素组打分失败，无排名
+        assert s.suggest([s.get_augment_info_by_id("1002")["name"]]) == []  # 与旧行为一致：缺 group_size 无建议
+
+
 class TestSuggestOnUnrecognized:
     def test_callback_fires_with_index_and_text_for_unmatched(self, game_data) -> None:
         s = _build_suggest(game_data)
@@ -184,3 +256,91 @@ class TestSuggestOnUnrecognized:
     def test_default_none_keeps_behavior(self, game_data) -> None:
         s = _build_suggest(game_data)
         assert s.suggest(["完全不存在的符文"]) == []  # 默认参数路径不变
+
+
+class TestSuggestCache:
+    def test_hit_returns_same_instance(self, game_data) -> None:
+        cache = SuggestCache()
+        t = get_config().suggest
+        first = cache.get("103", game_data, source="opgg", thresholds=t)
+        assert cache.get("103", game_data, source="opgg", thresholds=t) is first
+        assert first.source == "opgg"
+
+    def test_key_includes_source_and_thresholds(self, game_data) -> None:
+        cache = SuggestCache()
+        t = get_config().suggest
+        base = cache.get("103", game_data, source="opgg", thresholds=t)
+        assert cache.get("103", game_data, source="aramkit", thresholds=t) is not base
+        assert cache.get("103", game_data, source="opgg", thresholds=replace(t, sigmoid_steepness=2.0)) is not base
+        # source=None 解析为默认源后参与键
+        default = cache.get("103", game_data, thresholds=t)
+        assert cache.get("103", game_data, source=game_data.default_source(), thresholds=t) is default
+
+    def test_interleaved_thresholds_do_not_rewrite_cached_instances(self, game_data) -> None:
+        cache = SuggestCache()
+        t = get_config().suggest
+        steep = replace(t, sigmoid_steepness=4.0, scorer="wilson")
+
+        def snapshot(suggest: Suggest) -> dict[str, tuple[Any, ...]]:
+            return {
+                str(i["id"]): (i["weighted_sum"], i["rank"], suggest.get_verdict(str(i["id"])))
+                for i in suggest.champion_augment_data
+            }
+
+        base = cache.get("103", game_data, source="aramkit", thresholds=t)
+        expected = snapshot(base)
+        other = cache.get("103", game_data, source="aramkit", thresholds=steep)
+        expected_other = snapshot(other)
+        assert expected_other != expected
+        build_champion_augments(game_data, "103", "aramkit")  # web 视图同样不改动缓存实例
+        assert cache.get("103", game_data, source="aramkit", thresholds=t) is base
+        assert snapshot(base) == expected
+        assert snapshot(cache.get("103", game_data, source="aramkit", thresholds=steep)) == expected_other
+        assert all("weighted_sum" not in entry for entry in game_data.augment_entries("103", "aramkit") or [])
+
+    def test_blended_source_cached_separately(self, game_data) -> None:
+        cache = SuggestCache()
+        t = get_config().suggest
+        blended = cache.get("103", game_data, source="blended", thresholds=t)
+        assert blended is not cache.get("103", game_data, source="aramkit", thresholds=t)
+        assert cache.get("103", game_data, source="blended", thresholds=t) is blended
+        assert blended.get_verdict("1001") is not None
+        game_data.invalidate({("103", "opgg")})  # 任一源变化都使融合结果失效
+        assert cache.get("103", game_data, source="blended", thresholds=t) is not blended
+
+    def test_incremental_invalidate_keeps_other_champions(self, game_data) -> None:
+        cache = SuggestCache()
+        t = get_config().suggest
+        ahri = cache.get("103", game_data, source="opgg", thresholds=t)
+        ashe = cache.get("22", game_data, source="opgg", thresholds=t)
+        game_data.invalidate({("103", "opgg")})
+        assert cache.get("22", game_data, source="opgg", thresholds=t) is ashe
+        assert cache.get("103", game_data, source="opgg", thresholds=t) is not ahri
+
+    def test_reload_invalidates(self, game_data) -> None:
+        cache = SuggestCache()
+        t = get_config().suggest
+        first = cache.get("103", game_data, source="opgg", thresholds=t)
+        game_data.reload()
+        assert cache.get("103", game_data, source="opgg", thresholds=t) is not first
+        assert len(cache) == 1
+
+    def test_other_game_data_instance_invalidates(self, game_data, app_config) -> None:
+        from aram_mayhem_helper.utils.data import GameData
+
+        cache = SuggestCache()
+        t = get_config().suggest
+        first = cache.get("103", game_data, source="opgg", thresholds=t)
+        assert cache.get("103", GameData(app_config), source="opgg", thresholds=t) is not first
+
+    def test_lru_eviction_and_clear(self, game_data) -> None:
+        cache = SuggestCache(maxsize=2)
+        t = get_config().suggest
+        a = cache.get("103", game_data, source="opgg", thresholds=t)
+        cache.get("103", game_data, source="aramkit", thresholds=t)
+        assert cache.get("103", game_data, source="opgg", thresholds=t) is a  # 刷新为最近使用
+        cache.get("22", game_data, source="opgg", thresholds=t)  # 淘汰 aramkit
+        assert len(cache) == 2
+        assert cache.get("103", game_data, source="opgg", thresholds=t) is a
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,132 @@
+"""algorithm.sweep 参数扫描测试（与 Suggest 档位/排名一致性 + 进程池路径）。"""
+
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+
+import aram_mayhem_helper.cli as cli
+from aram_mayhem_helper.algorithm.suggest import Suggest, SuggestTier
+from aram_mayhem_helper.algorithm.sweep import SweepGrid, extract_group_arrays, run_sweep
+from aram_mayhem_helper.utils.config import get_config
+
+
+def _suggest_tier_counts(game_data, source: str, thresholds) -> Counter:
+    counts: Counter = Counter()
+    for champion_id in game_data.champion_ids():
+        if game_data.available_source(champion_id, preferred=source) != source:
+            continue
+        suggest = Suggest(champion_id, game_data, source=source, thresholds=thresholds)
+        for item in suggest.champion_augment_data:
+            verdict = suggest.get_verdict(str(item["id"]))
+            if verdict is not None:
+                counts[verdict.tier] += 1
+    return counts
+
+
+class TestRunSweep:
+    def test_counts_match_suggest_for_each_setting(self, game_data) -> None:
+        base = get_config().suggest
+        grid = SweepGrid(tau_factors=(0.25, 1.0), sigmoid_steepness=(0.5, 2.0), immediate_score_thresholds=(0.6, 0.9))
+        rows = run_sweep(game_data, grid, base=base, sources=["opgg"], workers=1)
+        assert len(rows) == 8
+        for row in rows:
+            thresholds = replace(
+                base,
+                shrinkage_tau_factor=row.tau_factor,
+                sigmoid_steepness=row.sigmoid_steepness,
+                immediate_select_score_threshold=row.immediate_score_threshold,
+            )
+            expected = _suggest_tier_counts(game_data, "opgg", thresholds)
+            assert (row.immediate, row.consider, row.trash) == (
+                expected[SuggestTier.IMMEDIATE],
+                expected[SuggestTier.CONSIDER],
+                expected[SuggestTier.TRASH],
+            )
+
+    @pytest.mark.parametrize("scorer", ["beta_binomial", "wilson"])
+    def test_counts_follow_configured_scorer(self, game_data, scorer) -> None:
+        base = replace(get_config().suggest, scorer=scorer)
+        grid = SweepGrid(tau_factors=(0.5,), sigmoid_steepness=(0.5, 2.0), immediate_score_thresholds=(0.6, 0.9))
+        rows = run_sweep(game_data, grid, base=base, sources=("opgg", "aramkit", "blended"), workers=1)
+        # OP.GG 无样本数、融合源样本数为合成值，与 Suggest 一样回退贝叶斯-sigmoid
+        assert {row.source for row in rows} == {"opgg", "aramkit", "blended"}
+        for row in rows:
+            thresholds = replace(
+                base,
+                sigmoid_steepness=row.sigmoid_steepness,
+                immediate_select_score_threshold=row.immediate_score_threshold,
+            )
+            expected = _suggest_tier_counts(game_data, row.source, thresholds)
+            assert (row.immediate, row.consider, row.trash) == (
+                expected[SuggestTier.IMMEDIATE],
+                expected[SuggestTier.CONSIDER],
+                expected[SuggestTier.TRASH],
+            )
+
+    def test_scorer_without_vectorized_form_rejected(self, game_data) -> None:
+        grid = SweepGrid(tau_factors=(0.5,), sigmoid_steepness=(1.0,), immediate_score_thresholds=(0.7,))
+        with pytest.raises(ValueError, match="向量化"):
+            run_sweep(game_data, grid, base=replace(get_config().suggest, scorer="elo"), workers=1)
+
+    def test_baseline_setting_has_no_changes(self, game_data) -> None:
+        base = get_config().suggest
+        grid = SweepGrid(
+            tau_factors=(base.shrinkage_tau_factor,),
+            sigmoid_steepness=(base.sigmoid_steepness,),
+            immediate_score_thresholds=(base.immediate_select_score_threshold,),
+        )
+        (row,) = run_sweep(game_data, grid, base=base, sources=["opgg"], workers=1)
+        assert row.tier_changes == 0
+        assert row.rank_correlation == 1.0
+
+    def test_process_pool_matches_inline(self, game_data) -> None:
+        base = get_config().suggest
+        grid = SweepGrid(tau_factors=(0.1, 0.5, 5.0), sigmoid_steepness=(1.0,), immediate_score_thresholds=(0.7,))
+        inline = run_sweep(game_data, grid, base=base, workers=1)
+        pooled = run_sweep(game_data, grid, base=base, workers=2)
+        assert inline == pooled
+        assert {row.source for row in pooled} == {"opgg", "aramkit"}
+
+    def test_extract_does_not_mutate_cached_entries(self, game_data) -> None:
+        before = [dict(entry) for entry in game_data.augment_entries("103", "opgg")]
+        assert extract_group_arrays(game_data, "opgg", get_config().suggest)
+        assert game_data.augment_entries("103", "opgg") == before
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"tau_factors": (), "sigmoid_steepness": (1.0,), "immediate_score_thresholds": (0.7,)},
+            {"tau_factors": (0.5,), "sigmoid_steepness": (0.0,), "immediate_score_thresholds": (0.7,)},
+            {"tau_factors": (-1.0,), "sigmoid_steepness": (1.0,), "immediate_score_thresholds": (0.7,)},
+        ],
+    )
+    def test_invalid_grid_rejected(self, kwargs) -> None:
+        with pytest.raises(ValueError):
+            SweepGrid(**kwargs)
+
+
+class TestSweepCommand:
+    def test_prints_default_grid(self, monkeypatch, game_data, app_config, capsys) -> None:
+        monkeypatch.setattr(cli, "setup_logging", lambda: None)
+        monkeypatch.setattr(cli, "get_game_data", lambda: game_data)
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        assert cli.cli_main(["sweep", "--source", "opgg", "--workers", "1"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1 + 27  # 表头 + 3×3×3 网格
+        assert {len(line) for line in lines} == {len(lines[0])}  # 表头与数据行对齐
+        assert lines[0].split() == [
+            "source",
+            "tau",
+            "steep",
+            "thresh",
+            "immediate",
+            "consider",
+            "trash",
+            "changes",
+            "rho",
+        ]
+
+    def test_invalid_grid_returns_error(self, monkeypatch, app_config) -> None:
+        monkeypatch.setattr(cli, "get_config", lambda: app_config)
+        assert cli.sweep(steepness=[-1.0]) == 1
@@ -0,0 +1,141 @@
+"""utils.watcher 数据目录监视测试（路径分类 / 轮询增量失效 / inotify 后端）。"""
+
+import json
+import sys
+import time
+
+import pytest
+
+from aram_mayhem_helper.utils.summary import SUMMARY_FILE_NAME
+from aram_mayhem_helper.utils.watcher import DataWatcher
+
+
+def _write_entries(path, entries) -> None:
+    path.write_text(json.dumps({"data": entries}), encoding="utf-8")
+
+
+@pytest.fixture
+def watcher(game_data, app_config) -> DataWatcher:
+    return DataWatcher(game_data, app_config, interval=0.05, debounce=0.1, use_inotify=False)
+
+
+class TestClassify:
+    def test_entry_files_map_to_champion_and_source(self, watcher, app_config) -> None:
+        changes = watcher.classify(
+            {
+                app_config.opgg_augment_dir / "103.json",
+                app_config.aramkit_augment_dir / "22.json",
+                app_config.opgg_augment_dir / SUMMARY_FILE_NAME,
+                app_config.opgg_augment_dir / "103.json.tmp",
+                app_config.data_dir / "champions-names-i18n.json",
+            }
+        )
+        assert changes.entries == {("103", "opgg"), ("22", "aramkit")}
+        assert not changes.full_reload
+
+    def test_every_aramkit_dataset_maps_to_aramkit(self, watcher, app_config) -> None:
+        changes = watcher.classify({app_config.aramkit_dataset_dir("high") / "103.json"})
+        assert changes.entries == {("103", "aramkit")}
+
+    def test_index_files_require_full_reload(self, watcher, app_config) -> None:
+        assert watcher.classify({app_config.trans_file}).full_reload
+        assert watcher.classify({app_config.aramkit_resources_dir / "16.1.0-x" / "augments.json"}).full_reload
+        assert watcher.classify({app_config.champion_dir / "16.1.1.json"}).full_reload
+
+
+class TestPolling:
+    def test_entry_change_invalidates_only_that_champion(self, watcher, game_data, app_config) -> None:
+        ashe = game_data.augment_entries("22", "opgg")
+        assert not watcher.poll_once()  # 建立基线
+        _write_entries(app_config.opgg_augment_dir / "103.json", [{"id": 1, "performance": 1.0, "popular": 1.0}])
+        changes = watcher.poll_once()
+        assert changes.entries == {("103", "opgg")}
+        assert game_data.changed_since(0) == frozenset({"103"})
+        assert game_data.augment_entries("22", "opgg") is ashe
+        assert len(game_data.augment_entries("103", "opgg")) == 1
+        assert not watcher.poll_once()  # 无新变化
+
+    def test_translation_change_reloads_everything(self, watcher, game_data, app_config) -> None:
+        watcher.poll_once()
+        app_config.trans_file.write_text(json.dumps({"1001": {"name": "新名字", "level": "2"}}), encoding="utf-8")
+        assert watcher.poll_once().full_reload
+        assert game_data.changed_since(0) is None
+        assert game_data.augment_id("新名字") == "1001"
+
+    def test_background_thread_debounces_writes(self, watcher, game_data, app_config) -> None:
+        watcher.start()
+        try:
+            time.sleep(0.1)
+            for performance in (1.0, 2.0):
+                _write_entries(
+                    app_config.opgg_augment_dir / "103.json", [{"id": 1, "performance": performance, "popular": 1.0}]
+                )
+                time.sleep(0.02)
+            deadline = time.monotonic() + 5
+            while game_data.generation == 0 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            watcher.stop()
+        assert game_data.changed_since(0) == frozenset({"103"})
+        assert game_data.augment_entries("103", "opgg")[0]["performance"] == 2.0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify 仅 Linux 可用")
+class TestInotify:
+    def test_inotify_picks_up_new_entries(self, game_data, app_config) -> None:
+        watcher = DataWatcher(game_data, app_config, interval=0.05, debounce=0.1)
+        watcher.start()
+        try:
+            time.sleep(0.1)
+            assert watcher._inotify is not None
+            new_file = app_config.opgg_augment_dir / "266.json"
+            _write_entries(new_file, [{"id": 1001, "performance": 50.0, "popular": 1.0}])
+            deadline = time.monotonic() + 5
+            while game_data.generation == 0 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            watcher.stop()
+        assert watcher._inotify is None  # 停止后已关闭
+        assert game_data.changed_since(0) == frozenset({"266"})
+
+    def test_directory_created_after_start_is_watched(self, game_data, app_config) -> None:
+        high_dir = app_config.aramkit_dataset_dir("high")
+        assert not high_dir.exists()  # 首次爬取高分段前数据集目录尚不存在，其上级也不在监视范围内
+        watcher = DataWatcher(game_data, app_config, interval=0.05, debounce=0.1)
+        watcher.start()
+        try:
+            time.sleep(0.1)
+            high_dir.mkdir()
+            _write_entries(high_dir / "266.json", [{"id": 1001, "winRate": 0.5, "pickRate": 0.1}])
+            deadline = time.monotonic() + 5
+            while game_data.generation == 0 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert game_data.generation > 0  # 目录创建：重建监视并全量重载（捕获监视建立前写入的文件）
+            time.sleep(0.3)  # 等待重载后的去抖窗口结束
+            generation = game_data.generation
+            _write_entries(high_dir / "103.json", [{"id": 1001, "winRate": 0.5, "pickRate": 0.1}])
+            while game_data.generation == generation and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            watcher.stop()
+        assert game_data.changed_since(generation) == frozenset({"103"})  # 新目录内的写入按英雄增量失效
+
+    def test_unrelated_directories_under_data_root_are_ignored(self, game_data, app_config) -> None:
+        watcher = DataWatcher(game_data, app_config, interval=0.05, debounce=0.1)
+        reloads: list[bool] = []
+        original_start = watcher._start_inotify
+        watcher._start_inotify = lambda: reloads.append(True) or original_start()  # type: ignore[method-assign]
+        watcher.start()
+        try:
+            time.sleep(0.1)
+            (app_config.data_dir / "archive" / "index").mkdir(parents=True)  # 归档目录与数据库文件位于数据根目录
+            (app_config.data_dir / "stats.sqlite3").write_bytes(b"")
+            time.sleep(0.4)
+            assert (game_data.generation, len(reloads)) == (0, 1)  # 未重建监视，也未重载
+            app_config.trans_file.write_text(app_config.trans_file.read_text(encoding="utf-8"), encoding="utf-8")
+            deadline = time.monotonic() + 5
+            while game_data.generation == 0 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            watcher.stop()
+        assert game_data.generation > 0  # 翻译表仍在监视范围内
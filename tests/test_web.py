@@ -1,11 +1,24 @@
 """web 服务层与应用工厂测试（记录形状/打分/列表/路由）。"""
 
 import json
+from typing import Any
 
 import pytest
 
+from aram_mayhem_helper.utils.config import SCORING_SOURCES
+from aram_mayhem_helper.utils.data import GameData
 from aram_mayhem_helper.web.app import create_app
-from aram_mayhem_helper.web.service import augment_description, build_champion_augments, build_champion_list
+from aram_mayhem_helper.web.service import (
+    AUGMENT_COLUMNS,
+    CHAMPION_COLUMNS,
+    AugmentQuery,
+    AugmentTable,
+    augment_description,
+    build_champion_augments,
+    build_champion_list,
+    clean_augment_descriptions,
+    to_columnar,
+)
 
 
 @pytest.fixture
@@ -16,7 +29,7 @@ def patch_i18n_files(monkeypatch, fixture_data_dir):
     i18n = json.loads((fixture_data_dir / "champions-names-i18n.json").read_text(encoding="utf-8"))
     desc = json.loads((fixture_data_dir / "aram-mayhem-augments.zh_cn.json").read_text(encoding="utf-8"))
     monkeypatch.setattr(service, "_load_champion_i18n", lambda: i18n)
-    monkeypatch.setattr(service, "_load_augment_descriptions", lambda: desc)
+    monkeypatch.setattr(service, "_load_augment_descriptions", lambda: clean_augment_descriptions(desc))
 
 
 RECORD_KEYS = {
@@ -110,6 +123,23 @@ class TestAugmentDescription:
     def test_missing_description_returns_empty(self, game_data, patch_i18n_files) -> None:
         assert augment_description("9999") == ""
 
+    def test_clean_table_keeps_only_text(self) -> None:
+        raw = {
+            "1": {"description": "", "tooltip": "<keyword>战神</keyword><br>层数", "spellDataValues": {"A": 1}},
+            "2": {"description": "<scaleAF>适应之力</scaleAF>", "iconLarge": "x.png"},
+        }
+        assert clean_augment_descriptions(raw) == {"1": "战神层数", "2": "适应之力"}
+
+    def test_loads_from_file_and_reloads_on_change(self, app_config, monkeypatch) -> None:
+        import aram_mayhem_helper.web.service as service
+
+        monkeypatch.setattr(service, "get_config", lambda: app_config)
+        assert augment_description("1001") == "造成适应之力。"
+        app_config.augment_desc_file.write_text(
+            json.dumps({"1001": {"description": "<attention>新描述</attention>"}}), encoding="utf-8"
+        )
+        assert augment_description("1001") == "新描述"
+
 
 class TestCreateApp:
     def test_index_renders_with_default_source(self, game_data, patch_i18n_files) -> None:
@@ -118,6 +148,9 @@ class TestCreateApp:
         assert resp.status_code == 200
         html = resp.get_data(as_text=True)
         assert "ARAM 符文数据浏览" in html
+        # 下拉中的每个数据源都有详情页标题标签
+        for source in SCORING_SOURCES:
+            assert f'<option value="{source}"' in html and f"'{source}':" in html
 
     def test_api_champions_shape(self, game_data, patch_i18n_files) -> None:
         client = create_app(game_data).test_client()
@@ -144,8 +177,373 @@ class TestCreateApp:
         rows = resp.get_json()
         assert rows[0]["performance"] == 0.55
 
+    def test_api_blended_source(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        rows = client.get("/api/champions/103/augments?source=blended").get_json()
+        assert rows and all(0 <= row["performance_display"] <= 100 for row in rows)
+        champions = {c["champion_id"]: c for c in client.get("/api/champions?source=blended").get_json()}
+        assert champions["103"]["augment_count"] == 8
+        assert client.get("/api/datasets/diff?source=blended").status_code == 200
+
+    def test_api_dataset_param_selects_dataset(self, game_data, patch_i18n_files, high_dataset) -> None:
+        client = create_app(game_data).test_client()
+        all_rows = client.get("/api/champions/103/augments?source=aramkit").get_json()
+        high_rows = client.get("/api/champions/103/augments?source=aramkit&dataset=high").get_json()
+        assert all_rows[0]["performance"] == 0.55 and high_rows[0]["performance"] == 0.53
+        assert client.get("/api/champions?source=aramkit&dataset=high").status_code == 200
+        assert client.get("/api/champions?source=opgg&dataset=high").status_code == 400
+        assert client.get("/api/champions/103/augments?source=aramkit&dataset=low").status_code == 400
+
+    def test_api_dataset_diff(self, game_data, patch_i18n_files, high_dataset) -> None:
+        client = create_app(game_data).test_client()
+        resp = client.get("/api/datasets/diff?limit=2")
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert (body["base"], body["other"]) == ("all", "high")
+        assert body["total"] > 2 and len(body["rows"]) == 2
+        top = body["rows"][0]
+        assert top["champion_id"] == "103"
+        assert top["rank_diff"] == top["all"]["rank"] - top["high"]["rank"]
+        assert abs(top["percentile_diff"]) >= abs(body["rows"][1]["percentile_diff"])
+        assert client.get("/api/datasets/diff?champion=22").get_json()["total"] == 0
+        assert client.get("/api/datasets/diff?base=all&other=all").status_code == 400
+        assert client.get("/api/datasets/diff?source=opgg").status_code == 400
+        assert client.get("/api/datasets/diff?limit=-1").status_code == 400
+
+    def test_api_augment_trend(self, game_data, patch_i18n_files, app_config) -> None:
+        game_data.stats_archive().record("opgg", "all", "2026-10-01", app_config.opgg_augment_dir)
+        client = create_app(game_data).test_client()
+        resp = client.get("/api/champions/103/augments/1001/trend?source=opgg")
+        assert resp.status_code == 200
+        [point] = resp.get_json()["points"]
+        assert (point["version"], point["performance"]) == ("2026-10-01", 80.0)
+        assert client.get("/api/champions/103/augments/1001/trend?source=bogus").status_code == 400
+        assert client.get("/api/champions/103/augments/1001/trend?source=blended").status_code == 400
+
     def test_api_unknown_champion_returns_empty_list(self, game_data, patch_i18n_files) -> None:
         client = create_app(game_data).test_client()
         resp = client.get("/api/champions/999/augments?source=opgg")
         assert resp.status_code == 200
         assert resp.get_json() == []
+
+
+def _drop_first_opgg_entry(data_dir) -> None:
+    """改写英雄 103 的 OP.GG 数据（去掉第一个符文），模拟爬虫写入新内容。"""
+    path = data_dir / "opgg" / "aram_augments" / "103.json"
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["data"] = payload["data"][1:]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+class TestResponseCache:
+    def test_etag_and_304(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        resp = client.get("/api/champions/103/augments?source=opgg")
+        etag = resp.headers["ETag"]
+        assert etag.startswith('"') and resp.headers["Cache-Control"] == "no-cache"
+        assert resp.get_json() == build_champion_augments(game_data, "103", "opgg")
+        again = client.get("/api/champions/103/augments?source=opgg", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["ETag"] == etag
+        assert again.headers["Cache-Control"] == "no-cache"
+        assert again.get_data() == b""
+        other = client.get("/api/champions/103/augments?source=aramkit", headers={"If-None-Match": etag})
+        assert other.status_code == 200
+
+    def test_repeat_requests_skip_rebuild(self, game_data, patch_i18n_files, monkeypatch) -> None:
+        import aram_mayhem_helper.web.app as app_module
+
+        calls: list[str] = []
+        original = app_module.build_champion_augments
+
+        def counting(gd, champion_id, source, dataset=None):
+            calls.append(champion_id)
+            return original(gd, champion_id, source, dataset)
+
+        monkeypatch.setattr(app_module, "build_champion_augments", counting)
+        client = create_app(game_data).test_client()
+        bodies = {client.get("/api/champions/103/augments?source=opgg").get_data() for _ in range(3)}
+        assert len(bodies) == 1
+        assert calls == ["103"]
+
+    def test_etag_follows_content_not_reload(self, game_data, patch_i18n_files, fixture_data_dir) -> None:
+        client = create_app(game_data).test_client()
+        url = "/api/champions/103/augments?source=opgg"
+        before = client.get(url).headers["ETag"]
+        game_data.reload()
+        assert client.get(url, headers={"If-None-Match": before}).status_code == 304  # 内容未变
+        _drop_first_opgg_entry(fixture_data_dir)
+        game_data.reload()
+        resp = client.get(url, headers={"If-None-Match": before})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != before
+
+    def test_etag_stable_across_processes(self, game_data, app_config, patch_i18n_files, fixture_data_dir) -> None:
+        """重启/respawn 的 worker 重载代数从头计数：同一内容 ETag 相同，内容变化后 ETag 不同。"""
+        url = "/api/champions/103/augments?source=opgg"
+        first = create_app(game_data).test_client().get(url)
+        assert create_app(GameData(app_config)).test_client().get(url).headers["ETag"] == first.headers["ETag"]
+        _drop_first_opgg_entry(fixture_data_dir)
+        restarted = create_app(GameData(app_config)).test_client()
+        resp = restarted.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        assert resp.status_code == 200
+        assert resp.get_data() != first.get_data()
+        list_url = "/api/champions?source=opgg"
+        other_worker = create_app(GameData(app_config)).test_client()
+        assert restarted.get(list_url).headers["ETag"] == other_worker.get(list_url).headers["ETag"]
+
+    def test_incremental_invalidate_keeps_other_champion_etags(
+        self, game_data, patch_i18n_files, fixture_data_dir
+    ) -> None:
+        client = create_app(game_data).test_client()
+        ahri = client.get("/api/champions/103/augments?source=opgg").headers["ETag"]
+        ashe = client.get("/api/champions/22/augments?source=opgg").headers["ETag"]
+        _drop_first_opgg_entry(fixture_data_dir)
+        game_data.invalidate({("103", "opgg")})
+        assert client.get("/api/champions/22/augments?source=opgg", headers={"If-None-Match": ashe}).status_code == 304
+        assert client.get("/api/champions/103/augments?source=opgg", headers={"If-None-Match": ahri}).status_code == 200
+
+    def test_background_reload_refreshes_derived_state(self, game_data, patch_i18n_files, fixture_data_dir) -> None:
+        client = create_app(game_data).test_client()
+        before = client.get("/api/augments/1001/champions?source=opgg").get_json()
+        assert [c["champion_id"] for c in before["champions"]] == ["103"]
+        data_file = fixture_data_dir / "opgg" / "aram_augments" / "103.json"
+        data_file.write_text(json.dumps({"data": []}), encoding="utf-8")
+        assert game_data.reload_async().result(timeout=10) == 1
+        # 重载回调已在后台刷新倒排索引，请求直接读取新结果
+        after = client.get("/api/augments/1001/champions?source=opgg").get_json()
+        assert after["champions"] == []
+
+    def test_champion_list_tracks_data_files(self, game_data, patch_i18n_files, fixture_data_dir, monkeypatch) -> None:
+        client = create_app(game_data).test_client()
+        before = client.get("/api/champions?source=opgg")
+        (fixture_data_dir / "opgg" / "aram_augments" / "22.json").write_text(
+            json.dumps({"data": [{"id": 1001, "performance": 50.0, "popular": 1.0}]}), encoding="utf-8"
+        )
+
+        scans: list[tuple[Any, ...]] = []
+        counts = game_data.augment_counts
+        monkeypatch.setattr(game_data, "augment_counts", lambda *args: scans.append(args) or counts(*args))
+        assert client.get("/api/champions?source=opgg").status_code == 200
+        assert scans == []  # 缓存命中路径不扫描数据目录（未失效前沿用缓存）
+        game_data.invalidate({("22", "opgg")})  # 数据目录监视器在文件变化后执行的增量失效
+        after = client.get("/api/champions?source=opgg", headers={"If-None-Match": before.headers["ETag"]})
+        assert after.status_code == 200
+        assert after.get_json()[0]["augment_count"] == 1
+
+    def test_lru_eviction_and_failed_build_not_cached(self) -> None:
+        from aram_mayhem_helper.web.cache import ResponseCache
+
+        cache = ResponseCache(maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.get_or_build((key,), lambda key=key: key.encode())
+        assert len(cache) == 2
+        _, _, etag = cache.get_or_build(("other-key",), lambda: b"c")
+        assert etag == cache.get_or_build(("c",), lambda: b"unused")[2]  # ETag 只由内容决定
+
+        def failing_build() -> bytes:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_build(("d",), failing_build)
+        assert len(cache) == 2
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestCompressedResponses:
+    def test_gzip_negotiated_and_cached_once(self, game_data, patch_i18n_files, monkeypatch) -> None:
+        import gzip
+
+        import aram_mayhem_helper.web.cache as cache_module
+
+        calls: list[str] = []
+        original = cache_module.compress
+
+        def counting(body: bytes, encoding: str) -> bytes:
+            calls.append(encoding)
+            return original(body, encoding)
+
+        monkeypatch.setattr(cache_module, "compress", counting)
+        client = create_app(game_data).test_client()
+        url = "/api/champions/103/augments?source=opgg"
+        plain = client.get(url)
+        assert "Content-Encoding" not in plain.headers
+        assert plain.headers["Vary"] == "Accept-Encoding"
+        for _ in range(3):
+            resp = client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+            assert resp.headers["Content-Encoding"] == "gzip"
+            assert gzip.decompress(resp.get_data()) == plain.get_data()
+            assert len(resp.get_data()) < len(plain.get_data())
+        assert calls == ["gzip"]
+        assert resp.headers["ETag"] != plain.headers["ETag"]  # 强 ETag 按表示区分
+
+    def test_304_for_compressed_variant_etag(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        url = "/api/champions/103/augments?source=opgg"
+        etag = client.get(url, headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+        resp = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+
+    def test_small_payload_not_compressed(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        resp = client.get("/api/champions/999/augments?source=opgg", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in resp.headers
+        assert resp.get_json() == []
+
+    def test_unsupported_encoding_falls_back_to_identity(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        resp = client.get("/api/champions/103/augments?source=opgg", headers={"Accept-Encoding": "zstd"})
+        assert "Content-Encoding" not in resp.headers
+        assert len(resp.get_json()) == 6
+
+    def test_brotli_preferred_when_installed(self, game_data, patch_i18n_files) -> None:
+        brotli = pytest.importorskip("brotli")
+        client = create_app(game_data).test_client()
+        resp = client.get("/api/champions/103/augments?source=opgg", headers={"Accept-Encoding": "gzip, br"})
+        assert resp.headers["Content-Encoding"] == "br"
+        assert json.loads(brotli.decompress(resp.get_data())) == build_champion_augments(game_data, "103", "opgg")
+
+    def test_compress_rejects_unknown_encoding(self) -> None:
+        from aram_mayhem_helper.web.cache import compress
+
+        with pytest.raises(ValueError):
+            compress(b"x", "zstd")
+
+
+class TestColumnarFormat:
+    def test_columns_round_trip_to_rows(self, game_data, patch_i18n_files) -> None:
+        rows = build_champion_augments(game_data, "103", "opgg")
+        payload = to_columnar(game_data, "103", rows)
+        assert payload["champion"] == {
+            "champion_id": "103",
+            "champion_name": "Ahri",
+            "champion_name_cn": "九尾妖狐",
+            "champion_alias": "Ahri",
+        }
+        assert payload["count"] == 6
+        rebuilt = [
+            {**payload["champion"], **{col: payload["columns"][col][i] for col in AUGMENT_COLUMNS}}
+            for i in range(payload["count"])
+        ]
+        assert rebuilt == rows
+        assert set(CHAMPION_COLUMNS) | set(AUGMENT_COLUMNS) == RECORD_KEYS
+
+    def test_empty_and_unknown_champion(self, game_data, patch_i18n_files) -> None:
+        assert to_columnar(game_data, "266", [])["champion"]["champion_name"] == "Aatrox"
+        unknown = to_columnar(game_data, "999", [])
+        assert unknown["champion"] is None
+        assert unknown["count"] == 0
+        assert all(values == [] for values in unknown["columns"].values())
+
+    def test_api_columnar_is_smaller(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        rows = client.get("/api/champions/103/augments?source=opgg")
+        columnar = client.get("/api/champions/103/augments?source=opgg&format=columnar")
+        assert columnar.get_json()["columns"]["augment_id"] == [r["augment_id"] for r in rows.get_json()]
+        assert len(columnar.get_data()) < 0.7 * len(rows.get_data())
+        assert columnar.headers["ETag"] != rows.headers["ETag"]
+
+    def test_api_rejects_unknown_format(self, game_data, patch_i18n_files) -> None:
+        resp = create_app(game_data).test_client().get("/api/champions/103/augments?format=xml")
+        assert resp.status_code == 400
+
+
+class TestAugmentQuery:
+    def test_filters_and_total(self, game_data, patch_i18n_files) -> None:
+        table = AugmentTable(build_champion_augments(game_data, "103", "opgg"))
+        rows, matched = table.query(AugmentQuery(levels=frozenset({"2"})))
+        assert matched == len(rows) == 3
+        assert all(r["level"] == "2" for r in rows)
+        rows, matched = table.query(AugmentQuery(search="发明"))
+        assert {r["augment_id"] for r in rows} == {"1002", "1003", "1006"}
+        rows, _ = table.query(AugmentQuery(min_performance=101))
+        assert rows == []
+
+    def test_sort_is_stable_in_both_directions(self, game_data, patch_i18n_files) -> None:
+        source_rows = build_champion_augments(game_data, "103", "opgg")
+        table = AugmentTable(source_rows)
+        rows, _ = table.query(AugmentQuery(sort="level"))
+        assert rows == sorted(source_rows, key=lambda r: r["level"])
+        rows, _ = table.query(AugmentQuery(sort="weighted_sum", descending=True))
+        assert rows == sorted(source_rows, key=lambda r: r["weighted_sum"], reverse=True)
+
+    def test_pagination(self, game_data, patch_i18n_files) -> None:
+        table = AugmentTable(build_champion_augments(game_data, "103", "opgg"))
+        everything, _ = table.query(AugmentQuery(sort="weighted_sum", descending=True))
+        page, matched = table.query(AugmentQuery(sort="weighted_sum", descending=True, offset=2, limit=2))
+        assert matched == 6
+        assert page == everything[2:4]
+
+    def test_rejects_invalid_query(self) -> None:
+        with pytest.raises(ValueError, match="排序列"):
+            AugmentQuery(sort="description")
+        with pytest.raises(ValueError):
+            AugmentQuery(offset=-1)
+
+    def test_api_query_params(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        resp = client.get(
+            "/api/champions/103/augments?source=opgg&format=columnar&level=1&sort=weighted_sum&order=desc&limit=2"
+        )
+        payload = resp.get_json()
+        assert payload["matched"] == 3
+        assert payload["total"] == 6
+        assert payload["count"] == 2
+        assert payload["columns"]["level"] == ["1", "1"]
+        scores = payload["columns"]["weighted_sum"]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_api_default_rows_unchanged(self, game_data, patch_i18n_files) -> None:
+        client = create_app(game_data).test_client()
+        rows = client.get("/api/champions/103/augments?source=opgg").get_json()
+        assert rows == build_champion_augments(game_data, "103", "opgg")
+        searched = client.get("/api/champions/103/augments?source=opgg&q=坚决").get_json()
+        assert [r["augment_id"] for r in searched] == ["1001", "1005"]
+
+    @pytest.mark.parametrize("query", ["sort=description", "order=up", "limit=abc", "offset=-3"])
+    def test_api_rejects_bad_params(self, game_data, patch_i18n_files, query) -> None:
+        resp = create_app(game_data).test_client().get(f"/api/champions/103/augments?{query}")
+        assert resp.status_code == 400
+
+
+class TestServer:
+    def test_warm_up_loads_entries_and_list_responses(self, game_data, patch_i18n_files) -> None:
+        from aram_mayhem_helper.web.server import warm_up
+
+        app = create_app(game_data)
+        loaded = warm_up(app, game_data)
+        file_entries = [key for key in game_data._snapshot.entries if key[1] != "blended"]
+        assert loaded == len(file_entries) > 0
+        assert ("103", "blended", "all") in game_data._snapshot.entries  # 融合源英雄列表同样预热
+        resp = app.test_client().get("/api/champions?source=opgg")
+        assert resp.status_code == 200
+
+    @pytest.mark.parametrize("respawned", [False, True])
+    def test_respawned_worker_reloads_before_serving(
+        self, game_data, patch_i18n_files, fixture_data_dir, monkeypatch, respawned
+    ) -> None:
+        import aram_mayhem_helper.web.server as server_module
+
+        app = create_app(game_data)
+        server_module.warm_up(app, game_data)
+        (fixture_data_dir / "opgg" / "aram_augments" / "103.json").write_text(
+            json.dumps({"data": []}), encoding="utf-8"
+        )  # 父进程预热之后、工作进程重新拉起之前写入的新数据
+        served: list[int] = []
+        monkeypatch.setattr(
+            server_module,
+            "_serve_socket",
+            lambda app, sock, threads, watcher: served.append(len(game_data.augment_entries("103", "opgg") or [])),
+        )
+        server_module._run_worker(app, game_data, None, 1, None, respawned=respawned)
+        assert len(served) == 1
+        assert (served[0] == 0) is respawned  # 首批进程继承预热内存，重新拉起的进程读取磁盘最新数据
+
+    @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"threads": 0}])
+    def test_serve_rejects_non_positive_sizes(self, game_data, kwargs) -> None:
+        from aram_mayhem_helper.web.server import serve
+
+        with pytest.raises(ValueError, match="正整数"):
+            serve("127.0.0.1", 0, game_data=game_data, **kwargs)